@@ -0,0 +1,258 @@
+"""
+    Finder benchmarks over synthetic dictionaries.
+
+    PYTHONPATH=src python -m benchmarks.bench_finders --sizes 1000 100000 --lengths 5 8 \
+        --output bench.json --baseline benchmarks/baseline.json
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+
+from wordly_solver.core.game.entities import WordlyWord
+from wordly_solver.core.game.feedback import get_wordly_word
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder, WordlySearchDTO
+from wordly_solver.core.game.usecases.get_suitable_word import GetSuitableWord
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.finder_factory import FinderEngine, create_wordly_finder
+
+from benchmarks.synthetic import generate_words
+
+type Results = Dict[str, float]
+
+PERCENTILES = (50, 90, 99)
+GATED_PERCENTILES = (50,)  # tail latencies are too noisy to fail a run on
+HISTORY_LENS = (1, 2, 4, 8, 16, 32)
+
+
+def get_percentile(sorted_values: Sequence[float], percentile: int) -> float:
+    """
+        Nearest-rank percentile
+    """
+    rank = max(1, -(-percentile * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+
+def get_history(rnd: random.Random, words: List[str], history_len: int) -> List[WordlyWord]:
+    answer = rnd.choice(words)
+    return [get_wordly_word(rnd.choice(words), answer) for _ in range(history_len)]
+
+
+def get_best_time(call: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def measure_build(
+        engine: FinderEngine,
+        init_words: Dict[Tuple[Language, int], Set[str]],
+        repeats: int,
+) -> Results:
+    gc.collect()
+    build_seconds = get_best_time(lambda: create_wordly_finder(engine, init_words), repeats)
+
+    # tracemalloc slows allocations down, so memory is taken in a separate build
+    gc.collect()
+    tracemalloc.start()
+    finder = create_wordly_finder(engine, init_words)
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del finder
+
+    return {"build_seconds": build_seconds, "memory_bytes": float(memory)}
+
+
+def measure_search(
+        finder: WordlyFinder,
+        language: Language,
+        words: List[str],
+        queries: int,
+        repeats: int,
+        rnd: random.Random,
+) -> Results:
+    """
+        wordly_search latency by constraint density, density is the number of guesses behind the query
+    """
+    parser = GetSuitableWord(wordly_solver=finder, id_provider=None, words_gateway=None)  # type: ignore
+    wordly_len = len(words[0])
+    random.seed(0)  # finders draw from the module generator, keep their walks repeatable
+
+    results: Results = {}
+    for guesses in (1, 2, 3, 5):
+        dtos: List[WordlySearchDTO] = [
+            parser._parse_to_wordly_search_dto(get_history(rnd, words, guesses), wordly_len)
+            for _ in range(queries)
+        ]
+
+        latencies = sorted(
+            get_best_time(lambda: finder.wordly_search(dto, language=language), repeats) for dto in dtos
+        )
+        for percentile in PERCENTILES:
+            results[f"search_guesses{guesses}_p{percentile}_seconds"] = get_percentile(latencies, percentile)
+
+    return results
+
+
+def measure_parse(words: List[str], queries: int, repeats: int, rnd: random.Random) -> Results:
+    """
+        _parse_to_wordly_search_dto cost by history length, does not depend on the engine
+    """
+    parser = GetSuitableWord(wordly_solver=None, id_provider=None, words_gateway=None)  # type: ignore
+    wordly_len = len(words[0])
+
+    results: Results = {}
+    for history_len in HISTORY_LENS:
+        histories = [get_history(rnd, words, history_len) for _ in range(queries)]
+
+        seconds = get_best_time(
+            lambda: [parser._parse_to_wordly_search_dto(history, wordly_len) for history in histories],
+            repeats,
+        )
+        results[f"parse_history{history_len}_seconds"] = seconds / queries
+
+    return results
+
+
+def run(
+        engines: Sequence[FinderEngine],
+        languages: Sequence[Language],
+        sizes: Sequence[int],
+        lengths: Sequence[int],
+        queries: int,
+        repeats: int,
+        log: Callable[[str], None] = print,
+) -> Results:
+    """
+        Flat metric name -> value, every metric is lower-is-better
+    """
+    results: Results = {}
+    for language in languages:
+        for wordly_len in lengths:
+            for size in sizes:
+                words_set = generate_words(language, wordly_len, size)
+                words = sorted(words_set)
+                init_words = {(language, wordly_len): words_set}
+                prefix = f"{language.name.lower()}/len{wordly_len}/size{size}"
+                log(f"{prefix}: {len(words)} words")
+
+                for name, value in measure_parse(words, queries, repeats, random.Random(0)).items():
+                    results[f"parse/{prefix}/{name}"] = value
+
+                for engine in engines:
+                    metrics = measure_build(engine, init_words, repeats)
+                    finder = create_wordly_finder(engine, init_words)
+                    metrics |= measure_search(finder, language, words, queries, repeats, random.Random(0))
+                    del finder
+
+                    for name, value in metrics.items():
+                        results[f"{engine.value}/{prefix}/{name}"] = value
+                    log(
+                        f"  {engine.value}: build {metrics['build_seconds']:.3f}s, "
+                        f"{metrics['memory_bytes'] / 2 ** 20:.1f} MiB, "
+                        f"search p50 {metrics['search_guesses2_p50_seconds'] * 1e6:.0f}us"
+                    )
+
+    return results
+
+
+def is_gated(name: str) -> bool:
+    if "_p" not in name:
+        return True
+
+    return any(f"_p{percentile}_" in name for percentile in GATED_PERCENTILES)
+
+
+def compare(current: Results, baseline: Results, threshold: float, min_delta: float) -> List[str]:
+    """
+        Gated metrics slower/bigger than baseline by more than threshold (0.2 = 20%).
+        Timings closer than min_delta seconds are treated as noise
+    """
+    regressions = []
+    for name, value in sorted(current.items()):
+        base = baseline.get(name)
+        if not base or not is_gated(name):
+            continue
+
+        if name.endswith("_seconds") and value - base < min_delta:
+            continue
+
+        ratio = value / base
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {base:.6g} -> {value:.6g} (x{ratio:.2f})")
+
+    return regressions
+
+
+def get_available_engines() -> List[FinderEngine]:
+    engines = [FinderEngine.TREE, FinderEngine.BITSET]
+    try:
+        import numpy  # noqa: F401
+        engines.append(FinderEngine.MATRIX)
+    except ImportError:
+        pass
+
+    return engines
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--engines", nargs="+", choices=[engine.value for engine in FinderEngine])
+    parser.add_argument("--languages", nargs="+", choices=[lang.name for lang in Language],
+                        default=[lang.name for lang in Language])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1_000, 10_000, 100_000],
+                        help="dictionary sizes, up to 1000000")
+    parser.add_argument("--lengths", nargs="+", type=int, default=[5], help="word lengths, 4-12")
+    parser.add_argument("--queries", type=int, default=200, help="queries per constraint density")
+    parser.add_argument("--repeats", type=int, default=5, help="every timing is the best of repeats")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON written by an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown against baseline")
+    parser.add_argument("--min-delta", type=float, default=50e-6, help="ignored timing difference, seconds")
+    args = parser.parse_args(argv)
+
+    engines = [FinderEngine(engine) for engine in args.engines] if args.engines else get_available_engines()
+    results = run(
+        engines=engines,
+        languages=[Language[name] for name in args.languages],
+        sizes=args.sizes,
+        lengths=args.lengths,
+        queries=args.queries,
+        repeats=args.repeats,
+    )
+
+    if args.output:
+        args.output.write_text(json.dumps(
+            {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "results": results,
+            },
+            indent=2,
+            sort_keys=True,
+        ))
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text())["results"], args.threshold, args.min_delta)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+    Explicit-stack tree search against the recursive generator it replaced.
+
+    PYTHONPATH=src python -m benchmarks.bench_traversal --lengths 4 5 8 12 15 --size 20000
+"""
+import argparse
+import random
+import sys
+from typing import Dict, Iterator, List, Sequence
+
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO
+from wordly_solver.core.game.usecases.get_suitable_word import GetSuitableWord
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.search_stats import SearchStatsCollector
+from wordly_solver.data.adapters.wordly_tree import AllWordsTree, LetterNode
+
+from benchmarks.bench_finders import get_best_time, get_history
+from benchmarks.synthetic import generate_words
+
+
+def recursive_search(tree: AllWordsTree, dto: WordlySearchDTO, language: Language) -> Iterator[str]:
+    """
+        Recursive search as it was before the explicit stack, kept only as a baseline
+    """
+    required = dto.get_required_counts()
+    path: List[str] = []
+    counts: Dict[str, int] = {}
+
+    def dfs(node: LetterNode, missing: int) -> Iterator[str]:
+        if not node.children and node.letter_high > 0:
+            if missing == 0:
+                yield "".join(path)
+
+        if letter := dto.positions_letter.get(node.letter_high):
+            child = node.children.get(letter)
+            if child is None:
+                return
+            valid_children = [child]
+        else:
+            valid_children = [
+                child for child in node.children.values() if child.letter not in dto.exclude_letters
+            ]
+            if excluded := dto.exclude_positions.get(node.letter_high):
+                valid_children = [child for child in valid_children if child.letter not in excluded]
+
+        if dto.max_count:
+            valid_children = [
+                child
+                for child in valid_children
+                if counts.get(child.letter, 0) < dto.max_count.get(child.letter, dto.wordly_len)
+            ]
+
+        remaining = dto.wordly_len - node.letter_high - 1
+        for child in valid_children:
+            child_missing = missing - (counts.get(child.letter, 0) < required.get(child.letter, 0))
+            if child_missing > remaining:
+                continue
+
+            path.append(child.letter)
+            counts[child.letter] = counts.get(child.letter, 0) + 1
+            yield from dfs(child, child_missing)
+            counts[child.letter] -= 1
+            path.pop()
+
+    return dfs(tree._get_root_by_lang(language, dto.wordly_len), sum(required.values()))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", nargs="+", type=int, default=[4, 5, 8, 12, 15])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    language = Language.ENG
+    suitable = GetSuitableWord(wordly_solver=None, id_provider=None, words_gateway=None)  # type: ignore
+
+    print(f"{'len':>4} {'nodes/query':>12} {'recursive ns/node':>18} {'stack ns/node':>14} {'speedup':>8}")
+    for wordly_len in args.lengths:
+        words = generate_words(language, wordly_len, args.size)
+        collector = SearchStatsCollector()
+        tree = AllWordsTree({(language, wordly_len): words}, listener=collector)
+        plain_tree = AllWordsTree({(language, wordly_len): words})
+
+        rnd = random.Random(wordly_len)
+        sorted_words = sorted(words)
+        dtos = [
+            suitable._parse_to_wordly_search_dto(get_history(rnd, sorted_words, rnd.randint(1, 3)), wordly_len)
+            for _ in range(args.queries)
+        ]
+
+        for dto in dtos:
+            assert sorted(recursive_search(plain_tree, dto, language)) == plain_tree.get_candidates(dto, language)
+            tree.get_candidates(dto, language)
+        nodes = collector.snapshot()["get_candidates"][1].nodes_entered
+
+        # interleaved, so a noisy neighbour slows both sides alike
+        recursive = iterative = float("inf")
+        for _ in range(args.repeats):
+            recursive = min(recursive, get_best_time(
+                lambda: [list(recursive_search(plain_tree, dto, language)) for dto in dtos], 1
+            ))
+            iterative = min(iterative, get_best_time(
+                lambda: [list(plain_tree.iter_candidates(dto, language)) for dto in dtos], 1
+            ))
+        print(
+            f"{wordly_len:>4} {nodes // len(dtos):>12} {recursive / nodes * 1e9:>18.0f} "
+            f"{iterative / nodes * 1e9:>14.0f} {recursive / iterative:>7.2f}x"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+    Plays full games of a guess strategy against every answer of a dictionary.
+
+    PYTHONPATH=src python -m benchmarks.simulate_games --words util/correct5words.csv --engine bitset \
+        --strategy suitable --workers 8 --output games.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Sequence, Set, Tuple
+
+from wordly_solver.core.game.entities import WordlyWord
+from wordly_solver.core.game.feedback import get_wordly_word
+from wordly_solver.core.game.usecases.get_exclude_word import GetExcludeWord, GetExcludeWordDTO
+from wordly_solver.core.game.usecases.get_suitable_word import GetSuitableWord, GetSuitableWordDTO
+from wordly_solver.core.user.entities import User
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.finder_factory import FinderEngine, create_wordly_finder
+from wordly_solver.data.adapters.first_words import FirstWordsGateway, get_first_word
+from wordly_solver.data.adapters.memory_session_store import MemoryGameSessionStore
+from wordly_solver.data.adapters.static_id_provider import StaticIdProvider
+from wordly_solver.data.adapters.words_ingest import load_words
+
+from benchmarks.synthetic import generate_words
+
+type Strategy = Callable[[List[WordlyWord]], Awaitable[str | None]]  # history -> next guess
+
+
+def build_strategy(name: str, engine: FinderEngine, language: Language, words: Set[str], first_word: str) -> Strategy:
+    wordly_len = len(first_word)
+    init_words = {(language, wordly_len): words}
+    # one user plays every game of a worker, a stored session is reused only
+    # while its history is a prefix of the current game (GameSession.continues)
+    user = StaticIdProvider(User(language=language, id=1))
+    gateway = FirstWordsGateway({language: first_word})
+
+    if name in ("suitable", "suitable-session", "ranked", "ranked-session"):
+        suitable = GetSuitableWord(
+            wordly_solver=create_wordly_finder(engine, init_words),
+            id_provider=user,
+            words_gateway=gateway,
+            session_store=MemoryGameSessionStore(max_sessions=1) if name.endswith("-session") else None,
+            ranked=name.startswith("ranked"),
+        )
+        return lambda history: suitable.execute(GetSuitableWordDTO(current_words=history, word_len=wordly_len))
+
+    if name == "exclude-suitable":
+        # second guess drops as many unused letters as possible, then play for the answer
+        finder = create_wordly_finder(engine, init_words)
+        exclude = GetExcludeWord(id_provider=user, words_gateway=gateway, wordly_finder=finder)
+        suitable = GetSuitableWord(wordly_solver=finder, id_provider=user, words_gateway=gateway)
+
+        async def exclude_suitable(history: List[WordlyWord]) -> str | None:
+            if len(history) == 1:
+                return await exclude.execute(GetExcludeWordDTO(current_words=history, word_len=wordly_len))
+            return await suitable.execute(GetSuitableWordDTO(current_words=history, word_len=wordly_len))
+
+        return exclude_suitable
+
+    if name == "informative":
+        from wordly_solver.core.game.usecases.get_informative_word import GetInformativeWord, GetInformativeWordDTO
+        from wordly_solver.data.adapters.pattern_matrix import PatternMatrixFinder
+
+        informative = GetInformativeWord(
+            entropy_finder=PatternMatrixFinder(init_words), id_provider=user, words_gateway=gateway
+        )
+        return lambda history: informative.execute(
+            GetInformativeWordDTO(current_words=history, word_len=wordly_len)
+        )
+
+    raise ValueError(f"Unknown strategy: {name}")
+
+
+STRATEGIES = ("suitable", "suitable-session", "ranked", "ranked-session", "exclude-suitable", "informative")
+
+
+async def play_game(strategy: Strategy, answer: str, max_guesses: int) -> int | None:
+    """
+        Guesses it took, None when the strategy gave up or ran out of guesses
+    """
+    history: List[WordlyWord] = []
+    while len(history) < max_guesses:
+        guess = await strategy(history)
+        if guess is None:
+            return None
+
+        history.append(get_wordly_word(guess, answer))
+        if guess == answer:
+            return len(history)
+
+    return None
+
+
+_worker_strategy: Strategy | None = None
+
+
+def _init_worker(name: str, engine: FinderEngine, language: Language, words: Set[str], first_word: str) -> None:
+    global _worker_strategy
+    _worker_strategy = build_strategy(name, engine, language, words, first_word)
+
+
+def _play_chunk(
+        first_game: int,
+        answers: List[str],
+        max_guesses: int,
+        seed: int,
+) -> Tuple[List[int | None], float]:
+    strategy = _worker_strategy
+    assert strategy is not None
+
+    async def play() -> List[int | None]:
+        results = []
+        for game, answer in enumerate(answers, start=first_game):
+            random.seed(seed + game)  # same games whatever the number of workers
+            results.append(await play_game(strategy, answer, max_guesses))
+        return results
+
+    start = time.perf_counter()
+    results = asyncio.run(play())
+    return results, time.perf_counter() - start
+
+
+@dataclass
+class SimulationReport:
+    strategy: str
+    engine: str
+    games: int
+    failures: int
+    guesses: Dict[int, int] = field(default_factory=dict)  # guesses -> solved games
+    mean_guesses: float = 0
+    seconds: float = 0  # wall time including worker start and index builds
+    play_seconds: float = 0  # time inside games summed over workers
+    games_per_second: float = 0  # by wall time
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.games if self.games else 0
+
+
+def simulate(
+        strategy: str,
+        engine: FinderEngine,
+        language: Language,
+        words: Set[str],
+        answers: Sequence[str],
+        first_word: str,
+        max_guesses: int = 6,
+        workers: int = 1,
+        seed: int = 0,
+) -> SimulationReport:
+    chunk_size = max(1, len(answers) // (workers * 8))
+    chunks = [(start, list(answers[start:start + chunk_size])) for start in range(0, len(answers), chunk_size)]
+    init_args = (strategy, engine, language, words, first_word)
+
+    start_time = time.perf_counter()
+    if workers == 1:
+        _init_worker(*init_args)
+        chunk_results = [_play_chunk(first, chunk, max_guesses, seed) for first, chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as executor:
+            futures = [executor.submit(_play_chunk, first, chunk, max_guesses, seed) for first, chunk in chunks]
+            chunk_results = [future.result() for future in futures]
+    seconds = time.perf_counter() - start_time
+
+    results = [result for chunk, _ in chunk_results for result in chunk]
+    solved = [result for result in results if result is not None]
+    return SimulationReport(
+        strategy=strategy,
+        engine=engine.value,
+        games=len(results),
+        failures=len(results) - len(solved),
+        guesses=dict(sorted(Counter(solved).items())),
+        mean_guesses=sum(solved) / len(solved) if solved else 0,
+        seconds=seconds,
+        play_seconds=sum(chunk_seconds for _, chunk_seconds in chunk_results),
+        games_per_second=len(results) / seconds if seconds else 0,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=Path, help="one word per line, synthetic words without it")
+    parser.add_argument("--synthetic-size", type=int, default=2_000)
+    parser.add_argument("--language", choices=[lang.name for lang in Language], default=Language.ENG.name)
+    parser.add_argument("--length", type=int, default=5)
+    parser.add_argument("--strategy", choices=STRATEGIES, default="suitable")
+    parser.add_argument("--engine", choices=[engine.value for engine in FinderEngine], default="bitset")
+    parser.add_argument("--first-word", help="most frequent distinct letters by default")
+    parser.add_argument("--answers", type=int, help="play only a random sample of answers")
+    parser.add_argument("--max-guesses", type=int, default=6)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    language = Language[args.language]
+    if args.words:
+        init_words = load_words([args.words], languages=[language], lengths=[args.length])
+        words = init_words.get((language, args.length), set())
+    else:
+        words = generate_words(language, args.length, args.synthetic_size, seed=args.seed)
+
+    answers = sorted(words)
+    if args.answers:
+        answers = random.Random(args.seed).sample(answers, min(args.answers, len(answers)))
+
+    report = simulate(
+        strategy=args.strategy,
+        engine=FinderEngine(args.engine),
+        language=language,
+        words=words,
+        answers=answers,
+        first_word=args.first_word or get_first_word(answers),
+        max_guesses=args.max_guesses,
+        workers=args.workers,
+        seed=args.seed,
+    )
+
+    print(
+        f"{report.strategy}/{report.engine}: {report.games} games in {report.seconds:.2f}s "
+        f"({report.games_per_second:.1f} games/s, {report.play_seconds:.2f}s in games), failure rate {report.failure_rate:.2%}, "
+        f"mean guesses {report.mean_guesses:.3f}"
+    )
+    for guesses, count in report.guesses.items():
+        print(f"  {guesses}: {count}")
+
+    if args.output:
+        args.output.write_text(json.dumps(asdict(report) | {"failure_rate": report.failure_rate}, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+import random
+from typing import Dict, Set
+
+from wordly_solver.core.words.constants import Language
+
+# letters in rough order of frequency, synthetic words follow a Zipf-like letter distribution
+LETTERS_BY_FREQUENCY: Dict[Language, str] = {
+    Language.ENG: "etaoinshrdlcumwfgypbvkjxqz",
+    Language.RU: "оеаинтсрвлкмдпуяыьгзбчйхжшюцщэфъё",
+}
+
+
+def get_capacity(language: Language, wordly_len: int) -> int:
+    return len(LETTERS_BY_FREQUENCY[language]) ** wordly_len
+
+
+def generate_words(language: Language, wordly_len: int, size: int, seed: int = 0) -> Set[str]:
+    """
+        size unique words, fewer when the alphabet cannot give that many of this length
+    """
+    alphabet = LETTERS_BY_FREQUENCY[language]
+    weights = [1 / (rank + 1) for rank in range(len(alphabet))]
+    size = min(size, get_capacity(language, wordly_len) // 2)
+
+    rnd = random.Random(f"{language.name}-{wordly_len}-{seed}")
+    words: Set[str] = set()
+    while len(words) < size:
+        batch = rnd.choices(alphabet, weights=weights, k=wordly_len * (size - len(words)))
+        words.update(
+            "".join(batch[start:start + wordly_len]) for start in range(0, len(batch), wordly_len)
+        )
+
+    return words
@@ -0,0 +1,51 @@
+from typing import Dict, List
+
+from wordly_solver.core.game.entities import WordlyLetter, WordlyLetterState, WordlyWord
+
+# base-3 digit of a letter state in a feedback pattern code
+STATE_DIGITS: Dict[WordlyLetterState, int] = {
+    WordlyLetterState.incorrect: 0,
+    WordlyLetterState.wrong_place: 1,
+    WordlyLetterState.correct: 2,
+}
+
+
+def get_feedback(guess: str, answer: str) -> List[WordlyLetterState]:
+    """
+        Wordle rules: a repeated guess letter is marked wrong_place only
+        while the answer still has unmatched copies of it
+    """
+    states = [WordlyLetterState.incorrect] * len(guess)
+    unmatched: Dict[str, int] = {}
+
+    for idx, (guess_letter, answer_letter) in enumerate(zip(guess, answer)):
+        if guess_letter == answer_letter:
+            states[idx] = WordlyLetterState.correct
+        else:
+            unmatched[answer_letter] = unmatched.get(answer_letter, 0) + 1
+
+    for idx, guess_letter in enumerate(guess):
+        if states[idx] != WordlyLetterState.correct and unmatched.get(guess_letter, 0) > 0:
+            states[idx] = WordlyLetterState.wrong_place
+            unmatched[guess_letter] -= 1
+
+    return states
+
+
+def get_wordly_word(guess: str, answer: str) -> WordlyWord:
+    return {
+        idx: WordlyLetter(value=letter, state=state)
+        for idx, (letter, state) in enumerate(zip(guess, get_feedback(guess, answer)))
+    }
+
+
+def encode_feedback(states: List[WordlyLetterState]) -> int:
+    """
+        Position idx is the idx-th base-3 digit, so a word of len L has 3 ** L codes
+    """
+    return sum(STATE_DIGITS[state] * 3 ** idx for idx, state in enumerate(states))
+
+
+def encode_wordly_word(wordly_word: WordlyWord) -> tuple[str, int]:
+    guess = "".join(wordly_word[idx].value for idx in sorted(wordly_word))
+    return guess, encode_feedback([wordly_word[idx].state for idx in sorted(wordly_word)])
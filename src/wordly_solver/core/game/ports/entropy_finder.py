@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+from wordly_solver.core.words.constants import Language
+
+type FeedbackHistory = List[Tuple[str, int]]  # guess, feedback pattern code
+
+
+class EntropyFinder(ABC):
+    @abstractmethod
+    def get_informative_word(
+            self,
+            history: FeedbackHistory,
+            language: Language,
+            wordly_len: int
+    ) -> str | None:
+        """
+            Get a word that maximizes expected information over the words still consistent with history
+        """
+        pass
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Hashable, List
+
+from wordly_solver.core.words.constants import Language
+
+
+class GameEventKind(Enum):
+    suggestion = "suggestion"  # a word was suggested, word is None when nothing fits
+    guess = "guess"  # the player reported a played word
+    outcome = "outcome"  # the game is over
+
+
+@dataclass(slots=True)
+class GameEvent:
+    kind: GameEventKind
+    user_id: int | None  # None for anonymous users
+    language: Language
+    word_len: int
+    guesses: int  # guesses played so far
+    word: str | None = None
+    won: bool | None = None  # outcome only
+    at: float = 0  # unix time
+    game: Hashable | None = None  # outcome only, outcomes of one game have equal keys
+
+
+@dataclass
+class GameRollup:
+    """
+        Totals of finished games of one language and word length
+    """
+    language: Language
+    word_len: int
+    games: int = 0
+    wins: int = 0
+    suggestions: int = 0
+    won_in: Dict[int, int] = field(default_factory=dict)  # guesses -> won games
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def average_guesses(self) -> float:
+        """
+            Guesses per won game
+        """
+        return sum(guesses * games for guesses, games in self.won_in.items()) / self.wins if self.wins else 0.0
+
+
+class GameStats(ABC):
+
+    @abstractmethod
+    def record(self, event: GameEvent) -> None:
+        """
+            Called inside use cases, must not block: no I/O, no waiting for locks held by I/O.
+            An outcome of a game whose outcome was already recorded is skipped
+        """
+        pass
+
+    @abstractmethod
+    async def get_rollups(self) -> List[GameRollup]:
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from wordly_solver.core.game.session import GameHistory
+
+
+class GameHistoryStore(ABC):
+    @abstractmethod
+    async def get(self, chat_id: int) -> GameHistory | None:
+        pass
+
+    @abstractmethod
+    async def save(self, chat_id: int, history: GameHistory) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, chat_id: int) -> None:
+        pass
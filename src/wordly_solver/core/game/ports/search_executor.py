@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+
+
+class SearchExecutor(ABC):
+    """
+        Runs CPU-bound finder calls away from the event loop
+    """
+
+    @abstractmethod
+    async def run[T](self, call: Callable[[WordlyFinder], T]) -> T:
+        """
+            call gets the executor's finder, for process pools it must be picklable (operator.methodcaller).
+            Raises SearchBusyError when the queue is full
+        """
+        pass
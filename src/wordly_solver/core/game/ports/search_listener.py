@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO
+from wordly_solver.core.words.constants import Language
+
+
+@dataclass(slots=True)
+class SearchStats:
+    """
+        Counters of one finder call. The tree fills all of them, the bitset and matrix finders
+        have no nodes to count and fill only candidates and elapsed
+    """
+    candidates: int = 0  # words the call returned, yielded before close or counted
+    nodes_entered: int = 0
+    pruned_by_exclude_letters: int = 0  # children cut before they were entered
+    pruned_by_exclude_positions: int = 0
+    pruned_by_max_count: int = 0
+    pruned_by_min_count: int = 0  # required letters no longer fit into the positions left
+    leaves_checked: int = 0  # leaves reached, all of them words: children are checked before they are entered
+    elapsed: float = 0  # seconds spent inside the finder
+
+    def __iadd__(self, other: "SearchStats") -> "SearchStats":
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+
+class SearchListener(ABC):
+    """
+        Receives stats of every finder call when passed to a finder, finders without one count nothing
+    """
+
+    @abstractmethod
+    def on_search(
+            self,
+            method: str,  # finder method name
+            dto: WordlySearchDTO,
+            language: Language,
+            stats: SearchStats,
+    ) -> None:
+        """
+            Called in the searching thread after the call finished or its iterator was closed
+        """
+        pass
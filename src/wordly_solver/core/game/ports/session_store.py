@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from wordly_solver.core.game.session import GameSession
+
+
+class GameSessionStore(ABC):
+    @abstractmethod
+    async def get(self, user_id: int, word_len: int) -> GameSession | None:
+        pass
+
+    @abstractmethod
+    async def save(self, user_id: int, session: GameSession) -> None:
+        pass
@@ -1,7 +1,9 @@
+import random
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Set
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterator, List, Sequence, Set, Tuple
 
+from wordly_solver.core.game.ranking import LetterFrequencies, rank_words
 from wordly_solver.core.words.constants import Language
 
 
@@ -15,12 +17,157 @@ class WordlySearchDTO:
 
     wordly_len: int = 5  # how much letters in word
 
+    min_count: Dict[str, int] = field(default_factory=dict)  # letter must occur at least this many times
+
+    def canonical_key(self) -> Hashable:
+        """
+            Equal for DTOs describing the same constraints
+        """
+        return (
+            self.wordly_len,
+            frozenset(self.exclude_letters),
+            tuple(sorted(self.positions_letter.items())),
+            tuple(sorted(
+                (idx, frozenset(letters)) for idx, letters in self.exclude_positions.items() if letters
+            )),
+            tuple(sorted(self.max_count.items())),
+            tuple(sorted((letter, count) for letter, count in self.min_count.items() if count > 0)),
+        )
+
+    def matches(self, word: str) -> bool:
+        """
+            Same rules as finders use: exclude_letters and exclude_positions
+            apply only to positions without a known letter
+        """
+        for idx, letter in enumerate(word):
+            if known := self.positions_letter.get(idx):
+                if letter != known:
+                    return False
+            elif letter in self.exclude_letters or letter in self.exclude_positions.get(idx, ()):
+                return False
+
+        return all(
+            letter in word for letters in self.exclude_positions.values() for letter in letters
+        ) and all(
+            word.count(letter) <= count for letter, count in self.max_count.items()
+        ) and all(
+            word.count(letter) >= count for letter, count in self.min_count.items()
+        )
+
+    def get_required_counts(self) -> Dict[str, int]:
+        """
+            Letters the word must contain with their min counts, exclude_positions letters at least once
+        """
+        required = {letter: count for letter, count in self.min_count.items() if count > 0}
+        for letters in self.exclude_positions.values():
+            for letter in letters:
+                required.setdefault(letter, 1)
+
+        return required
+
+
+PATTERN_WILDCARD = "?"
+
+
+@dataclass
+class PatternQueryDTO:
+    """
+        Crossword-style query: mask like "a?b??" where PATTERN_WILDCARD is any letter.
+        must_not_contain applies only to wildcard positions, as exclude_letters does
+    """
+    mask: str
+    must_contain: Set[str] = field(default_factory=set)  # anywhere in the word, fixed letters count
+    must_not_contain: Set[str] = field(default_factory=set)
+
+    @property
+    def wordly_len(self) -> int:
+        return len(self.mask)
+
+    def get_positions_letter(self) -> Dict[int, str]:
+        return {idx: letter for idx, letter in enumerate(self.mask) if letter != PATTERN_WILDCARD}
+
+    def to_search_dto(self) -> WordlySearchDTO:
+        return WordlySearchDTO(
+            exclude_letters=set(self.must_not_contain),
+            positions_letter=self.get_positions_letter(),
+            exclude_positions={},
+            max_count={},
+            wordly_len=self.wordly_len,
+            min_count={letter: 1 for letter in self.must_contain},
+        )
+
+    def matches(self, word: str) -> bool:
+        return len(word) == len(self.mask) and all(
+            letter == known if known != PATTERN_WILDCARD else letter not in self.must_not_contain
+            for letter, known in zip(word, self.mask)
+        ) and all(letter in word for letter in self.must_contain)
+
 
 class WordlyFinder(ABC):
     @abstractmethod
     def wordly_search(self, dto: WordlySearchDTO, language: Language) -> str | None:
         pass
 
+    @abstractmethod
+    def get_candidates(self, dto: WordlySearchDTO, language: Language) -> List[str]:
+        """
+            Get all suitable words, sorted
+        """
+        pass
+
+    def iter_candidates(self, dto: WordlySearchDTO, language: Language) -> Iterator[str]:
+        """
+            Suitable words one by one in the finder's own order, for pagination use itertools.islice
+        """
+        return iter(self.get_candidates(dto, language))
+
+    def count_candidates(self, dto: WordlySearchDTO, language: Language) -> int:
+        return len(self.get_candidates(dto, language))
+
+    def get_top_candidates(self, dto: WordlySearchDTO, language: Language, k: int) -> List[str]:
+        """
+            Top k suitable words by how well they split the suitable words, see LetterFrequencies.get_split_score
+        """
+        return self.rank_words(self.get_candidates(dto, language), language, dto.wordly_len, k)
+
+    def rank_words(self, words: Sequence[str], language: Language, wordly_len: int, k: int) -> List[str]:
+        """
+            Top k of words by how well they split the words themselves, as core.game.ranking.rank_words.
+            words are words of this finder, e.g. candidates kept by a session
+        """
+        return rank_words(words, k, LetterFrequencies.from_words(words, wordly_len))
+
+    def find_by_pattern(self, query: PatternQueryDTO, language: Language) -> List[str]:
+        """
+            All words matching the query, sorted
+        """
+        return self.get_candidates(query.to_search_dto(), language)
+
+    def wordly_search_many(
+            self,
+            queries: Sequence[Tuple[WordlySearchDTO, Language]]
+    ) -> List[str | None]:
+        """
+            Results in order of queries. Equal constraints are searched once,
+            every repeat gets its own random pick from the candidates
+        """
+        groups: Dict[Hashable, List[int]] = {}
+        for number, (dto, language) in enumerate(queries):
+            groups.setdefault((language, dto.canonical_key()), []).append(number)
+
+        results: List[str | None] = [None] * len(queries)
+        for numbers in groups.values():
+            dto, language = queries[numbers[0]]
+            if len(numbers) == 1:
+                results[numbers[0]] = self.wordly_search(dto, language)
+                continue
+
+            candidates = self.get_candidates(dto, language)
+            for number in numbers:
+                results[number] = random.choice(candidates) if candidates else None
+
+        return results
+
     @abstractmethod
     def get_exclude_word(
             self,
@@ -32,3 +179,48 @@ class WordlyFinder(ABC):
             Get a word that excludes as many letters as possible
         """
         pass
+
+    def get_dictionary_frequencies(self, language: Language, wordly_len: int) -> LetterFrequencies:
+        """
+            Frequencies over every word of the dictionary. Counted on every call here,
+            finders that rank exclude words in Python keep them
+        """
+        everything = WordlySearchDTO(
+            exclude_letters=set(), positions_letter={}, exclude_positions={}, max_count={}, wordly_len=wordly_len
+        )
+        return LetterFrequencies.from_words(self.iter_candidates(everything, language), wordly_len)
+
+    def get_fewest_hits_words(self, forbidden_letters: set[str], language: Language, wordly_len: int) -> List[str]:
+        """
+            All words with the fewest forbidden letters, sorted
+        """
+        words = self.get_candidates(
+            WordlySearchDTO(exclude_letters=set(), positions_letter={}, exclude_positions={}, max_count={},
+                            wordly_len=wordly_len),
+            language
+        )
+        if not words:
+            return []
+
+        hits = [sum(letter in forbidden_letters for letter in word) for word in words]
+        fewest = min(hits)
+        return [word for word, word_hits in zip(words, hits) if word_hits == fewest]
+
+    def get_top_exclude_words(
+            self,
+            forbidden_letters: set[str],
+            language: Language,
+            wordly_len: int,
+            k: int
+    ) -> List[str]:
+        """
+            Top k of the words with the fewest forbidden letters
+            by how well their other letters split the whole dictionary
+        """
+        words = self.get_fewest_hits_words(forbidden_letters, language, wordly_len)
+        if not words:
+            return []
+
+        return rank_words(
+            words, k, self.get_dictionary_frequencies(language, wordly_len), ignore=forbidden_letters
+        )
@@ -0,0 +1,62 @@
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import AbstractSet, Iterable, List
+
+
+@dataclass
+class LetterFrequencies:
+    """
+        Over a set of words: how many words contain a letter and how many have it at each position
+    """
+    word_len: int
+    total: int = 0
+    present: Counter[str] = field(default_factory=Counter)
+    positional: List[Counter[str]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.positional:
+            self.positional = [Counter() for _ in range(self.word_len)]
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], word_len: int) -> "LetterFrequencies":
+        frequencies = cls(word_len=word_len)
+        frequencies.add(words)
+        return frequencies
+
+    def add(self, words: Iterable[str]) -> None:
+        for word in words:
+            self.total += 1
+            for letter in set(word):
+                self.present[letter] += 1
+            for counts, letter in zip(self.positional, word):
+                counts[letter] += 1
+
+    def get_split_score(self, word: str, ignore: AbstractSet[str] = frozenset()) -> int:
+        """
+            How evenly the feedback on word splits the counted words: a letter found in half of them scores most,
+            a letter found in all or none of them scores nothing. Overall and positional splits are added up,
+            letters from ignore score nothing
+        """
+        score = 0
+        for letter in set(word) - ignore:
+            present = self.present[letter]
+            score += min(present, self.total - present)
+        for counts, letter in zip(self.positional, word):
+            if letter not in ignore:
+                at_position = counts[letter]
+                score += min(at_position, self.total - at_position)
+
+        return score
+
+
+def rank_words(
+        words: Iterable[str],
+        k: int,
+        frequencies: LetterFrequencies,
+        ignore: AbstractSet[str] = frozenset(),
+) -> List[str]:
+    """
+        Top k words by split score, equal scores in alphabetical order
+    """
+    return heapq.nsmallest(k, words, key=lambda word: (-frequencies.get_split_score(word, ignore), word))
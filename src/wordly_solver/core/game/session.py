@@ -0,0 +1,45 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+from wordly_solver.core.game.entities import WordlyWord
+from wordly_solver.core.words.constants import Language
+
+
+@dataclass
+class GameSession:
+    """
+        Constraints compiled from already applied guesses and the words that still fit them
+    """
+    language: Language
+    word_len: int
+
+    history: List[WordlyWord] = field(default_factory=list)  # applied guesses
+
+    positions_letter: Dict[int, str] = field(default_factory=dict)
+    exclude_positions: Dict[int, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    incorrect_letters: Set[str] = field(default_factory=set)  # every letter ever marked incorrect
+    confirmed_counts: Dict[str, int] = field(default_factory=dict)  # most copies of a letter one guess confirmed
+
+    candidates: List[str] | None = None  # None until the first search
+
+    def continues(self, language: Language, current_words: List[WordlyWord]) -> bool:
+        """
+            current_words is this game with zero or more new guesses
+        """
+        return (
+                self.language == language
+                and len(current_words) >= len(self.history)
+                and current_words[:len(self.history)] == self.history
+        )
+
+
+@dataclass
+class GameHistory:
+    """
+        Guesses of a game in progress as the player reported them
+    """
+    language: Language
+    word_len: int
+
+    words: List[WordlyWord] = field(default_factory=list)
@@ -3,3 +3,10 @@ from wordly_solver.core.base.exception import DomainError
 
 class IncorrectInputError(DomainError):
     pass
+
+
+class SearchBusyError(DomainError):
+    """
+    Too many searches are queued, try again later
+    """
+    pass
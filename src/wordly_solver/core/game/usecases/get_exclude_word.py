@@ -1,8 +1,11 @@
 from dataclasses import dataclass
-from typing import List
+from operator import methodcaller
+from typing import Any, List, Set
 
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
 from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
 from wordly_solver.core.game.entities import WordlyWord
+from wordly_solver.core.game.usecases.exceptions import IncorrectInputError
 from wordly_solver.core.user.ports.id_provider import IdProvider
 from wordly_solver.core.words.ports.words_gateway import WordsGateway
 
@@ -22,11 +25,64 @@ class GetExcludeWord:
             self,
             id_provider: IdProvider,
             words_gateway: WordsGateway,
-            wordly_finder: WordlyFinder
+            wordly_finder: WordlyFinder,
+            search_executor: SearchExecutor | None = None,  # run finder calls off the event loop
+            ranked: bool = False,  # execute answers the best ranked word instead of a random one
     ):
         self.id_provider = id_provider
         self.words_gateway = words_gateway
         self.wordly_finder = wordly_finder
+        self.search_executor = search_executor
+        self.ranked = ranked
 
-    async def execute(self, dto: GetExcludeWordDTO):
-        pass
+    async def _call_finder(self, method: str, **kwargs: Any) -> Any:
+        if self.search_executor is None:
+            return getattr(self.wordly_finder, method)(**kwargs)
+
+        return await self.search_executor.run(methodcaller(method, **kwargs))
+
+    def _parse_used_letters(self, current_words: List[WordlyWord]) -> Set[str]:
+        return {
+            letter.value
+            for wordly_word in current_words
+            for letter in wordly_word.values()
+        }
+
+    async def execute(self, dto: GetExcludeWordDTO) -> str | None:
+        current_user = self.id_provider.get_current_user()
+
+        if len(dto.current_words) == 0:
+            return await self.words_gateway.get_first_word(
+                language=current_user.language
+            )
+
+        if self.ranked:
+            top = await self.execute_top(dto, k=1)
+            return top[0] if top else None
+
+        if not all((len(word) == dto.word_len for word in dto.current_words)):
+            raise IncorrectInputError()
+
+        return await self._call_finder(
+            "get_exclude_word",
+            forbidden_letters=self._parse_used_letters(dto.current_words),
+            language=current_user.language,
+            wordly_len=dto.word_len
+        )
+
+    async def execute_top(self, dto: GetExcludeWordDTO, k: int) -> List[str]:
+        """
+            Up to k words with the fewest used letters, the ones whose letters split the dictionary best first
+        """
+        current_user = self.id_provider.get_current_user()
+
+        if not all((len(word) == dto.word_len for word in dto.current_words)):
+            raise IncorrectInputError()
+
+        return await self._call_finder(
+            "get_top_exclude_words",
+            forbidden_letters=self._parse_used_letters(dto.current_words),
+            language=current_user.language,
+            wordly_len=dto.word_len,
+            k=k
+        )
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from functools import partial
+from operator import methodcaller
+from typing import Any, Callable, List
+
+from wordly_solver.core.game.entities import WordlyWord
+from wordly_solver.core.game.feedback import encode_wordly_word
+from wordly_solver.core.game.ports.entropy_finder import EntropyFinder
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.game.usecases.exceptions import IncorrectInputError
+from wordly_solver.core.user.ports.id_provider import IdProvider
+from wordly_solver.core.words.ports.words_gateway import WordsGateway
+
+
+def _call_entropy_finder(call: Callable[[EntropyFinder], Any], entropy_finder: EntropyFinder, _: WordlyFinder) -> Any:
+    return call(entropy_finder)
+
+
+@dataclass
+class GetInformativeWordDTO:
+    current_words: List[WordlyWord]
+    word_len: int
+
+
+class GetInformativeWord:
+    """
+    Get a word that splits the remaining candidates best (max expected information)
+    """
+
+    def __init__(
+            self,
+            entropy_finder: EntropyFinder,
+            id_provider: IdProvider,
+            words_gateway: WordsGateway,
+            # run finder calls off the event loop, a process pool would pickle the entropy finder with every call
+            search_executor: SearchExecutor | None = None,
+    ):
+        self.entropy_finder = entropy_finder
+        self.id_provider = id_provider
+        self.words_gateway = words_gateway
+        self.search_executor = search_executor
+
+    async def _call_finder(self, method: str, **kwargs: Any) -> Any:
+        if self.search_executor is None:
+            return getattr(self.entropy_finder, method)(**kwargs)
+
+        return await self.search_executor.run(
+            partial(_call_entropy_finder, methodcaller(method, **kwargs), self.entropy_finder)
+        )
+
+    async def execute(self, dto: GetInformativeWordDTO) -> str | None:
+        current_user = self.id_provider.get_current_user()
+
+        if len(dto.current_words) == 0:
+            return await self.words_gateway.get_first_word(
+                language=current_user.language
+            )
+
+        if not all((len(word) == dto.word_len for word in dto.current_words)):
+            raise IncorrectInputError()
+
+        return await self._call_finder(
+            "get_informative_word",
+            history=[encode_wordly_word(word) for word in dto.current_words],
+            language=current_user.language,
+            wordly_len=dto.word_len
+        )
@@ -1,10 +1,19 @@
-from collections import defaultdict
+import random
+import time
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import List, Set, Dict, Tuple
+from operator import methodcaller
+from typing import Any, Iterable, List, Set, Dict, Tuple
 
 from wordly_solver.core.game.ports.wordly_finder import WordlyFinder, WordlySearchDTO
 from wordly_solver.core.game.entities import WordlyWord, WordlyLetterState
+from wordly_solver.core.game.feedback import encode_wordly_word
+from wordly_solver.core.game.ports.game_stats import GameEvent, GameEventKind, GameStats
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.ports.session_store import GameSessionStore
+from wordly_solver.core.game.session import GameSession
 from wordly_solver.core.game.usecases.exceptions import IncorrectInputError
+from wordly_solver.core.user.entities import User
 from wordly_solver.core.user.ports.id_provider import IdProvider
 from wordly_solver.core.words.ports.words_gateway import WordsGateway
 
@@ -21,10 +30,26 @@ class GetSuitableWord:
             wordly_solver: WordlyFinder,
             id_provider: IdProvider,
             words_gateway: WordsGateway,
+            session_store: GameSessionStore | None = None,  # keep compiled constraints between turns
+            search_executor: SearchExecutor | None = None,  # run finder calls off the event loop
+            game_stats: GameStats | None = None,
+            ranked: bool = False,  # execute answers the best ranked word instead of a random suitable one
+            max_guesses: int = 6,  # a game without a correct word after that many guesses is lost
     ):
         self.wordly_solver = wordly_solver
         self.id_provider = id_provider
         self.words_gateway = words_gateway
+        self.session_store = session_store
+        self.search_executor = search_executor
+        self.game_stats = game_stats
+        self.ranked = ranked
+        self.max_guesses = max_guesses
+
+    async def _call_finder(self, method: str, **kwargs: Any) -> Any:
+        if self.search_executor is None:
+            return getattr(self.wordly_solver, method)(**kwargs)
+
+        return await self.search_executor.run(methodcaller(method, **kwargs))
 
     def _calculate_count_in_exclude_positions(
             self,
@@ -66,40 +91,80 @@ class GetSuitableWord:
     ) -> Tuple[
         Set[str],  # exclude
         Dict[str, int]  # max_count
+    ]:
+        incorrect_letters = [
+            letter.value
+            for wordly_word in current_words
+            for letter in wordly_word.values()
+            if letter.state == WordlyLetterState.incorrect
+        ]
+
+        return self._compile_exclude_letters_max_count(
+            incorrect_letters, exclude_positions, positions_letter
+        )
+
+    def _compile_exclude_letters_max_count(
+            self,
+            incorrect_letters: Iterable[str],
+            exclude_positions: Dict[int, Set[str]],
+            positions_letter: Dict[int, str]
+    ) -> Tuple[
+        Set[str],  # exclude
+        Dict[str, int]  # max_count
     ]:
         exclude_letters: Set[str] = set()
         max_count: Dict[str, int] = {}
 
-        for wordly_word in current_words:
-            for idx, letter in wordly_word.items():
-                if not letter.state == WordlyLetterState.incorrect:
-                    # already calculated
-                    continue
-
-                in_exclude_positions = any(
-                    letter.value in exclude_positions[pos]
-                    for pos in exclude_positions.keys()
-                )
-                in_position_letters = letter.value in positions_letter.values()
+        for letter in incorrect_letters:
+            in_exclude_positions = any(
+                letter in exclude_positions[pos]
+                for pos in exclude_positions.keys()
+            )
+            in_position_letters = letter in positions_letter.values()
 
-                if not (in_position_letters or in_exclude_positions):
-                    exclude_letters.add(letter.value)
-                elif letter.value in max_count:
-                    continue  # already calculated
+            if not (in_position_letters or in_exclude_positions):
+                exclude_letters.add(letter)
+            elif letter in max_count:
+                continue  # already calculated
 
-                count = 0
-                if in_exclude_positions:
-                    # noinspection PyTypeChecker
-                    count += self._calculate_count_in_exclude_positions(letter.value, exclude_positions)
-                if in_position_letters:
-                    # noinspection PyTypeChecker
-                    count += self._calculate_count_in_positions_letter(letter.value, positions_letter)
+            count = 0
+            if in_exclude_positions:
+                count += self._calculate_count_in_exclude_positions(letter, exclude_positions)
+            if in_position_letters:
+                count += self._calculate_count_in_positions_letter(letter, positions_letter)
 
-                if count != 0:  # already in exclude
-                    max_count[letter.value] = count
+            if count != 0:  # already in exclude
+                max_count[letter] = count
 
         return exclude_letters, max_count
 
+    def _parse_confirmed_counts(self, current_words: List[WordlyWord]) -> Dict[str, int]:
+        """
+            Copies of a letter marked correct or wrong_place in one guess are all in the answer
+        """
+        confirmed_counts: Dict[str, int] = {}
+        for wordly_word in current_words:
+            counts = Counter(
+                letter.value
+                for letter in wordly_word.values()
+                if letter.state in (WordlyLetterState.correct, WordlyLetterState.wrong_place)
+            )
+            for letter, count in counts.items():
+                confirmed_counts[letter] = max(confirmed_counts.get(letter, 0), count)
+
+        return confirmed_counts
+
+    def _compile_min_count(
+            self,
+            confirmed_counts: Dict[str, int],
+            positions_letter: Dict[int, str]
+    ) -> Dict[str, int]:
+        # counts already guaranteed by known positions add nothing
+        known_counts = Counter(positions_letter.values())
+        return {
+            letter: count for letter, count in confirmed_counts.items() if count > known_counts[letter]
+        }
+
     def _parse_to_wordly_search_dto(
             self,
             current_words: List[WordlyWord],
@@ -119,26 +184,188 @@ class GetSuitableWord:
             positions_letter=positions_letter,
             exclude_positions=exclude_positions,
             max_count=max_count,
-            wordly_len=word_len
+            wordly_len=word_len,
+            min_count=self._compile_min_count(self._parse_confirmed_counts(current_words), positions_letter)
         )
 
-    async def execute(self, dto: GetSuitableWordDTO) -> str | None:
-        current_user = self.id_provider.get_current_user()
+    def _apply_to_session(self, session: GameSession, new_words: List[WordlyWord]) -> WordlySearchDTO:
+        """
+            Merge only the new guesses into the compiled constraints of the session
+        """
+        positions_letter, exclude_positions = self._parse_correct_exclude_positions(new_words)
+        session.positions_letter.update(positions_letter)
+        for idx, letters in exclude_positions.items():
+            session.exclude_positions[idx].update(letters)
+
+        session.incorrect_letters.update(
+            letter.value
+            for wordly_word in new_words
+            for letter in wordly_word.values()
+            if letter.state == WordlyLetterState.incorrect
+        )
+        for letter, count in self._parse_confirmed_counts(new_words).items():
+            session.confirmed_counts[letter] = max(session.confirmed_counts.get(letter, 0), count)
+        session.history.extend(new_words)
+
+        exclude_letters, max_count = self._compile_exclude_letters_max_count(
+            session.incorrect_letters, session.exclude_positions, session.positions_letter
+        )
+
+        return WordlySearchDTO(
+            exclude_letters=exclude_letters,
+            positions_letter=dict(session.positions_letter),
+            exclude_positions={idx: set(letters) for idx, letters in session.exclude_positions.items()},
+            max_count=max_count,
+            wordly_len=session.word_len,
+            min_count=self._compile_min_count(session.confirmed_counts, session.positions_letter)
+        )
+
+    def _has_session(self, user: User) -> bool:
+        # anonymous users would share one session per word length
+        return self.session_store is not None and user.id is not None
+
+    async def _update_session(self, user: User, dto: GetSuitableWordDTO) -> GameSession:
+        assert self.session_store is not None and user.id is not None
+
+        session = await self.session_store.get(user.id, dto.word_len)
+        if session is None or not session.continues(user.language, dto.current_words):
+            session = GameSession(language=user.language, word_len=dto.word_len)
 
+        new_words = dto.current_words[len(session.history):]
+        if new_words:
+            search_dto = self._apply_to_session(session, new_words)
+
+            if session.candidates is None:
+                session.candidates = await self._call_finder(
+                    "get_candidates",
+                    dto=search_dto,
+                    language=user.language
+                )
+            else:
+                # later turns only filter what survived the previous ones
+                session.candidates = [word for word in session.candidates if search_dto.matches(word)]
+
+            await self.session_store.save(user.id, session)
+
+        return session
+
+    async def _execute_in_session(self, user: User, dto: GetSuitableWordDTO) -> str | None:
+        session = await self._update_session(user, dto)
+        if not session.candidates:
+            return None
+
+        return random.choice(session.candidates)
+
+    async def _execute_top(self, user: User, dto: GetSuitableWordDTO, k: int) -> List[str]:
+        if not all((len(word) == dto.word_len for word in dto.current_words)):
+            raise IncorrectInputError()
+
+        if self._has_session(user) and dto.current_words:
+            session = await self._update_session(user, dto)
+            # the finder ranks in its own way, the matrix engine scores with numpy
+            return await self._call_finder(
+                "rank_words",
+                words=session.candidates or [],
+                language=user.language,
+                wordly_len=dto.word_len,
+                k=k
+            )
+
+        return await self._call_finder(
+            "get_top_candidates",
+            dto=self._parse_to_wordly_search_dto(
+                current_words=dto.current_words,
+                word_len=dto.word_len
+            ),
+            language=user.language,
+            k=k
+        )
+
+    def _record_stats(self, user: User, dto: GetSuitableWordDTO, result: str | None) -> None:
+        assert self.game_stats is not None
+        stats = self.game_stats
+
+        now = time.time()
+        guesses = len(dto.current_words)
+
+        def record(
+                kind: GameEventKind,
+                word: str | None = None,
+                won: bool | None = None,
+                game: Tuple | None = None,
+        ) -> None:
+            stats.record(GameEvent(
+                kind=kind,
+                user_id=user.id,
+                language=user.language,
+                word_len=dto.word_len,
+                guesses=guesses,
+                word=word,
+                won=won,
+                at=now,
+                game=game,
+            ))
+
+        if guesses:
+            last_word = dto.current_words[-1]
+            record(GameEventKind.guess, word="".join(last_word[idx].value for idx in sorted(last_word)))
+
+            won = all(letter.state == WordlyLetterState.correct for letter in last_word.values())
+            if won or guesses >= self.max_guesses:
+                # the game ended at max_guesses at the latest, a repeated request on it has the same history
+                # and stats skip its outcome
+                if guesses <= self.max_guesses:
+                    history = tuple(encode_wordly_word(word) for word in dto.current_words)
+                    record(GameEventKind.outcome, won=won, game=(user.id, user.language, dto.word_len, history))
+                return
+
+        record(GameEventKind.suggestion, word=result)
+
+    async def _execute(self, user: User, dto: GetSuitableWordDTO) -> str | None:
         if len(dto.current_words) == 0:
             return await self.words_gateway.get_first_word(
-                language=current_user.language
+                language=user.language
             )
 
+        if self.ranked:
+            top = await self._execute_top(user, dto, k=1)
+            return top[0] if top else None
+
         if not all((len(word) == dto.word_len for word in dto.current_words)):
             raise IncorrectInputError()
 
-        result = self.wordly_solver.wordly_search(
+        if self._has_session(user):
+            return await self._execute_in_session(user, dto)
+
+        result = await self._call_finder(
+            "wordly_search",
             dto=self._parse_to_wordly_search_dto(
                 current_words=dto.current_words,
                 word_len=dto.word_len
             ),
-            language=current_user.language
+            language=user.language
         )
 
         return result
+
+    async def execute(self, dto: GetSuitableWordDTO) -> str | None:
+        current_user = self.id_provider.get_current_user()
+
+        result = await self._execute(current_user, dto)
+        if self.game_stats is not None:
+            self._record_stats(current_user, dto, result)
+
+        return result
+
+    async def execute_top(self, dto: GetSuitableWordDTO, k: int) -> List[str]:
+        """
+            Up to k suitable words, the ones that split the suitable words best first.
+            Without guesses the whole dictionary is ranked
+        """
+        current_user = self.id_provider.get_current_user()
+
+        result = await self._execute_top(current_user, dto, k)
+        if self.game_stats is not None:
+            self._record_stats(current_user, dto, result[0] if result else None)
+
+        return result
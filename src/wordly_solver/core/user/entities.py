@@ -6,3 +6,4 @@ from wordly_solver.core.words.constants import Language
 @dataclass
 class User:
     language: Language
+    id: int | None = None  # anonymous users get no per-user state
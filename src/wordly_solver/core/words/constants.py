@@ -1,6 +1,15 @@
+import string
 from enum import Enum, auto
+from typing import Dict, FrozenSet
 
 
 class Language(Enum):
     RU = auto()  # Russian
     ENG = auto()  # English
+
+
+# lowercase letters a word of the language may consist of
+ALPHABETS: Dict[Language, FrozenSet[str]] = {
+    Language.RU: frozenset("абвгдеёжзийклмнопрстуфхцчшщъыьэюя"),
+    Language.ENG: frozenset(string.ascii_lowercase),
+}
@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterator, List, Sequence, Tuple
+
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO, WordlyFinder
+from wordly_solver.core.words.constants import Language
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # dropped by size
+    expirations: int = 0  # dropped by ttl
+
+
+class CachedWordlyFinder(WordlyFinder):
+    """
+        Caches full candidate lists by canonical constraints, wordly_search samples from them.
+        Least recently used entries are evicted above max_size, entries older than ttl seconds expire
+    """
+
+    def __init__(
+            self,
+            finder: WordlyFinder,
+            max_size: int = 10_000,
+            ttl: float | None = None,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.finder = finder
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[Hashable, Tuple[float, Tuple[str, ...]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _get(self, key: Hashable) -> Tuple[str, ...] | None:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            created, candidates = entry
+            if self.ttl is not None and self._clock() - created > self.ttl:
+                del self._cache[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self.stats.hits += 1
+            return candidates
+
+    def _put(self, key: Hashable, candidates: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._cache[key] = (self._clock(), candidates)
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _get_candidates(self, dto: WordlySearchDTO, language: Language) -> Tuple[str, ...]:
+        key = (language, dto.canonical_key())
+        candidates = self._get(key)
+        if candidates is None:
+            # searched outside the lock, two threads may both miss and store the same result
+            candidates = tuple(self.finder.get_candidates(dto, language))
+            self._put(key, candidates)
+
+        return candidates
+
+    def get_candidates(self, dto: WordlySearchDTO, language: Language) -> List[str]:
+        return list(self._get_candidates(dto, language))
+
+    def iter_candidates(self, dto: WordlySearchDTO, language: Language) -> Iterator[str]:
+        return iter(self._get_candidates(dto, language))
+
+    def count_candidates(self, dto: WordlySearchDTO, language: Language) -> int:
+        return len(self._get_candidates(dto, language))
+
+    def wordly_search(self, dto: WordlySearchDTO, language: Language) -> str | None:
+        candidates = self._get_candidates(dto, language)
+        if not candidates:
+            return None
+
+        return random.choice(candidates)
+
+    def get_top_candidates(self, dto: WordlySearchDTO, language: Language, k: int) -> List[str]:
+        return self.finder.get_top_candidates(dto, language, k)
+
+    def rank_words(self, words: Sequence[str], language: Language, wordly_len: int, k: int) -> List[str]:
+        return self.finder.rank_words(words, language, wordly_len, k)
+
+    def get_exclude_word(
+            self,
+            forbidden_letters: set[str],
+            language: Language,
+            wordly_len: int
+    ) -> str | None:
+        return self.finder.get_exclude_word(forbidden_letters, language, wordly_len)
+
+    def get_top_exclude_words(
+            self,
+            forbidden_letters: set[str],
+            language: Language,
+            wordly_len: int,
+            k: int
+    ) -> List[str]:
+        return self.finder.get_top_exclude_words(forbidden_letters, language, wordly_len, k)
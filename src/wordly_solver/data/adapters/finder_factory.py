@@ -0,0 +1,35 @@
+from enum import Enum
+from typing import Dict, Set, Tuple
+
+from wordly_solver.core.game.ports.search_listener import SearchListener
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.words.constants import Language
+
+
+class FinderEngine(Enum):
+    TREE = "tree"
+    BITSET = "bitset"
+    MATRIX = "matrix"  # requires numpy
+
+
+def create_wordly_finder(
+        engine: FinderEngine,
+        init_words: Dict[
+            Tuple[Language, int],  # Language, wordly_len
+            Set[str]
+        ],
+        listener: SearchListener | None = None,
+) -> WordlyFinder:
+    if engine == FinderEngine.TREE:
+        from wordly_solver.data.adapters.wordly_tree import AllWordsTree
+        return AllWordsTree(init_words, listener=listener)
+
+    if engine == FinderEngine.BITSET:
+        from wordly_solver.data.adapters.wordly_bitset import BitsetWordsIndex
+        return BitsetWordsIndex(init_words, listener=listener)
+
+    if engine == FinderEngine.MATRIX:
+        from wordly_solver.data.adapters.wordly_matrix import MatrixWordsIndex
+        return MatrixWordsIndex(init_words, listener=listener)
+
+    raise ValueError(f"Unknown finder engine: {engine}")
@@ -0,0 +1,26 @@
+from collections import Counter
+from typing import Dict, Iterable
+
+from wordly_solver.core.words.constants import Language
+from wordly_solver.core.words.ports.words_gateway import WordsGateway
+
+
+def get_first_word(words: Iterable[str]) -> str:
+    """
+        Word with the most frequent distinct letters
+    """
+    sorted_words = sorted(words)
+    frequency = Counter(letter for word in sorted_words for letter in set(word))
+    return max(sorted_words, key=lambda word: sum(frequency[letter] for letter in set(word)))
+
+
+class FirstWordsGateway(WordsGateway):
+    """
+        Opening words of one word length, picked in advance for every language
+    """
+
+    def __init__(self, first_words: Dict[Language, str]) -> None:
+        self.first_words = first_words
+
+    async def get_first_word(self, language: Language) -> str:
+        return self.first_words[language]
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Hashable, List, Sequence, Tuple
+
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO
+from wordly_solver.core.words.constants import Language
+
+
+class MaskIndex[M](ABC):
+    """
+        Words of one language and length, a search resolves to a mask M of them
+    """
+
+    @abstractmethod
+    def resolve(self, dto: WordlySearchDTO, memo: Dict[Tuple[int, frozenset], M] | None = None) -> M:
+        """
+            memo - forbidden masks by (position, letters), shared between queries of one batch
+        """
+        pass
+
+    @abstractmethod
+    def get_random_word(self, mask: M) -> str | None:
+        pass
+
+
+def search_many[M](
+        queries: Sequence[Tuple[WordlySearchDTO, Language]],
+        get_index: Callable[[Language, int], MaskIndex[M]],
+) -> List[str | None]:
+    """
+        WordlyFinder.wordly_search_many over mask indexes: equal constraints are resolved once,
+        forbidden masks are shared by the queries of one index
+    """
+    memos: Dict[Tuple[Language, int], Dict[Tuple[int, frozenset], M]] = {}
+    masks: Dict[Hashable, M] = {}
+
+    results: List[str | None] = []
+    for dto, language in queries:
+        key = (language, dto.canonical_key())
+        index = get_index(language, dto.wordly_len)
+        if key not in masks:
+            masks[key] = index.resolve(dto, memos.setdefault((language, dto.wordly_len), {}))
+
+        results.append(index.get_random_word(masks[key]))
+
+    return results
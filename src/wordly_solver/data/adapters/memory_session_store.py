@@ -0,0 +1,31 @@
+from collections import OrderedDict
+from typing import Tuple
+
+from wordly_solver.core.game.ports.session_store import GameSessionStore
+from wordly_solver.core.game.session import GameSession
+
+
+class MemoryGameSessionStore(GameSessionStore):
+    """
+        Keeps at most max_sessions sessions, the least recently used one is dropped first
+    """
+
+    def __init__(self, max_sessions: int = 100_000) -> None:
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[Tuple[int, int], GameSession] = OrderedDict()
+
+    async def get(self, user_id: int, word_len: int) -> GameSession | None:
+        key = (user_id, word_len)
+        session = self._sessions.get(key)
+        if session is not None:
+            self._sessions.move_to_end(key)
+
+        return session
+
+    async def save(self, user_id: int, session: GameSession) -> None:
+        key = (user_id, session.word_len)
+        self._sessions[key] = session
+        self._sessions.move_to_end(key)
+
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+from wordly_solver.core.game.entities import WordlyLetter, WordlyWord
+from wordly_solver.core.game.feedback import STATE_DIGITS
+from wordly_solver.core.game.ports.history_store import GameHistoryStore
+from wordly_solver.core.game.session import GameHistory
+from wordly_solver.core.words.constants import Language
+
+_STATES_BY_DIGIT = {digit: state for state, digit in STATE_DIGITS.items()}
+
+
+def pack_words(words: List[WordlyWord], word_len: int) -> Tuple[str, bytes]:
+    """
+        Letters of all guesses in one string and their states as one byte each
+    """
+    letters = []
+    states = bytearray()
+    for word in words:
+        for idx in range(word_len):
+            letter = word[idx]
+            letters.append(letter.value)
+            states.append(STATE_DIGITS[letter.state])
+
+    return "".join(letters), bytes(states)
+
+
+def unpack_words(letters: str, states: bytes, word_len: int) -> List[WordlyWord]:
+    return [
+        {
+            idx: WordlyLetter(value=letters[start + idx], state=_STATES_BY_DIGIT[states[start + idx]])
+            for idx in range(word_len)
+        }
+        for start in range(0, len(letters), word_len)
+    ]
+
+
+class _PackedGame:
+    __slots__ = ("language", "word_len", "letters", "states", "touched")
+
+    def __init__(self, language: Language, word_len: int, letters: str, states: bytes, touched: float) -> None:
+        self.language = language
+        self.word_len = word_len
+        self.letters = letters
+        self.states = states
+        self.touched = touched
+
+
+class PackedGameHistoryStore(GameHistoryStore):
+    """
+        Keeps a chat's game as a string of letters plus a bytes of states instead of a list of dicts
+        of dataclasses, ~300 instead of ~2200 bytes for three five-letter guesses.
+        Chats idle for more than max_idle seconds and the least recently used ones above max_chats are dropped
+    """
+
+    def __init__(
+            self,
+            max_idle: float = 24 * 60 * 60,
+            max_chats: int = 1_000_000,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_idle = max_idle
+        self.max_chats = max_chats
+        self.clock = clock
+        self._games: OrderedDict[int, _PackedGame] = OrderedDict()  # least recently used first
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def _evict_idle(self, now: float) -> None:
+        # the first game is the idlest one, so only the expired ones are ever looked at
+        while self._games:
+            game = next(iter(self._games.values()))
+            if now - game.touched <= self.max_idle:
+                break
+            self._games.popitem(last=False)
+
+    async def get(self, chat_id: int) -> GameHistory | None:
+        now = self.clock()
+        self._evict_idle(now)
+
+        game = self._games.get(chat_id)
+        if game is None:
+            return None
+
+        game.touched = now
+        self._games.move_to_end(chat_id)
+        return GameHistory(
+            language=game.language,
+            word_len=game.word_len,
+            words=unpack_words(game.letters, game.states, game.word_len),
+        )
+
+    async def save(self, chat_id: int, history: GameHistory) -> None:
+        now = self.clock()
+        self._evict_idle(now)
+
+        letters, states = pack_words(history.words, history.word_len)
+        self._games[chat_id] = _PackedGame(history.language, history.word_len, letters, states, now)
+        self._games.move_to_end(chat_id)
+
+        while len(self._games) > self.max_chats:
+            self._games.popitem(last=False)
+
+    async def delete(self, chat_id: int) -> None:
+        self._games.pop(chat_id, None)
@@ -0,0 +1,196 @@
+import os
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from wordly_solver.core.game.ports.entropy_finder import EntropyFinder, FeedbackHistory
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.wordly_matrix import MatrixIndex
+from wordly_solver.data.adapters.words_snapshot import get_source_hash
+
+_BLOCK_CELLS = 1 << 24  # guesses x answers x letters evaluated at once
+_ENTROPY_CELLS = 1 << 22  # guesses x max(candidates, codes) counted at once, 8 bytes each
+
+
+def get_pattern_dtype(wordly_len: int) -> np.dtype:
+    codes_count = 3 ** wordly_len
+    if codes_count <= 1 << 8:
+        return np.dtype(np.uint8)
+    if codes_count <= 1 << 16:
+        return np.dtype(np.uint16)
+    return np.dtype(np.uint32)
+
+
+def compute_patterns(index: MatrixIndex, guesses: np.ndarray) -> np.ndarray:
+    """
+        Feedback pattern codes (see core.game.feedback) of every guess row against every word of index.
+        guesses - b x wordly_len letter codes, len(index.alphabet) stands for a letter missing in index
+        Returns b x N codes
+    """
+    wordly_len = index.letters.shape[1]
+    # letter code -> its count in every answer, a contiguous row per letter
+    letter_counts = np.vstack([index.counts.T, np.zeros((1, len(index)), dtype=index.counts.dtype)])
+    answers = np.ascontiguousarray(index.letters.T)  # position -> letters of every answer
+
+    greens = [answers[idx][None, :] == guesses[:, idx][:, None] for idx in range(wordly_len)]  # L x (b x N)
+    patterns = np.zeros((guesses.shape[0], len(index)), dtype=np.int32)
+    for idx in range(wordly_len):
+        patterns += greens[idx] * np.int32(2 * 3 ** idx)
+        # without repeated letters in the guess a non-green letter is wrong_place whenever the answer has it
+        patterns += (~greens[idx] & (letter_counts[guesses[:, idx]] > 0)) * np.int32(3 ** idx)
+
+    repeats = np.array([len(set(row)) < wordly_len for row in guesses.tolist()], dtype=bool)
+    if repeats.any():
+        patterns[repeats] = _compute_repeats_patterns(
+            [green[repeats] for green in greens], guesses[repeats], letter_counts
+        )
+
+    return patterns
+
+
+def _compute_repeats_patterns(
+        greens: List[np.ndarray],
+        guesses: np.ndarray,
+        letter_counts: np.ndarray,
+) -> np.ndarray:
+    wordly_len = guesses.shape[1]
+    patterns = np.zeros(greens[0].shape, dtype=np.int32)
+
+    yellows: List[np.ndarray] = []
+    for idx in range(wordly_len):
+        letter = guesses[:, idx]
+        # copies of the letter in the answer not taken by greens or by earlier yellows
+        unmatched = letter_counts[letter].astype(np.int16)  # b x N
+        for other in range(wordly_len):
+            same = (guesses[:, other] == letter)[:, None]
+            unmatched -= greens[other] & same
+            if other < idx:
+                unmatched -= yellows[other] & same
+
+        yellows.append(~greens[idx] & (unmatched > 0))
+        patterns += greens[idx].astype(np.int32) * (2 * 3 ** idx) + yellows[idx].astype(np.int32) * 3 ** idx
+
+    return patterns
+
+
+def build_pattern_matrix(index: MatrixIndex) -> np.ndarray:
+    words_count, wordly_len = index.letters.shape
+    matrix = np.empty((words_count, words_count), dtype=get_pattern_dtype(wordly_len))
+
+    block = max(1, _BLOCK_CELLS // max(1, words_count * wordly_len))
+    for start in range(0, words_count, block):
+        matrix[start:start + block] = compute_patterns(index, index.letters[start:start + block])
+
+    return matrix
+
+
+def get_entropies(patterns: np.ndarray, candidates: np.ndarray, codes_count: int) -> np.ndarray:
+    """
+        patterns - guesses x answers, entropy in bits of every guess row over the candidates columns.
+        A block holds at most _ENTROPY_CELLS histogram cells and offset pattern codes
+    """
+    guesses_count = patterns.shape[0]
+    candidates_count = len(candidates)
+    entropies = np.empty(guesses_count)
+
+    block = max(1, _ENTROPY_CELLS // max(codes_count, candidates_count))
+    for start in range(0, guesses_count, block):
+        rows = patterns[start:start + block, candidates]  # still in the narrow pattern dtype
+        offsets = np.arange(rows.shape[0], dtype=np.int64) * codes_count
+        histogram = np.bincount((rows + offsets[:, None]).ravel(), minlength=rows.shape[0] * codes_count)
+        probabilities = histogram.reshape(rows.shape[0], codes_count) / candidates_count
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            entropies[start:start + block] = -np.where(
+                probabilities > 0, probabilities * np.log2(probabilities), 0
+            ).sum(axis=1)
+
+    return entropies
+
+
+class PatternMatrixFinder(EntropyFinder):
+    """
+        Keeps an N x N matrix of feedback pattern codes per dictionary, guess in rows, answer in columns.
+        With cache_dir the matrix is built once, saved as .npy and memory-mapped on later runs.
+        Matrices are built lazily on first use
+    """
+
+    def __init__(
+            self,
+            init_words: Dict[
+                Tuple[Language, int],  # Language, wordly_len
+                Set[str]
+            ],
+            cache_dir: Path | None = None,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self._indexes: Dict[Tuple[Language, int], MatrixIndex] = {}
+        self._word_numbers: Dict[Tuple[Language, int], Dict[str, int]] = {}
+        self._source_hashes: Dict[Tuple[Language, int], str] = {}
+        self._patterns: Dict[Tuple[Language, int], np.ndarray] = {}
+
+        for (lang, wordly_len), words in init_words.items():
+            key = (lang, wordly_len)
+            self._indexes[key] = MatrixIndex.build(words, wordly_len)
+            self._word_numbers[key] = {word: number for number, word in enumerate(sorted(words))}
+            self._source_hashes[key] = get_source_hash(words).hex()[:16]
+
+    def _get_cache_path(self, lang: Language, wordly_len: int) -> Path | None:
+        if self.cache_dir is None:
+            return None
+
+        source_hash = self._source_hashes[(lang, wordly_len)]
+        return self.cache_dir / f"{lang.name.lower()}_{wordly_len}_{source_hash}.patterns.npy"
+
+    def get_patterns(self, lang: Language, wordly_len: int) -> np.ndarray:
+        key = (lang, wordly_len)
+        if key in self._patterns:
+            return self._patterns[key]
+
+        path = self._get_cache_path(lang, wordly_len)
+        if path is None:
+            self._patterns[key] = build_pattern_matrix(self._indexes[key])
+            return self._patterns[key]
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, build_pattern_matrix(self._indexes[key]))
+            tmp_path.replace(path)
+
+        self._patterns[key] = np.load(path, mmap_mode="r")
+        return self._patterns[key]
+
+    def _get_guess_patterns(self, guess: str, lang: Language, wordly_len: int) -> np.ndarray:
+        key = (lang, wordly_len)
+        if (number := self._word_numbers[key].get(guess)) is not None:
+            return self.get_patterns(lang, wordly_len)[number]
+
+        index = self._indexes[key]
+        guess_codes = np.array([[index.codes.get(letter, len(index.alphabet)) for letter in guess]])
+        return compute_patterns(index, guess_codes)[0]
+
+    def get_informative_word(
+            self,
+            history: FeedbackHistory,
+            language: Language,
+            wordly_len: int
+    ) -> str | None:
+        index = self._indexes[(language, wordly_len)]
+
+        mask = np.ones(len(index), dtype=bool)
+        for guess, code in history:
+            mask &= self._get_guess_patterns(guess, language, wordly_len) == code
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) <= 2:
+            return index.get_word(candidates[0]) if len(candidates) else None
+
+        patterns = self.get_patterns(language, wordly_len)
+        scores = get_entropies(patterns, candidates, codes_count=3 ** wordly_len)
+        # a candidate guess may also win right away
+        scores[candidates] += 1 / len(candidates)
+
+        return index.get_word(int(np.argmax(scores)))
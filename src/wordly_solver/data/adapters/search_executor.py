@@ -0,0 +1,122 @@
+import asyncio
+from abc import abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any, Callable
+
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.game.usecases.exceptions import SearchBusyError
+
+
+class InlineSearchExecutor(SearchExecutor):
+    """
+        Runs calls on the event loop thread, for tiny dictionaries and tests
+    """
+
+    def __init__(self, finder: WordlyFinder) -> None:
+        self.finder = finder
+
+    async def run[T](self, call: Callable[[WordlyFinder], T]) -> T:
+        return call(self.finder)
+
+
+class _PoolSearchExecutor(SearchExecutor):
+    """
+        At most max_pending calls are running or queued, a call that cannot get
+        a place within queue_timeout seconds fails with SearchBusyError
+    """
+
+    def __init__(self, executor: Executor, max_pending: int, queue_timeout: float) -> None:
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_pending)
+
+    @abstractmethod
+    def _submit_args(self, call: Callable[[WordlyFinder], Any]) -> tuple:
+        """
+            Function and arguments for the pool
+        """
+        pass
+
+    async def run[T](self, call: Callable[[WordlyFinder], T]) -> T:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except TimeoutError:
+            raise SearchBusyError() from None
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, *self._submit_args(call))
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ThreadSearchExecutor(_PoolSearchExecutor):
+    """
+        Threads share one finder, good for small trees and engines that release the GIL (numpy)
+    """
+
+    def __init__(
+            self,
+            finder: WordlyFinder,
+            max_workers: int = 4,
+            max_pending: int = 64,
+            queue_timeout: float = 1.0,
+    ) -> None:
+        super().__init__(
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wordly-search"),
+            max_pending=max_pending,
+            queue_timeout=queue_timeout,
+        )
+        self.finder = finder
+
+    def _submit_args(self, call: Callable[[WordlyFinder], Any]) -> tuple:
+        return call, self.finder
+
+
+_worker_finder: WordlyFinder | None = None
+
+
+def _init_worker(finder_factory: Callable[[], WordlyFinder]) -> None:
+    global _worker_finder
+    _worker_finder = finder_factory()
+
+
+def _call_worker_finder[T](call: Callable[[WordlyFinder], T]) -> T:
+    assert _worker_finder is not None, "worker is not initialized"
+    return call(_worker_finder)
+
+
+class ProcessSearchExecutor(_PoolSearchExecutor):
+    """
+        Every worker process builds (or loads) its own finder once with finder_factory,
+        heavy searches do not hold the GIL of the serving process
+    """
+
+    def __init__(
+            self,
+            finder_factory: Callable[[], WordlyFinder],
+            max_workers: int = 4,
+            max_pending: int = 64,
+            queue_timeout: float = 1.0,
+            mp_context: BaseContext | None = None,
+    ) -> None:
+        super().__init__(
+            ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(finder_factory,),
+            ),
+            max_pending=max_pending,
+            queue_timeout=queue_timeout,
+        )
+
+    def _submit_args(self, call: Callable[[WordlyFinder], Any]) -> tuple:
+        return _call_worker_finder, call
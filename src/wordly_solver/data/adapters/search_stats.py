@@ -0,0 +1,89 @@
+import threading
+import time
+from typing import Dict, Generator, Iterator, Tuple
+
+from wordly_solver.core.game.ports.search_listener import SearchListener, SearchStats
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO
+from wordly_solver.core.words.constants import Language
+
+
+class SearchStatsCollector(SearchListener):
+    """
+        Sums stats by finder method, a metrics exporter reads them with snapshot()
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+        self._totals: Dict[str, SearchStats] = {}
+
+    def on_search(
+            self,
+            method: str,
+            dto: WordlySearchDTO,
+            language: Language,
+            stats: SearchStats,
+    ) -> None:
+        with self._lock:
+            self._calls[method] = self._calls.get(method, 0) + 1
+            self._totals.setdefault(method, SearchStats())
+            self._totals[method] += stats
+
+    def snapshot(self) -> Dict[str, Tuple[int, SearchStats]]:
+        """
+            method -> (calls, summed stats), copies
+        """
+        with self._lock:
+            return {
+                method: (calls, SearchStats(**{
+                    name: getattr(self._totals[method], name) for name in SearchStats.__slots__
+                }))
+                for method, calls in self._calls.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._totals.clear()
+
+
+def report_search(
+        listener: SearchListener | None,
+        method: str,
+        dto: WordlySearchDTO,
+        language: Language,
+        start: float,  # time.perf_counter() when the call started
+        candidates: int,
+) -> None:
+    if listener is not None:
+        listener.on_search(
+            method, dto, language, SearchStats(candidates=candidates, elapsed=time.perf_counter() - start)
+        )
+
+
+def observe_words(
+        words: Iterator[str],
+        listener: SearchListener,
+        method: str,
+        dto: WordlySearchDTO,
+        language: Language,
+        stats: SearchStats,
+) -> Generator[str, None, None]:
+    """
+        Only time spent inside words is counted, not the consumer's time between them.
+        Reported once words is exhausted or the generator is closed
+    """
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                word = next(words)
+            except StopIteration:
+                return
+            finally:
+                stats.elapsed += time.perf_counter() - start
+
+            stats.candidates += 1
+            yield word
+    finally:
+        listener.on_search(method, dto, language, stats)
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import sqlite3
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Deque, Dict, Hashable, List, Tuple
+
+from wordly_solver.core.game.ports.game_stats import GameEvent, GameEventKind, GameRollup, GameStats
+from wordly_solver.core.words.constants import Language
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_events (
+    id INTEGER PRIMARY KEY,
+    at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    user_id INTEGER,
+    language TEXT NOT NULL,
+    word_len INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    word TEXT,
+    won INTEGER
+);
+CREATE TABLE IF NOT EXISTS game_rollups (
+    language TEXT NOT NULL,
+    word_len INTEGER NOT NULL,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    suggestions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (language, word_len)
+);
+CREATE TABLE IF NOT EXISTS game_won_in (
+    language TEXT NOT NULL,
+    word_len INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    games INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (language, word_len, guesses)
+);
+"""
+
+_INSERT_EVENT = """
+INSERT INTO game_events (at, kind, user_id, language, word_len, guesses, word, won) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_UPSERT_ROLLUP = """
+INSERT INTO game_rollups (language, word_len, games, wins, suggestions) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (language, word_len) DO UPDATE SET
+    games = games + excluded.games,
+    wins = wins + excluded.wins,
+    suggestions = suggestions + excluded.suggestions
+"""
+_UPSERT_WON_IN = """
+INSERT INTO game_won_in (language, word_len, guesses, games) VALUES (?, ?, ?, ?)
+ON CONFLICT (language, word_len, guesses) DO UPDATE SET games = games + excluded.games
+"""
+
+
+class GameStatsClosedError(RuntimeError):
+    pass
+
+
+class SqliteGameStats(GameStats):
+    """
+        record() appends to an in-memory ring buffer, the oldest events are dropped when it is full.
+        A background task (start/close) writes the buffer in batches, one transaction per batch,
+        and updates the per (language, word_len) rollups in the same transaction.
+        Games of the last recent_games outcomes are remembered to skip repeated outcomes
+    """
+
+    def __init__(
+            self,
+            path: Path | str,
+            capacity: int = 65_536,
+            batch_size: int = 4096,
+            flush_interval: float = 1.0,  # seconds between background flushes
+            recent_games: int = 65_536,
+    ) -> None:
+        self.path = path
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.recent_games = recent_games
+        self.dropped = 0  # events pushed out of a full buffer or lost with a failed batch
+
+        self._buffer: Deque[GameEvent] = deque(maxlen=capacity)
+        self._games: OrderedDict[Hashable, None] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._flush_lock = asyncio.Lock()
+        self._flushing: asyncio.Task | None = None
+
+    def _seen_game(self, game: Hashable) -> bool:
+        if game in self._games:
+            self._games.move_to_end(game)
+            return True
+
+        self._games[game] = None
+        if len(self._games) > self.recent_games:
+            self._games.popitem(last=False)
+        return False
+
+    def record(self, event: GameEvent) -> None:
+        if event.kind == GameEventKind.outcome and event.game is not None and self._seen_game(event.game):
+            return
+
+        if len(self._buffer) == self.capacity:
+            self.dropped += 1
+        self._buffer.append(event)
+
+    def _connect(self) -> sqlite3.Connection:
+        # used by one thread at a time, flushes are serialized by _flush_lock
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _check_open(self) -> None:
+        if self._connection is None:
+            raise GameStatsClosedError("Game stats are not started or already closed")
+
+    async def start(self) -> None:
+        self._connection = await asyncio.to_thread(self._connect)
+        self._flushing = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        if self._flushing is not None:
+            self._flushing.cancel()
+            try:
+                await self._flushing
+            except asyncio.CancelledError:
+                pass
+            self._flushing = None
+
+        if self._connection is not None:
+            await self.flush()
+            await asyncio.to_thread(self._connection.close)
+            self._connection = None
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except sqlite3.Error:
+                logger.exception("Game stats flush failed")  # the next flush writes newer events
+
+    async def flush(self) -> int:
+        """
+            Writes everything recorded so far, returns the number of written events.
+            A batch whose transaction failed is counted in dropped and the error is raised
+        """
+        self._check_open()
+
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                # popped on the event loop thread, record() never races with the writer
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                try:
+                    await asyncio.to_thread(self._write, batch)
+                except sqlite3.Error:
+                    self.dropped += len(batch)  # rolled back, retrying could fail forever
+                    raise
+                written += len(batch)
+
+        return written
+
+    def _write(self, batch: List[GameEvent]) -> None:
+        rollups: Dict[Tuple[str, int], List[int]] = {}  # key -> games, wins, suggestions
+        won_in: Dict[Tuple[str, int, int], int] = {}
+        rows = []
+        for event in batch:
+            key = (event.language.name, event.word_len)
+            rows.append((
+                event.at, event.kind.value, event.user_id, *key, event.guesses, event.word,
+                None if event.won is None else int(event.won),
+            ))
+
+            if event.kind == GameEventKind.suggestion:
+                rollups.setdefault(key, [0, 0, 0])[2] += 1
+            elif event.kind == GameEventKind.outcome:
+                rollup = rollups.setdefault(key, [0, 0, 0])
+                rollup[0] += 1
+                if event.won:
+                    rollup[1] += 1
+                    won_in[(*key, event.guesses)] = won_in.get((*key, event.guesses), 0) + 1
+
+        assert self._connection is not None
+        with self._connection:  # one transaction
+            self._connection.executemany(_INSERT_EVENT, rows)
+            self._connection.executemany(_UPSERT_ROLLUP, [(*key, *counts) for key, counts in rollups.items()])
+            self._connection.executemany(_UPSERT_WON_IN, [(*key, games) for key, games in won_in.items()])
+
+    def _read_rollups(self) -> List[GameRollup]:
+        assert self._connection is not None
+        rollups = {
+            (language, word_len): GameRollup(
+                language=Language[language], word_len=word_len, games=games, wins=wins, suggestions=suggestions
+            )
+            for language, word_len, games, wins, suggestions in self._connection.execute(
+                "SELECT language, word_len, games, wins, suggestions FROM game_rollups ORDER BY language, word_len"
+            )
+        }
+        for language, word_len, guesses, games in self._connection.execute(
+                "SELECT language, word_len, guesses, games FROM game_won_in ORDER BY guesses"
+        ):
+            rollups[(language, word_len)].won_in[guesses] = games
+
+        return list(rollups.values())
+
+    async def get_rollups(self) -> List[GameRollup]:
+        """
+            Rollups including the events still in the buffer
+        """
+        await self.flush()
+        async with self._flush_lock:
+            self._check_open()  # closed while waiting for the lock
+            return await asyncio.to_thread(self._read_rollups)
@@ -0,0 +1,14 @@
+from wordly_solver.core.user.entities import User
+from wordly_solver.core.user.ports.id_provider import IdProvider
+
+
+class StaticIdProvider(IdProvider):
+    """
+        User known before the use case is built, e.g. taken from the request
+    """
+
+    def __init__(self, user: User) -> None:
+        self.user = user
+
+    def get_current_user(self) -> User:
+        return self.user
@@ -0,0 +1,228 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+from wordly_solver.core.game.ports.search_listener import SearchListener, SearchStats
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO, WordlyFinder
+from wordly_solver.core.game.ranking import LetterFrequencies
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.mask_index import MaskIndex, search_many
+from wordly_solver.data.adapters.search_stats import observe_words, report_search
+
+
+@dataclass
+class BitsetIndex(MaskIndex[int]):
+    """
+        Bit i of every mask stands for words[i]
+    """
+    words: List[str]
+    all_mask: int = 0
+    position_masks: List[Dict[str, int]] = field(default_factory=list)  # position -> letter -> mask
+    count_masks: Dict[str, List[int]] = field(default_factory=dict)  # letter -> [count >= 1, count >= 2, ...]
+
+    @classmethod
+    def build(cls, words: Set[str], wordly_len: int) -> "BitsetIndex":
+        index = cls(
+            words=sorted(words),
+            position_masks=[{} for _ in range(wordly_len)],
+        )
+        index.all_mask = (1 << len(index.words)) - 1
+
+        for idx, word in enumerate(index.words):
+            bit = 1 << idx
+            letter_counts: Dict[str, int] = {}
+            for position, letter in enumerate(word):
+                masks = index.position_masks[position]
+                masks[letter] = masks.get(letter, 0) | bit
+                letter_counts[letter] = letter_counts.get(letter, 0) + 1
+
+            for letter, count in letter_counts.items():
+                count_masks = index.count_masks.setdefault(letter, [])
+                while len(count_masks) < count:
+                    count_masks.append(0)
+                for min_count in range(count):
+                    count_masks[min_count] |= bit
+
+        return index
+
+    def get_position_mask(self, position: int, letter: str) -> int:
+        return self.position_masks[position].get(letter, 0)
+
+    def get_count_mask(self, letter: str, min_count: int) -> int:
+        """
+            Words containing letter at least min_count times
+        """
+        if min_count <= 0:
+            return self.all_mask
+
+        count_masks = self.count_masks.get(letter, [])
+        if min_count > len(count_masks):
+            return 0
+
+        return count_masks[min_count - 1]
+
+    def resolve(self, dto: WordlySearchDTO, memo: Dict[Tuple[int, frozenset], int] | None = None) -> int:
+        """
+            memo - forbidden masks by (position, letters), shared between queries of one batch
+        """
+        mask = self.all_mask
+        free_positions = []
+
+        for position in range(len(self.position_masks)):
+            if letter := dto.positions_letter.get(position):
+                mask &= self.get_position_mask(position, letter)
+            else:
+                free_positions.append(position)
+
+        for position in free_positions:
+            forbidden = frozenset(dto.exclude_letters | dto.exclude_positions.get(position, set()))
+            if memo is not None and (position, forbidden) in memo:
+                mask &= ~memo[(position, forbidden)]
+                continue
+
+            forbidden_mask = 0
+            for letter in forbidden:
+                forbidden_mask |= self.get_position_mask(position, letter)
+
+            if memo is not None:
+                memo[(position, forbidden)] = forbidden_mask
+            mask &= ~forbidden_mask
+
+        for letters in dto.exclude_positions.values():
+            for letter in letters:
+                mask &= self.get_count_mask(letter, 1)
+
+        for letter, count in dto.max_count.items():
+            mask &= ~self.get_count_mask(letter, count + 1)
+
+        for letter, count in dto.min_count.items():
+            mask &= self.get_count_mask(letter, count)
+
+        return mask
+
+    def get_words(self, mask: int) -> List[str]:
+        return list(self.iter_words(mask))
+
+    def iter_words(self, mask: int) -> Iterator[str]:
+        bits = bin(mask)[:1:-1]  # lowest bit first
+        idx = bits.find("1")
+        while idx != -1:
+            yield self.words[idx]
+            idx = bits.find("1", idx + 1)
+
+    def get_random_word(self, mask: int) -> str | None:
+        if not mask:
+            return None
+
+        # the rank-th set bit, found by bisecting on the number of set bits below a position
+        rank = random.randrange(mask.bit_count())
+        low, high = 0, mask.bit_length()
+        while high - low > 1:
+            middle = (low + high) // 2
+            if (mask & ((1 << middle) - 1)).bit_count() > rank:
+                high = middle
+            else:
+                low = middle
+
+        return self.words[low]
+
+
+class BitsetWordsIndex(WordlyFinder):
+    """
+        Resolves a WordlySearchDTO with a few AND/ANDNOT operations over precomputed
+        (position, letter) and (letter, min count) bitsets instead of walking a tree
+    """
+
+    def __init__(
+            self,
+            init_words: Dict[
+                Tuple[Language, int],  # Language, wordly_len
+                Set[str]
+            ],
+            listener: SearchListener | None = None,  # per-call candidates and elapsed time
+    ) -> None:
+        self.listener = listener
+        self._indexes: Dict[Tuple[Language, int], BitsetIndex] = {
+            (lang, wordly_len): BitsetIndex.build(words, wordly_len)
+            for (lang, wordly_len), words in init_words.items()
+        }
+        self._frequencies: Dict[Tuple[Language, int], LetterFrequencies] = {}  # counted on first use
+
+    def _get_index(self, lang: Language, wordly_len: int) -> BitsetIndex:
+        return self._indexes[(lang, wordly_len)]
+
+    def get_candidates(self, dto: WordlySearchDTO, language: Language) -> List[str]:
+        start = time.perf_counter()
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        result = index.get_words(index.resolve(dto))
+        report_search(self.listener, "get_candidates", dto, language, start, len(result))
+        return result
+
+    def iter_candidates(self, dto: WordlySearchDTO, language: Language) -> Iterator[str]:
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        if self.listener is None:
+            return index.iter_words(index.resolve(dto))
+
+        def words() -> Iterator[str]:
+            # the mask is resolved on the first next(), its time is counted with the words
+            yield from index.iter_words(index.resolve(dto))
+
+        return observe_words(words(), self.listener, "iter_candidates", dto, language, SearchStats())
+
+    def count_candidates(self, dto: WordlySearchDTO, language: Language) -> int:
+        start = time.perf_counter()
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        result = index.resolve(dto).bit_count()
+        report_search(self.listener, "count_candidates", dto, language, start, result)
+        return result
+
+    def wordly_search(self, dto: WordlySearchDTO, language: Language) -> str | None:
+        start = time.perf_counter()
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        result = index.get_random_word(index.resolve(dto))
+        report_search(self.listener, "wordly_search", dto, language, start, int(result is not None))
+        return result
+
+    def wordly_search_many(
+            self,
+            queries: Sequence[Tuple[WordlySearchDTO, Language]]
+    ) -> List[str | None]:
+        return search_many(queries, self._get_index)
+
+    def get_exclude_word(
+            self,
+            forbidden_letters: set[str],
+            language: Language,
+            wordly_len: int
+    ) -> str | None:
+        index = self._get_index(lang=language, wordly_len=wordly_len)
+        return index.get_random_word(self._get_fewest_hits_mask(index, forbidden_letters, wordly_len))
+
+    @staticmethod
+    def _get_fewest_hits_mask(index: BitsetIndex, forbidden_letters: set[str], wordly_len: int) -> int:
+        # at_most[k] - words with no more than k forbidden letters
+        at_most = [index.all_mask] * (wordly_len + 1)
+        for position in range(wordly_len):
+            hit = 0
+            for letter in forbidden_letters:
+                hit |= index.get_position_mask(position, letter)
+
+            at_most = [
+                (at_most[k] & ~hit) | (at_most[k - 1] & hit if k else 0)
+                for k in range(wordly_len + 1)
+            ]
+
+        return next((mask for mask in at_most if mask), 0)
+
+    def get_fewest_hits_words(self, forbidden_letters: set[str], language: Language, wordly_len: int) -> List[str]:
+        index = self._get_index(lang=language, wordly_len=wordly_len)
+        return index.get_words(self._get_fewest_hits_mask(index, forbidden_letters, wordly_len))
+
+    def get_dictionary_frequencies(self, language: Language, wordly_len: int) -> LetterFrequencies:
+        key = (language, wordly_len)
+        if key not in self._frequencies:
+            # two threads may both count, they store equal frequencies
+            words = self._get_index(lang=language, wordly_len=wordly_len).words
+            self._frequencies[key] = LetterFrequencies.from_words(words, wordly_len)
+        return self._frequencies[key]
@@ -0,0 +1,323 @@
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from wordly_solver.core.game.ports.search_listener import SearchListener, SearchStats
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO, WordlyFinder
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.mask_index import MaskIndex, search_many
+from wordly_solver.data.adapters.search_stats import observe_words, report_search
+from wordly_solver.data.adapters.words_snapshot import WordsSnapshot, load_snapshot
+
+
+@dataclass
+class MatrixIndex(MaskIndex[np.ndarray]):
+    alphabet: str  # letter by code
+    letters: np.ndarray  # N x wordly_len, uint8 letter codes, rows are sorted words
+    counts: np.ndarray  # N x len(alphabet), uint8 letter counts
+    codes: Dict[str, int] = field(init=False)  # letter -> code
+    _decode_table: Dict[int, str] = field(init=False, repr=False)
+    _encode_table: Dict[int, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.codes = {letter: code for code, letter in enumerate(self.alphabet)}
+        self._decode_table = {code: letter for code, letter in enumerate(self.alphabet)}
+        self._encode_table = {ord(letter): chr(code) for code, letter in enumerate(self.alphabet)}
+
+    @classmethod
+    def build(cls, words: Set[str], wordly_len: int) -> "MatrixIndex":
+        sorted_words = sorted(words)
+        alphabet = "".join(sorted({letter for word in sorted_words for letter in word}))
+        if len(alphabet) > 256:
+            raise ValueError("Alphabet does not fit into uint8 codes")
+
+        codes = {letter: code for code, letter in enumerate(alphabet)}
+        letters = np.array(
+            [[codes[letter] for letter in word] for word in sorted_words],
+            dtype=np.uint8,
+        ).reshape(len(sorted_words), wordly_len)
+
+        counts = np.zeros((len(sorted_words), len(alphabet)), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(sorted_words)), wordly_len)
+        np.add.at(counts, (rows, letters.ravel()), 1)
+
+        return cls(alphabet=alphabet, letters=letters, counts=counts)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: WordsSnapshot) -> "MatrixIndex":
+        """
+            Zero-copy: both matrices stay backed by the memory-mapped file
+        """
+        return cls(
+            alphabet=snapshot.alphabet,
+            letters=np.frombuffer(snapshot.letters, dtype=np.uint8).reshape(
+                snapshot.words_count, snapshot.wordly_len
+            ),
+            counts=np.frombuffer(snapshot.counts, dtype=np.uint8).reshape(
+                snapshot.words_count, len(snapshot.alphabet)
+            ),
+        )
+
+    def __len__(self) -> int:
+        return self.letters.shape[0]
+
+    def get_word(self, idx: int) -> str:
+        return self.letters[idx].tobytes().decode("latin-1").translate(self._decode_table)
+
+    def get_codes(self, letters: Iterable[str]) -> List[int]:
+        return [self.codes[letter] for letter in letters if letter in self.codes]
+
+    def resolve(self, dto: WordlySearchDTO, memo: Dict[Tuple[int, frozenset], np.ndarray] | None = None) -> np.ndarray:
+        """
+            memo - forbidden masks by (position, letters), shared between queries of one batch
+        """
+        mask = np.ones(len(self), dtype=bool)
+
+        for position in range(self.letters.shape[1]):
+            column = self.letters[:, position]
+            if letter := dto.positions_letter.get(position):
+                if letter not in self.codes:
+                    return np.zeros_like(mask)
+                mask &= column == self.codes[letter]
+                continue
+
+            forbidden = frozenset(dto.exclude_letters | dto.exclude_positions.get(position, set()))
+            if memo is not None and (position, forbidden) in memo:
+                mask &= ~memo[(position, forbidden)]
+            elif codes := self.get_codes(forbidden):
+                forbidden_mask = np.isin(column, codes)
+                if memo is not None:
+                    memo[(position, forbidden)] = forbidden_mask
+                mask &= ~forbidden_mask
+
+        for letters in dto.exclude_positions.values():
+            for letter in letters:
+                if letter not in self.codes:
+                    return np.zeros_like(mask)
+                mask &= self.counts[:, self.codes[letter]] >= 1
+
+        for letter, count in dto.max_count.items():
+            if letter in self.codes:
+                mask &= self.counts[:, self.codes[letter]] <= count
+
+        for letter, count in dto.min_count.items():
+            if letter in self.codes:
+                mask &= self.counts[:, self.codes[letter]] >= count
+            elif count > 0:
+                return np.zeros_like(mask)
+
+        return mask
+
+    def get_words(self, mask: np.ndarray) -> List[str]:
+        return list(self.iter_words(mask))
+
+    def iter_words(self, mask: np.ndarray) -> Iterator[str]:
+        for idx in np.flatnonzero(mask).tolist():
+            yield self.get_word(idx)
+
+    def get_random_word(self, mask: np.ndarray) -> str | None:
+        indexes = np.flatnonzero(mask)
+        if not len(indexes):
+            return None
+
+        return self.get_word(int(random.choice(indexes)))
+
+    def encode(self, words: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            letters and counts rows of words made of this index's letters, in the order of words
+        """
+        wordly_len = self.letters.shape[1]
+        alphabet_len = len(self.alphabet)
+        letters = np.frombuffer(
+            "".join(words).translate(self._encode_table).encode("latin-1"), dtype=np.uint8
+        ).reshape(len(words), wordly_len)
+
+        rows = np.repeat(np.arange(len(words)) * alphabet_len, wordly_len)
+        counts = np.bincount(rows + letters.ravel(), minlength=len(words) * alphabet_len).astype(np.uint8)
+        return letters, counts.reshape(len(words), alphabet_len)
+
+    def _get_split_scores(
+            self,
+            letters: np.ndarray,
+            counts: np.ndarray,
+            counted_letters: np.ndarray,  # rows the frequencies are counted over
+            counted_counts: np.ndarray,
+            ignore: AbstractSet[str] = frozenset(),
+    ) -> np.ndarray:
+        """
+            LetterFrequencies.get_split_score of every row, counted and scored with whole-matrix operations
+        """
+        total = len(counted_letters)
+        alphabet_len = len(self.alphabet)
+        wordly_len = self.letters.shape[1]
+
+        present = np.count_nonzero(counted_counts, axis=0).astype(np.int64)
+        offsets = np.arange(wordly_len) * alphabet_len  # one bincount for all positions
+        positional = np.bincount(
+            (counted_letters + offsets).ravel(), minlength=wordly_len * alphabet_len
+        ).reshape(wordly_len, alphabet_len)
+
+        present_split = np.minimum(present, total - present)
+        positional_split = np.minimum(positional, total - positional)
+        if ignored := self.get_codes(ignore):
+            present_split[ignored] = 0
+            positional_split[:, ignored] = 0
+
+        scores = (counts > 0) @ present_split
+        scores += positional_split[np.arange(wordly_len), letters].sum(axis=1)
+        return scores
+
+    def get_top_words(
+            self,
+            mask: np.ndarray,
+            k: int,
+            counted: np.ndarray | None = None,  # words the frequencies are counted over, mask by default
+            ignore: AbstractSet[str] = frozenset(),
+    ) -> List[str]:
+        """
+            Same ranking as core.game.ranking.rank_words
+        """
+        counted = mask if counted is None else counted
+        rows = np.flatnonzero(mask)
+        scores = self._get_split_scores(
+            self.letters[rows], self.counts[rows], self.letters[counted], self.counts[counted], ignore
+        )
+
+        # rows are sorted words, so equal scores stay in alphabetical order
+        top = rows[np.argsort(-scores, kind="stable")[:k]]
+        return [self.get_word(idx) for idx in top]
+
+    def rank_words(self, words: Sequence[str], k: int) -> List[str]:
+        """
+            Same ranking as core.game.ranking.rank_words, words are counted over themselves
+        """
+        ordered = sorted(words)
+        letters, counts = self.encode(ordered)
+        scores = self._get_split_scores(letters, counts, letters, counts)
+        return [ordered[idx] for idx in np.argsort(-scores, kind="stable")[:k]]
+
+
+class MatrixWordsIndex(WordlyFinder):
+    """
+        Holds every dictionary as a uint8 matrix of alphabet codes and evaluates
+        WordlySearchDTO fields as vectorized boolean masks
+    """
+
+    def __init__(
+            self,
+            init_words: Dict[
+                Tuple[Language, int],  # Language, wordly_len
+                Set[str]
+            ],
+            listener: SearchListener | None = None,  # per-call candidates and elapsed time
+    ) -> None:
+        self.listener = listener
+        self._indexes: Dict[Tuple[Language, int], MatrixIndex] = {
+            (lang, wordly_len): MatrixIndex.build(words, wordly_len)
+            for (lang, wordly_len), words in init_words.items()
+        }
+
+    @classmethod
+    def from_snapshots(
+            cls,
+            paths: Iterable[Path],
+            verify_checksum: bool = True,
+            listener: SearchListener | None = None,
+    ) -> "MatrixWordsIndex":
+        finder = cls({}, listener=listener)
+        for path in paths:
+            snapshot = load_snapshot(path, verify_checksum=verify_checksum)
+            finder._indexes[(snapshot.language, snapshot.wordly_len)] = MatrixIndex.from_snapshot(snapshot)
+
+        return finder
+
+    def _get_index(self, lang: Language, wordly_len: int) -> MatrixIndex:
+        return self._indexes[(lang, wordly_len)]
+
+    def get_candidates(self, dto: WordlySearchDTO, language: Language) -> List[str]:
+        start = time.perf_counter()
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        result = index.get_words(index.resolve(dto))
+        report_search(self.listener, "get_candidates", dto, language, start, len(result))
+        return result
+
+    def iter_candidates(self, dto: WordlySearchDTO, language: Language) -> Iterator[str]:
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        if self.listener is None:
+            return index.iter_words(index.resolve(dto))
+
+        def words() -> Iterator[str]:
+            # the mask is resolved on the first next(), its time is counted with the words
+            yield from index.iter_words(index.resolve(dto))
+
+        return observe_words(words(), self.listener, "iter_candidates", dto, language, SearchStats())
+
+    def count_candidates(self, dto: WordlySearchDTO, language: Language) -> int:
+        start = time.perf_counter()
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        result = int(np.count_nonzero(index.resolve(dto)))
+        report_search(self.listener, "count_candidates", dto, language, start, result)
+        return result
+
+    def wordly_search(self, dto: WordlySearchDTO, language: Language) -> str | None:
+        start = time.perf_counter()
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        result = index.get_random_word(index.resolve(dto))
+        report_search(self.listener, "wordly_search", dto, language, start, int(result is not None))
+        return result
+
+    def get_top_candidates(self, dto: WordlySearchDTO, language: Language, k: int) -> List[str]:
+        index = self._get_index(lang=language, wordly_len=dto.wordly_len)
+        return index.get_top_words(index.resolve(dto), k)
+
+    def rank_words(self, words: Sequence[str], language: Language, wordly_len: int, k: int) -> List[str]:
+        return self._get_index(lang=language, wordly_len=wordly_len).rank_words(words, k)
+
+    def wordly_search_many(
+            self,
+            queries: Sequence[Tuple[WordlySearchDTO, Language]]
+    ) -> List[str | None]:
+        return search_many(queries, self._get_index)
+
+    def get_exclude_word(
+            self,
+            forbidden_letters: set[str],
+            language: Language,
+            wordly_len: int
+    ) -> str | None:
+        index = self._get_index(lang=language, wordly_len=wordly_len)
+        if not len(index):
+            return None
+
+        forbidden = index.get_codes(forbidden_letters)
+        hits = np.isin(index.letters, forbidden).sum(axis=1)
+
+        return index.get_random_word(hits == hits.min())
+
+    def get_fewest_hits_words(self, forbidden_letters: set[str], language: Language, wordly_len: int) -> List[str]:
+        index = self._get_index(lang=language, wordly_len=wordly_len)
+        if not len(index):
+            return []
+
+        hits = np.isin(index.letters, index.get_codes(forbidden_letters)).sum(axis=1)
+        return index.get_words(hits == hits.min())
+
+    def get_top_exclude_words(
+            self,
+            forbidden_letters: set[str],
+            language: Language,
+            wordly_len: int,
+            k: int
+    ) -> List[str]:
+        index = self._get_index(lang=language, wordly_len=wordly_len)
+        if not len(index):
+            return []
+
+        hits = np.isin(index.letters, index.get_codes(forbidden_letters)).sum(axis=1)
+        return index.get_top_words(
+            hits == hits.min(), k, counted=np.ones(len(index), dtype=bool), ignore=forbidden_letters
+        )
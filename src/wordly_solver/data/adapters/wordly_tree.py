@@ -1,41 +1,50 @@
 import random
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Generator, Iterable, Iterator, List, Set, Tuple
 
-from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO, WordlyFinder
+from wordly_solver.core.game.ports.search_listener import SearchListener, SearchStats
+from wordly_solver.core.game.ports.wordly_finder import PATTERN_WILDCARD, PatternQueryDTO, WordlySearchDTO, WordlyFinder
+from wordly_solver.core.game.ranking import LetterFrequencies
 from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.search_stats import observe_words
 
 
-@dataclass
+@dataclass(slots=True)
 class LetterNode:
+    """
+        After minimization one node may be shared by several parents (equal suffixes),
+        so a node knows nothing about the path that led to it
+    """
     letter_high: int  # value number in word
     letter: str
     children: Dict[str, "LetterNode"] = field(default_factory=dict)
-    parent: Optional["LetterNode"] = None
-
-    visited: bool = False  # for dfs
-
-    def get_full_word(self) -> str:
-        word = ""
-        current_node = self
-        while current_node.parent:
-            assert current_node.letter
-            word += current_node.letter
-            current_node = current_node.parent
-
-        return word[::-1]
+    words_count: int = 0  # words in the subtree
+    letters_mask: int = 0  # letters met below the node, bits of AllWordsTree.letter_bits
 
 
 class AllWordsTree(WordlyFinder):
-    """!!THREAD UNSAFE!!"""
+    """
+        Nodes are never modified after init, all search state lives in the query,
+        so one tree can be shared between threads
+    """
 
     def __init__(
             self,
             init_words: Dict[
                 Tuple[Language, int],  # Language, wordly_len
                 Set[str]
-            ]
+            ],
+            minimize: bool = True,  # share equal suffixes (DAWG)
+            listener: SearchListener | None = None,  # per-call search stats, nothing is counted without it
     ) -> None:
+        self.listener = listener
+        letters = sorted({letter for words in init_words.values() for word in words for letter in word})
+        self.letter_bits: Dict[str, int] = {letter: 1 << bit for bit, letter in enumerate(letters)}
+        # letters met on every level, a cheap lower bound for get_exclude_word
+        self._level_letters: Dict[Tuple[Language, int], List[Set[str]]] = {}
+        self._frequencies: Dict[Tuple[Language, int], LetterFrequencies] = {}  # counted on first use
 
         for to_init in init_words:
             setattr(
@@ -47,26 +56,75 @@ class AllWordsTree(WordlyFinder):
                 )
             )
 
-        for lang, words in init_words.items():
+        for key, words in init_words.items():
+            level_letters: List[Set[str]] = [set() for _ in range(key[1])]
             for word in words:
-                self._add_word(word, lang[0])
+                self._add_word(word, key[0])
+                for idx, letter in enumerate(word):
+                    level_letters[idx].add(letter)
+
+            self._level_letters[key] = level_letters
+
+        for lang, wordly_len in init_words:
+            if minimize:
+                self._minimize(self._get_root_by_lang(lang, wordly_len))
+            self._summarize(self._get_root_by_lang(lang, wordly_len), self.letter_bits)
 
     def _add_word(self, word: str, lang: Language) -> None:
         current = self._get_root_by_lang(lang, len(word))
         for idx, letter in enumerate(word):
             if letter not in current.children:
                 current.children[letter] = LetterNode(
-                    letter=letter, parent=current, letter_high=idx + 1
+                    letter=letter, letter_high=idx + 1
                 )
             current = current.children[letter]
 
-    def _reset_visited(self, lang: Language, wordly_len: int) -> None:
-        def reset_node(node: LetterNode):
-            node.visited = False
-            for child in node.children.values():
-                reset_node(child)
-
-        reset_node(self._get_root_by_lang(lang=lang, wordly_len=wordly_len))
+    @staticmethod
+    def _minimize(root: LetterNode) -> None:
+        # all words in a tree have the same length, so equal subtrees are always on the same level
+        register: Dict[tuple, LetterNode] = {}
+
+        # post-order without recursion: a node is registered after all its children were replaced
+        stack: List[Tuple[LetterNode, LetterNode | None, bool]] = [(root, None, False)]
+        while stack:
+            node, parent, expanded = stack.pop()
+            if not expanded:
+                stack.append((node, parent, True))
+                stack.extend((child, node, False) for child in node.children.values())
+                continue
+
+            signature = (
+                node.letter,
+                node.letter_high,
+                tuple(sorted((letter, id(child)) for letter, child in node.children.items())),
+            )
+            if parent is not None:
+                parent.children[node.letter] = register.setdefault(signature, node)
+
+    @staticmethod
+    def _summarize(root: LetterNode, letter_bits: Dict[str, int]) -> None:
+        """
+            Words count and letters mask of every subtree
+        """
+        masks: Dict[int, int] = {}  # equal masks share one int object
+
+        stack: List[Tuple[LetterNode, bool]] = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node.words_count:  # shared nodes are counted once
+                continue
+
+            if not node.children:
+                node.words_count = int(node.letter_high > 0)  # the root of an empty index is no word
+            elif expanded:
+                node.words_count = sum(child.words_count for child in node.children.values())
+                mask = 0
+                for child in node.children.values():
+                    mask |= letter_bits[child.letter] | child.letters_mask
+                node.letters_mask = masks.setdefault(mask, mask)
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values() if not child.words_count)
 
     def _get_root_by_lang(self, lang: Language, wordly_len: int):
         return getattr(self, f"{lang.value}_root_len{wordly_len}")
@@ -77,89 +135,283 @@ class AllWordsTree(WordlyFinder):
             language: Language,
             wordly_len: int
     ) -> str | None:
+        return next((word for _, word in self._iter_by_hits(forbidden_letters, language, wordly_len)), None)
+
+    def _iter_by_hits(
+            self,
+            forbidden_letters: set[str],
+            language: Language,
+            wordly_len: int,
+            shuffle: bool = True,
+    ) -> Iterator[Tuple[int, str]]:
+        """
+            (hits, word) of every word, fewer forbidden letters first
+        """
         # Начинает обходить ветки, если в ветке встречается буква из запрещенных - откладывает ее дальнейшее обхождение на потом, возвращается на 1 уровень вверх и идет дальше по веткам (с того же места, где остановился, перебирая только  оставшихся детей). Если обойдя все ветки найти слово с 0 вхождений не получилось, начинает обходить то, что запомнил (ветки, где 1 раз встретилась буква из запрещенных). Там тот же принцип - встретил букву второй раз, отложил на потом. Как только он находит слово с текущим разрешенным количественном вхождений - возвращает
-        self._reset_visited(lang=language, wordly_len=wordly_len)
+        # Deferred branches wait in buckets, so the tree is never re-walked per threshold.
+        # Bucket = hits on the path + levels below where every letter is forbidden (lower bound)
         start_node = self._get_root_by_lang(lang=language, wordly_len=wordly_len)
-        forbidden_count = 0
-        pass
+
+        forced_hits = [0] * (wordly_len + 1)  # unavoidable hits below the level
+        for level in range(wordly_len - 1, -1, -1):
+            letters = self._level_letters[(language, wordly_len)][level]
+            forced_hits[level] = forced_hits[level + 1] + (letters <= forbidden_letters)
+
+        buckets: List[List[Tuple[LetterNode, str, int]]] = [[] for _ in range(wordly_len + 1)]
+        buckets[forced_hits[0]].append((start_node, "", 0))
+
+        for bucket in buckets:
+            while bucket:
+                node, word, hits = bucket.pop()
+
+                if not node.children and node.letter_high > 0:
+                    yield hits, word
+                    continue
+
+                children = list(node.children.values())
+                if shuffle:
+                    # difference result between runs
+                    random.shuffle(children)
+
+                for child in children:
+                    child_hits = hits + (child.letter in forbidden_letters)
+                    bound = child_hits + forced_hits[child.letter_high]
+                    buckets[bound].append((child, word + child.letter, child_hits))
+
+    def get_fewest_hits_words(self, forbidden_letters: set[str], language: Language, wordly_len: int) -> List[str]:
+        words: List[str] = []
+        fewest = 0
+        for hits, word in self._iter_by_hits(forbidden_letters, language, wordly_len, shuffle=False):
+            if words and hits > fewest:
+                break
+            fewest = hits
+            words.append(word)
+
+        return sorted(words)
+
+    def get_dictionary_frequencies(self, language: Language, wordly_len: int) -> LetterFrequencies:
+        key = (language, wordly_len)
+        if key not in self._frequencies:
+            # two threads may both count, they store equal frequencies
+            self._frequencies[key] = super().get_dictionary_frequencies(language, wordly_len)
+        return self._frequencies[key]
 
     def wordly_search(
             self,
             dto: WordlySearchDTO,
             language: Language,
     ) -> str | None:
-        self._reset_visited(lang=language, wordly_len=dto.wordly_len)
-        start_node = self._get_root_by_lang(lang=language, wordly_len=dto.wordly_len)
+        search = self._run_search("wordly_search", dto, language, shuffle=True)
+        try:
+            return next(search, None)
+        finally:
+            search.close()
+
+    def get_candidates(self, dto: WordlySearchDTO, language: Language) -> List[str]:
+        return sorted(self._run_search("get_candidates", dto, language, shuffle=False))
+
+    def iter_candidates(self, dto: WordlySearchDTO, language: Language) -> Iterator[str]:
+        return self._run_search("iter_candidates", dto, language, shuffle=False)
+
+    def count_candidates(self, dto: WordlySearchDTO, language: Language) -> int:
+        if dto.exclude_letters or dto.max_count or dto.min_count or any(dto.exclude_positions.values()):
+            return sum(1 for _ in self._run_search("count_candidates", dto, language, shuffle=False))
+
+        # only known positions: below the last one whole subtrees are counted without visiting leaves
+        last_known = max(dto.positions_letter, default=-1)
+        stats = SearchStats() if self.listener is not None else None
+        start = time.perf_counter() if stats is not None else 0
+
+        result = 0
+        stack = [self._get_root_by_lang(lang=language, wordly_len=dto.wordly_len)]
+        while stack:
+            node = stack.pop()
+            if stats is not None:
+                stats.nodes_entered += 1
+
+            if node.letter_high > last_known or not node.children:
+                result += node.words_count
+            elif letter := dto.positions_letter.get(node.letter_high):
+                if child := node.children.get(letter):
+                    stack.append(child)
+            else:
+                stack.extend(node.children.values())
+
+        if stats is not None and self.listener is not None:
+            stats.candidates = result
+            stats.elapsed = time.perf_counter() - start
+            self.listener.on_search("count_candidates", dto, language, stats)
+
+        return result
+
+    def find_by_pattern(self, query: PatternQueryDTO, language: Language) -> List[str]:
+        """
+            Only the child fixed by the mask is entered, a subtree is skipped when
+            its letters mask lacks a required letter not yet on the path
+        """
+        stats = SearchStats() if self.listener is not None else None
+        start = time.perf_counter() if stats is not None else 0
+
+        letter_bits = self.letter_bits
+        required = 0
+        for letter in query.must_contain:
+            if letter not in letter_bits:
+                return []  # no word of the tree has it
+            required |= letter_bits[letter]
+
+        result: List[str] = []
+        wordly_len = query.wordly_len
+        mask = query.mask
+        must_not_contain = query.must_not_contain
+
+        # node, its word prefix, required letters still missing on the path
+        stack: List[Tuple[LetterNode, str, int]] = [
+            (self._get_root_by_lang(lang=language, wordly_len=wordly_len), "", required)
+        ]
+        while stack:
+            node, prefix, missing = stack.pop()
+            if stats is not None:
+                stats.nodes_entered += 1
+
+            level = node.letter_high
+            if level == wordly_len:
+                result.append(prefix)
+                continue
+
+            children: Iterable[LetterNode]
+            if (known := mask[level]) != PATTERN_WILDCARD:
+                child = node.children.get(known)
+                children = [child] if child is not None else []
+            else:
+                children = node.children.values()
 
-        def dfs(node: LetterNode) -> str | None:
-            if node.visited:
-                return None
+            for child in children:
+                letter = child.letter
+                if known == PATTERN_WILDCARD and letter in must_not_contain:
+                    if stats is not None:
+                        stats.pruned_by_exclude_letters += 1
+                    continue
 
-            if not node.children and node.letter_high > 0:
-                word = node.get_full_word()
+                child_missing = missing & ~letter_bits[letter]
+                if child_missing & ~child.letters_mask:
+                    if stats is not None:
+                        stats.pruned_by_min_count += 1
+                    continue
 
-                all_positions_letters = set()
-                for letters in dto.exclude_positions.values():
-                    all_positions_letters.update(letters)
+                stack.append((child, prefix + letter, child_missing))
 
-                if all_positions_letters.issubset(set(word)) and all(
-                        word.count(letter) <= dto.max_count.get(letter, dto.wordly_len)
-                        for letter in set(word)
-                ):
-                    return word
+        result.sort()
+        if stats is not None and self.listener is not None:
+            stats.candidates = len(result)
+            stats.elapsed = time.perf_counter() - start
+            self.listener.on_search("find_by_pattern", query.to_search_dto(), language, stats)
 
-            node.visited = True
+        return result
 
-            if letter := dto.positions_letter.get(node.letter_high):
-                if letter not in node.children:
-                    return None
+    def _run_search(
+            self,
+            method: str,
+            dto: WordlySearchDTO,
+            language: Language,
+            shuffle: bool,
+    ) -> Generator[str, None, None]:
+        if self.listener is None:
+            return self._search(dto, language, shuffle, stats=None)
 
-                reached = dfs(node.children[letter])
+        stats = SearchStats()
+        return observe_words(self._search(dto, language, shuffle, stats), self.listener, method, dto, language, stats)
 
-                if reached:
-                    return reached
+    def _search(
+            self,
+            dto: WordlySearchDTO,
+            language: Language,
+            shuffle: bool,
+            stats: SearchStats | None,
+    ) -> Generator[str, None, None]:
+        start_node = self._get_root_by_lang(lang=language, wordly_len=dto.wordly_len)
+        required = dto.get_required_counts()
+        wordly_len = dto.wordly_len
+        positions_letter = dto.positions_letter
+        max_count = dto.max_count
+        # letters a free position may not take, exclude_positions only narrow their own level
+        forbidden = [
+            dto.exclude_letters | dto.exclude_positions.get(level, set()) for level in range(wordly_len)
+        ]
+        no_letters: Set[str] = set()
+
+        # the current path, updated in place on every step down and back up
+        path: List[str] = []
+        counts: Dict[str, int] = defaultdict(int)
+
+        # explicit stack instead of recursion: node, required letters still missing on its path
+        stack: List[Tuple[LetterNode, int]] = [(start_node, sum(required.values()))]
+        while stack:
+            node, missing = stack.pop()
+            level = node.letter_high
+
+            if level:
+                # back up to the parent of node, then step down into it
+                while len(path) >= level:
+                    counts[path.pop()] -= 1
+                path.append(node.letter)
+                counts[node.letter] += 1
+
+            if stats is not None:
+                stats.nodes_entered += 1
+
+            children: Iterable[LetterNode]
+            if known := positions_letter.get(level):
+                child = node.children.get(known)
+                children = [child] if child is not None else []
+                level_forbidden = no_letters
             else:
-                valid_children = [
-                    child
-                    for child in node.children.values()
-                    if child.letter not in dto.exclude_letters
-                ]
-
-                if dto.exclude_positions.get(node.letter_high):
-                    valid_letters = {
-                                        c.letter for c in valid_children
-                                    } - dto.exclude_positions[node.letter_high]
-
-                    valid_children = [
-                        child for child in valid_children if child.letter in valid_letters
-                    ]
-
-                if dto.max_count:
-                    current_word = node.get_full_word()
-
-                    letter_counts = dto.max_count.items()
-                    valid_children = [
-                        valid_c
-                        for valid_c in valid_children
-                        if not any(
-                            (current_word + valid_c.letter).count(letter) > count
-                            for letter, count in letter_counts
-                        )
-                    ]
-
-                if not valid_children:
-                    return None
-
+                children = node.children.values()
+                level_forbidden = forbidden[level] if level < wordly_len else no_letters
+
+            # positions left below a child, more missing letters than that can not fit
+            remaining = wordly_len - level - 1
+            children_missing: List[Tuple[LetterNode, int]] = []
+            for child in children:
+                letter = child.letter
+                if letter in level_forbidden:
+                    if stats is not None:
+                        if letter in dto.exclude_letters:
+                            stats.pruned_by_exclude_letters += 1
+                        else:
+                            stats.pruned_by_exclude_positions += 1
+                    continue
+
+                count = counts[letter]
+                if max_count and count >= max_count.get(letter, wordly_len):
+                    if stats is not None:
+                        stats.pruned_by_max_count += 1
+                    continue
+
+                child_missing = missing - (count < required.get(letter, 0)) if required else 0
+                if child_missing > remaining:
+                    if stats is not None:
+                        stats.pruned_by_min_count += 1
+                    continue
+
+                children_missing.append((child, child_missing))
+
+            if shuffle:
                 # difference result between runs
-                random.shuffle(valid_children)
+                random.shuffle(children_missing)
 
-                for children in valid_children:
-                    if not children.visited:
-                        reached = dfs(children)
+            if remaining == 0:
+                # children are leaves, with no missing letters left every one of them is a word
+                if stats is not None:
+                    stats.nodes_entered += len(children_missing)
+                    stats.leaves_checked += len(children_missing)
 
-                        if reached:
-                            return reached
+                prefix = "".join(path)
+                for child, _ in children_missing:
+                    yield prefix + child.letter
+                continue
 
-            return None
+            if not shuffle:
+                children_missing.reverse()  # popped in insertion order
 
-        return dfs(start_node)
+            # a shared suffix node is entered again only through another prefix
+            stack.extend(children_missing)
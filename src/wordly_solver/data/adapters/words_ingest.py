@@ -0,0 +1,106 @@
+import gzip
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Set, TextIO, Tuple
+
+from wordly_solver.core.words.constants import ALPHABETS, Language
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_QUOTES = "\"'«»“”„"
+
+
+@dataclass
+class IngestStats:
+    lines: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    rejected: int = 0  # empty, a length nobody asked for or letters outside every alphabet
+
+
+def normalize_word(line: str) -> str:
+    """
+        First CSV field without quotes, lowercase, composed unicode (й, ё stay single letters)
+    """
+    word = line.split(",", 1)[0].strip().strip(_QUOTES).strip()
+    return unicodedata.normalize("NFC", word.lower())
+
+
+def open_words(path: Path) -> TextIO:
+    """
+        gzip-compressed files are detected by content, not by suffix
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(_GZIP_MAGIC))
+
+    if magic == _GZIP_MAGIC:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+class WordsIngestor:
+    """
+        Streams word lists line by line and routes every distinct word into its (language, length) set,
+        so all indexes are filled in one pass. Only accepted words are kept in memory
+    """
+
+    def __init__(
+            self,
+            languages: Iterable[Language] = tuple(Language),
+            lengths: Collection[int] | None = None,  # all lengths when None
+    ) -> None:
+        self.lengths = set(lengths) if lengths is not None else None
+        self.words: Dict[Tuple[Language, int], Set[str]] = {}
+        self.stats = IngestStats()
+
+        # first letter -> languages to check, one dict lookup whatever the number of languages
+        self._languages_by_letter: Dict[str, List[Language]] = {}
+        for language in languages:
+            for letter in ALPHABETS[language]:
+                self._languages_by_letter.setdefault(letter, []).append(language)
+
+    def feed(self, lines: Iterable[str]) -> None:
+        stats = self.stats
+        for line in lines:
+            stats.lines += 1
+            word = normalize_word(line)
+            if not word or (self.lengths is not None and len(word) not in self.lengths):
+                stats.rejected += 1
+                continue
+
+            for language in self._languages_by_letter.get(word[0], ()):
+                if ALPHABETS[language].issuperset(word):
+                    break
+            else:
+                stats.rejected += 1
+                continue
+
+            words = self.words.setdefault((language, len(word)), set())
+            if word in words:
+                stats.duplicates += 1
+                continue
+
+            words.add(word)
+            stats.accepted += 1
+
+    def feed_file(self, path: Path) -> None:
+        with open_words(path) as f:
+            self.feed(f)
+
+
+def load_words(
+        paths: Iterable[Path],
+        languages: Iterable[Language] = tuple(Language),
+        lengths: Collection[int] | None = None,
+) -> Dict[
+    Tuple[Language, int],  # Language, wordly_len
+    Set[str]
+]:
+    """
+        init_words for finders from any number of plain or gzip word lists
+    """
+    ingestor = WordsIngestor(languages=languages, lengths=lengths)
+    for path in paths:
+        ingestor.feed_file(path)
+
+    return ingestor.words
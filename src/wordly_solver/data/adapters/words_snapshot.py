@@ -0,0 +1,156 @@
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple
+
+from wordly_solver.core.words.constants import Language
+
+SNAPSHOT_MAGIC = b"WRDSNAP\0"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# magic, version, language name, wordly_len, alphabet len, words count, source hash, payload crc32
+_HEADER = struct.Struct("<8sH8sHHI32sI")
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def get_source_hash(words: Iterable[str]) -> bytes:
+    return hashlib.sha256("\n".join(sorted(words)).encode()).digest()
+
+
+def get_snapshot_path(directory: Path, language: Language, wordly_len: int) -> Path:
+    return directory / f"{language.name.lower()}_{wordly_len}{SNAPSHOT_SUFFIX}"
+
+
+@dataclass
+class WordsSnapshot:
+    """
+        Read-only view over a memory-mapped snapshot file.
+
+        Layout after the header:
+            alphabet - UTF-32-LE letters, code = index
+            letters - words_count x wordly_len uint8 letter codes, words sorted
+            counts - words_count x alphabet_len uint8 letter counts
+    """
+    language: Language
+    wordly_len: int
+    alphabet: str
+    words_count: int
+    source_hash: bytes
+    letters: memoryview
+    counts: memoryview
+
+
+def _encode(words: Set[str], wordly_len: int) -> Tuple[str, bytes, bytes]:
+    sorted_words = sorted(words)
+    alphabet = "".join(sorted({letter for word in sorted_words for letter in word}))
+    if len(alphabet) > 256:
+        raise SnapshotError("Alphabet does not fit into uint8 codes")
+
+    codes = {letter: code for code, letter in enumerate(alphabet)}
+    letters = bytearray()
+    counts = bytearray(len(sorted_words) * len(alphabet))
+    for idx, word in enumerate(sorted_words):
+        if len(word) != wordly_len:
+            raise SnapshotError(f"Word {word!r} is not {wordly_len} letters long")
+
+        for letter in word:
+            letters.append(codes[letter])
+            counts[idx * len(alphabet) + codes[letter]] += 1
+
+    return alphabet, bytes(letters), bytes(counts)
+
+
+def write_snapshot(path: Path, language: Language, wordly_len: int, words: Set[str]) -> None:
+    alphabet, letters, counts = _encode(words, wordly_len)
+    payload = alphabet.encode("utf-32-le") + letters + counts
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        language.name.encode("ascii"),
+        wordly_len,
+        len(alphabet),
+        len(words),
+        get_source_hash(words),
+        zlib.crc32(payload),
+    )
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    tmp_path.replace(path)  # readers never see a half-written snapshot
+
+
+def build_snapshots(
+        init_words: Dict[
+            Tuple[Language, int],  # Language, wordly_len
+            Set[str]
+        ],
+        directory: Path,
+) -> Dict[Tuple[Language, int], Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths = {}
+    for (language, wordly_len), words in init_words.items():
+        paths[(language, wordly_len)] = path = get_snapshot_path(directory, language, wordly_len)
+        write_snapshot(path, language, wordly_len, words)
+
+    return paths
+
+
+def load_snapshot(
+        path: Path,
+        source_words: Set[str] | None = None,
+        verify_checksum: bool = True,
+) -> WordsSnapshot:
+    """
+        Memory-map a snapshot read-only. Pages are shared between processes through the page cache.
+        source_words - current word list, a snapshot built from another list is rejected as stale
+    """
+    with open(path, "rb") as f:
+        # mmap refuses empty files with a bare ValueError
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise SnapshotError(f"{path}: file is too short")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(buffer)
+
+    (
+        magic, version, language_name, wordly_len, alphabet_len, words_count, source_hash, crc
+    ) = _HEADER.unpack_from(view)
+
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError(f"{path}: not a words snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"{path}: unsupported snapshot version {version}")
+
+    payload = view[_HEADER.size:]
+    letters_start = alphabet_len * 4
+    counts_start = letters_start + words_count * wordly_len
+    if len(payload) != counts_start + words_count * alphabet_len:
+        raise SnapshotError(f"{path}: unexpected payload size")
+
+    if verify_checksum and zlib.crc32(payload) != crc:
+        raise SnapshotError(f"{path}: checksum mismatch")
+
+    if source_words is not None and get_source_hash(source_words) != source_hash:
+        raise SnapshotError(f"{path}: snapshot is stale, source word list changed")
+
+    return WordsSnapshot(
+        language=Language[language_name.rstrip(b"\0").decode("ascii")],
+        wordly_len=wordly_len,
+        alphabet=bytes(payload[:letters_start]).decode("utf-32-le"),
+        words_count=words_count,
+        source_hash=source_hash,
+        letters=payload[letters_start:counts_start],
+        counts=payload[counts_start:],
+    )
@@ -0,0 +1,203 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.usecases.exceptions import IncorrectInputError, SearchBusyError
+from wordly_solver.core.game.usecases.get_exclude_word import GetExcludeWord, GetExcludeWordDTO
+from wordly_solver.core.game.usecases.get_suitable_word import GetSuitableWord, GetSuitableWordDTO
+from wordly_solver.core.user.entities import User
+from wordly_solver.data.adapters.first_words import FirstWordsGateway
+from wordly_solver.data.adapters.search_executor import ThreadSearchExecutor
+from wordly_solver.data.adapters.sqlite_game_stats import SqliteGameStats
+from wordly_solver.data.adapters.static_id_provider import StaticIdProvider
+from wordly_solver.presentation.indexes import WordIndexes, create_indexes_from_env
+from wordly_solver.presentation.api.schemas import (
+    IndexSchema,
+    ReadinessResponse,
+    WordRequest,
+    WordResponse,
+    WordsResponse,
+)
+
+RETRY_AFTER = "1"
+MAX_TOP_K = 50
+
+
+def create_app(
+        indexes: WordIndexes,
+        search_workers: int = 4,
+        max_pending: int = 64,
+        game_stats: SqliteGameStats | None = None,
+) -> FastAPI:
+    """
+        Indexes that are not loaded yet are loaded in the background of every worker,
+        the word endpoints answer 503 until they are ready.
+        game_stats is started and closed with the app, suggestions are recorded into it
+    """
+
+    async def warm_up(app: FastAPI) -> None:
+        try:
+            if not indexes.ready:
+                await asyncio.to_thread(indexes.load)
+            finder = indexes.get_finder()
+        except Exception as e:
+            app.state.load_error = f"{type(e).__name__}: {e}"  # the worker stays up and reports it on /ready
+            return
+
+        # thread pools do not survive a fork, every worker starts its own
+        app.state.search_executor = ThreadSearchExecutor(
+            finder, max_workers=search_workers, max_pending=max_pending
+        )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        app.state.search_executor = None
+        app.state.load_error = None
+        if game_stats is not None:
+            await game_stats.start()
+        warming = asyncio.create_task(warm_up(app))
+        try:
+            yield
+        finally:
+            warming.cancel()
+            if app.state.search_executor is not None:
+                await asyncio.to_thread(app.state.search_executor.close)
+            if game_stats is not None:
+                await game_stats.close()
+
+    app = FastAPI(title="WordlySolver", lifespan=lifespan)
+    app.state.indexes = indexes
+    app.state.game_stats = game_stats
+
+    def get_search_executor(request: Request, body: WordRequest) -> SearchExecutor:
+        executor = request.app.state.search_executor
+        if executor is None:
+            raise HTTPException(
+                status_code=503, detail="Indexes are not loaded yet", headers={"Retry-After": RETRY_AFTER}
+            )
+
+        if (body.get_language(), body.word_len) not in indexes.words_count:
+            raise HTTPException(status_code=404, detail=f"No {body.language.name} words of length {body.word_len}")
+
+        return executor
+
+    def get_first_words(body: WordRequest) -> FirstWordsGateway:
+        language = body.get_language()
+        return FirstWordsGateway({language: indexes.first_words[(language, body.word_len)]})
+
+    @app.exception_handler(IncorrectInputError)
+    async def incorrect_input_handler(request: Request, exc: IncorrectInputError) -> JSONResponse:
+        return JSONResponse(status_code=422, content={"detail": "Every guess must be word_len letters long"})
+
+    @app.exception_handler(SearchBusyError)
+    async def search_busy_handler(request: Request, exc: SearchBusyError) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Too many searches, try again later"},
+            headers={"Retry-After": RETRY_AFTER},
+        )
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/ready", response_model=ReadinessResponse)
+    async def ready(request: Request) -> JSONResponse:
+        state = request.app.state
+        response = ReadinessResponse(
+            ready=state.search_executor is not None,
+            indexes=sorted(
+                (
+                    IndexSchema(language=language, word_len=word_len, words=words)
+                    for (language, word_len), words in indexes.words_count.items()
+                ),
+                key=lambda index: (index.language.name, index.word_len),
+            ),
+            error=state.load_error,
+        )
+        return JSONResponse(status_code=200 if response.ready else 503, content=response.model_dump(mode="json"))
+
+    def get_suitable_word(
+            body: WordRequest,
+            search_executor: SearchExecutor = Depends(get_search_executor),
+            words_gateway: FirstWordsGateway = Depends(get_first_words),
+    ) -> GetSuitableWord:
+        return GetSuitableWord(
+            wordly_solver=indexes.get_finder(),  # loaded, get_search_executor checked it
+            id_provider=StaticIdProvider(User(language=body.get_language())),
+            words_gateway=words_gateway,
+            search_executor=search_executor,
+            ranked=True,
+            game_stats=game_stats,
+        )
+
+    def get_exclude_word(
+            body: WordRequest,
+            search_executor: SearchExecutor = Depends(get_search_executor),
+            words_gateway: FirstWordsGateway = Depends(get_first_words),
+    ) -> GetExcludeWord:
+        return GetExcludeWord(
+            id_provider=StaticIdProvider(User(language=body.get_language())),
+            words_gateway=words_gateway,
+            wordly_finder=indexes.get_finder(),
+            search_executor=search_executor,
+            ranked=True,
+        )
+
+    @app.post("/words/suitable", response_model=WordResponse)
+    async def suitable_word(body: WordRequest, usecase: GetSuitableWord = Depends(get_suitable_word)) -> WordResponse:
+        word = await usecase.execute(GetSuitableWordDTO(current_words=body.to_wordly_words(), word_len=body.word_len))
+        return WordResponse(word=word)
+
+    @app.post("/words/suitable/top", response_model=WordsResponse)
+    async def suitable_words_top(
+            body: WordRequest,
+            k: int = Query(5, ge=1, le=MAX_TOP_K),
+            usecase: GetSuitableWord = Depends(get_suitable_word),
+    ) -> WordsResponse:
+        words = await usecase.execute_top(
+            GetSuitableWordDTO(current_words=body.to_wordly_words(), word_len=body.word_len), k=k
+        )
+        return WordsResponse(words=words)
+
+    @app.post("/words/exclude", response_model=WordResponse)
+    async def exclude_word(body: WordRequest, usecase: GetExcludeWord = Depends(get_exclude_word)) -> WordResponse:
+        word = await usecase.execute(GetExcludeWordDTO(current_words=body.to_wordly_words(), word_len=body.word_len))
+        return WordResponse(word=word)
+
+    @app.post("/words/exclude/top", response_model=WordsResponse)
+    async def exclude_words_top(
+            body: WordRequest,
+            k: int = Query(5, ge=1, le=MAX_TOP_K),
+            usecase: GetExcludeWord = Depends(get_exclude_word),
+    ) -> WordsResponse:
+        words = await usecase.execute_top(
+            GetExcludeWordDTO(current_words=body.to_wordly_words(), word_len=body.word_len), k=k
+        )
+        return WordsResponse(words=words)
+
+    return app
+
+
+def create_app_from_env() -> FastAPI:
+    """
+        Indexes as in create_indexes_from_env and
+        WORDLY_PRELOAD - 0 to load in every worker instead of at import
+        WORDLY_SEARCH_WORKERS - search threads per worker
+        WORDLY_STATS_DB - SQLite file for game stats, not collected when empty
+    """
+    indexes = create_indexes_from_env()
+    if os.environ.get("WORDLY_PRELOAD", "1") != "0":
+        indexes.load()
+
+    stats_db = os.environ.get("WORDLY_STATS_DB")
+    return create_app(
+        indexes,
+        search_workers=int(os.environ.get("WORDLY_SEARCH_WORKERS", "4")),
+        game_stats=SqliteGameStats(stats_db) if stats_db else None,
+    )
@@ -0,0 +1,9 @@
+"""
+    Indexes are built at import, so with --preload the master builds them once and the workers share them:
+
+    WORDLY_WORDS=words.csv gunicorn --preload -w 4 -k uvicorn.workers.UvicornWorker \
+        wordly_solver.presentation.api.main:app
+"""
+from wordly_solver.presentation.api.app import create_app_from_env
+
+app = create_app_from_env()
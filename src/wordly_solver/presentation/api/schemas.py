@@ -0,0 +1,66 @@
+from typing import Annotated, Any, List, Literal
+
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, WithJsonSchema
+
+from wordly_solver.core.game.entities import WordlyLetter, WordlyLetterState, WordlyWord
+from wordly_solver.core.words.constants import Language
+
+
+def _parse_language(value: Any) -> Language:
+    if isinstance(value, Language):
+        return value
+    if isinstance(value, str) and value in Language.__members__:
+        return Language[value]
+    raise ValueError(f"language must be one of {', '.join(Language.__members__)}")
+
+
+# Language by its name ("RU", "ENG") in requests, responses and the schema
+type LanguageName = Annotated[
+    Language,
+    PlainValidator(_parse_language),
+    PlainSerializer(lambda language: language.name, return_type=str),
+    WithJsonSchema({"type": "string", "enum": list(Language.__members__)}),
+]
+
+
+class LetterSchema(BaseModel):
+    value: str = Field(min_length=1, max_length=1)
+    state: Literal["correct", "wrong_place", "incorrect"]
+
+
+class WordRequest(BaseModel):
+    language: LanguageName
+    word_len: int = Field(gt=0)
+    current_words: List[List[LetterSchema]] = []  # guesses so far with the colours the game gave them
+
+    def get_language(self) -> Language:
+        return self.language
+
+    def to_wordly_words(self) -> List[WordlyWord]:
+        return [
+            {
+                idx: WordlyLetter(value=letter.value.lower(), state=WordlyLetterState[letter.state])
+                for idx, letter in enumerate(word)
+            }
+            for word in self.current_words
+        ]
+
+
+class WordResponse(BaseModel):
+    word: str | None  # None when no word fits the guesses
+
+
+class WordsResponse(BaseModel):
+    words: List[str]  # best first, empty when no word fits the guesses
+
+
+class IndexSchema(BaseModel):
+    language: LanguageName
+    word_len: int
+    words: int
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool
+    indexes: List[IndexSchema] = []
+    error: str | None = None
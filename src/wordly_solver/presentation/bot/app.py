@@ -0,0 +1,220 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+
+from aiogram import Dispatcher, F, Router
+from aiogram.filters import Command, CommandObject, CommandStart, ExceptionTypeFilter
+from aiogram.types import ErrorEvent, Message, TelegramObject
+
+from wordly_solver.core.base.exception import DomainError
+from wordly_solver.core.game.entities import WordlyLetter, WordlyLetterState, WordlyWord
+from wordly_solver.core.game.ports.game_stats import GameStats
+from wordly_solver.core.game.ports.history_store import GameHistoryStore
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.session import GameHistory
+from wordly_solver.core.game.usecases.exceptions import SearchBusyError
+from wordly_solver.core.game.usecases.get_exclude_word import GetExcludeWord, GetExcludeWordDTO
+from wordly_solver.core.game.usecases.get_suitable_word import GetSuitableWord, GetSuitableWordDTO
+from wordly_solver.core.user.entities import User
+from wordly_solver.core.words.constants import ALPHABETS, Language
+from wordly_solver.data.adapters.first_words import FirstWordsGateway
+from wordly_solver.data.adapters.static_id_provider import StaticIdProvider
+from wordly_solver.data.adapters.words_ingest import normalize_word
+from wordly_solver.presentation.indexes import WordIndexes
+
+DEFAULT_WORD_LEN = 5
+
+# digits are the base-3 digits of feedback patterns, squares are what games share
+FEEDBACK_STATES: Dict[str, WordlyLetterState] = {
+    "0": WordlyLetterState.incorrect,
+    "⬜": WordlyLetterState.incorrect,
+    "⬛": WordlyLetterState.incorrect,
+    "1": WordlyLetterState.wrong_place,
+    "🟨": WordlyLetterState.wrong_place,
+    "2": WordlyLetterState.correct,
+    "🟩": WordlyLetterState.correct,
+}
+LANGUAGE_CODES: Dict[str, Language] = {"ru": Language.RU, "en": Language.ENG}
+
+HELP_TEXT = (
+    "Сыграйте слово в игре и пришлите его с цветами букв: crane 02100 или crane ⬜🟨🟩⬜⬜\n"
+    "0 ⬜ - буквы нет, 1 🟨 - не на своём месте, 2 🟩 - на своём месте\n\n"
+    "/new [длина] [ru|en] - новая игра\n"
+    "/exclude - слово из ещё не использованных букв"
+)
+NO_WORDS_TEXT = "Нет словаря для такой длины слова"
+NO_GAME_TEXT = "Сначала начните игру: /new или пришлите слово с цветами"
+NOT_FOUND_TEXT = "Подходящих слов нет"
+BUSY_TEXT = "Слишком много запросов, попробуйте через пару секунд"
+
+
+class GuessFormatError(DomainError):
+    pass
+
+
+def detect_language(word: str) -> Language:
+    for language, alphabet in ALPHABETS.items():
+        if alphabet.issuperset(word):
+            return language
+
+    raise GuessFormatError(f"Слово {word} не похоже ни на один язык")
+
+
+def parse_guess(text: str) -> Tuple[Language, WordlyWord]:
+    """
+        "crane 02100" or "crane ⬜🟨🟩⬜⬜"
+    """
+    parts = text.split(maxsplit=1)
+    if len(parts) != 2:
+        raise GuessFormatError("Пришлите слово и цвета букв через пробел: crane 02100")
+
+    word = normalize_word(parts[0])
+    marks = "".join(parts[1].split()).replace("\ufe0f", "")  # emoji variation selectors
+    if len(marks) != len(word) or not all(mark in FEEDBACK_STATES for mark in marks):
+        raise GuessFormatError(f"Нужно {len(word)} цветов из 0 1 2 или ⬜ 🟨 🟩")
+
+    return detect_language(word), {
+        idx: WordlyLetter(value=letter, state=FEEDBACK_STATES[mark])
+        for idx, (letter, mark) in enumerate(zip(word, marks))
+    }
+
+
+class _ChatLocks:
+    """
+        Updates of one chat are handled one at a time, different chats concurrently
+    """
+
+    def __init__(self) -> None:
+        self._locks: Dict[int, Tuple[asyncio.Lock, List[int]]] = {}  # chat_id -> lock, [holders and waiters]
+
+    @asynccontextmanager
+    async def hold(self, chat_id: int) -> AsyncIterator[None]:
+        lock, users = self._locks.setdefault(chat_id, (asyncio.Lock(), [0]))
+        users[0] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            users[0] -= 1
+            if not users[0]:
+                del self._locks[chat_id]
+
+
+def create_dispatcher(
+        indexes: WordIndexes,
+        search_executor: SearchExecutor,  # finder calls never run on the event loop
+        history_store: GameHistoryStore,
+        game_stats: GameStats | None = None,  # started and closed by the caller
+) -> Dispatcher:
+    """
+        Polling with handle_as_tasks (the default) handles every update in its own task,
+        updates of one chat still wait for each other. Indexes must be loaded
+    """
+    finder = indexes.get_finder()
+    router = Router()
+    chat_locks = _ChatLocks()
+
+    @router.message.outer_middleware
+    async def hold_chat(
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any],
+    ) -> Any:
+        if not isinstance(event, Message):
+            return await handler(event, data)
+
+        async with chat_locks.hold(event.chat.id):
+            return await handler(event, data)
+
+    def has_words(language: Language, word_len: int) -> bool:
+        return (language, word_len) in indexes.words_count
+
+    def get_first_words(language: Language, word_len: int) -> FirstWordsGateway:
+        return FirstWordsGateway({language: indexes.first_words[(language, word_len)]})
+
+    async def suggest(chat_id: int, history: GameHistory) -> str:
+        usecase = GetSuitableWord(
+            wordly_solver=finder,
+            id_provider=StaticIdProvider(User(language=history.language, id=chat_id)),
+            words_gateway=get_first_words(history.language, history.word_len),
+            search_executor=search_executor,
+            ranked=True,
+            game_stats=game_stats,
+        )
+        word = await usecase.execute(GetSuitableWordDTO(current_words=history.words, word_len=history.word_len))
+        return word or NOT_FOUND_TEXT
+
+    @router.message(CommandStart())
+    @router.message(Command("help"))
+    async def help_handler(message: Message) -> None:
+        await message.answer(HELP_TEXT)
+
+    @router.message(Command("new"))
+    async def new_game_handler(message: Message, command: CommandObject) -> None:
+        user_language = message.from_user.language_code if message.from_user else None
+        language = Language.RU if user_language == "ru" else Language.ENG
+        word_len = DEFAULT_WORD_LEN
+        for arg in (command.args or "").lower().split():
+            if arg.isdigit():
+                word_len = int(arg)
+            elif arg in LANGUAGE_CODES:
+                language = LANGUAGE_CODES[arg]
+
+        if not has_words(language, word_len):
+            await message.answer(NO_WORDS_TEXT)
+            return
+
+        history = GameHistory(language=language, word_len=word_len)
+        await history_store.save(message.chat.id, history)
+        await message.answer(await suggest(message.chat.id, history))
+
+    @router.message(Command("exclude"))
+    async def exclude_handler(message: Message) -> None:
+        history = await history_store.get(message.chat.id)
+        if history is None:
+            await message.answer(NO_GAME_TEXT)
+            return
+
+        usecase = GetExcludeWord(
+            id_provider=StaticIdProvider(User(language=history.language)),
+            words_gateway=get_first_words(history.language, history.word_len),
+            wordly_finder=finder,
+            search_executor=search_executor,
+            ranked=True,
+        )
+        word = await usecase.execute(GetExcludeWordDTO(current_words=history.words, word_len=history.word_len))
+        await message.answer(word or NOT_FOUND_TEXT)
+
+    @router.message(F.text)
+    async def guess_handler(message: Message) -> None:
+        if message.text is None:  # F.text already skips these, the check narrows the type
+            return
+
+        try:
+            language, guess = parse_guess(message.text)
+        except GuessFormatError as e:
+            await message.answer(str(e))
+            return
+
+        word_len = len(guess)
+        if not has_words(language, word_len):
+            await message.answer(NO_WORDS_TEXT)
+            return
+
+        stored = await history_store.get(message.chat.id)
+        if stored is None or stored.language != language or stored.word_len != word_len:
+            stored = GameHistory(language=language, word_len=word_len)  # a guess of another game starts it
+
+        # the stored game changes only once the suggestion for the new guess succeeded
+        history = GameHistory(language=language, word_len=word_len, words=[*stored.words, guess])
+        answer = await suggest(message.chat.id, history)
+        await history_store.save(message.chat.id, history)
+        await message.answer(answer)
+
+    @router.error(ExceptionTypeFilter(SearchBusyError), F.update.message.as_("message"))
+    async def busy_handler(event: ErrorEvent, message: Message) -> None:
+        await message.answer(BUSY_TEXT)
+
+    dispatcher = Dispatcher()
+    dispatcher.include_router(router)
+    return dispatcher
@@ -0,0 +1,53 @@
+"""
+    BOT_TOKEN=... WORDLY_WORDS=words.csv python -m wordly_solver.presentation.bot.main
+
+    Indexes as in create_indexes_from_env and
+    TELEGRAM_API_URL - local Bot API server or a stand-in, api.telegram.org when empty
+    WORDLY_SEARCH_WORKERS - search threads
+    WORDLY_MAX_UPDATES - updates handled at once
+    WORDLY_CHAT_IDLE - seconds a game is kept after its last message
+    WORDLY_STATS_DB - SQLite file for game stats, not collected when empty
+"""
+import asyncio
+import os
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+
+from wordly_solver.data.adapters.packed_history_store import PackedGameHistoryStore
+from wordly_solver.data.adapters.search_executor import ThreadSearchExecutor
+from wordly_solver.data.adapters.sqlite_game_stats import SqliteGameStats
+from wordly_solver.presentation.bot.app import create_dispatcher
+from wordly_solver.presentation.indexes import create_indexes_from_env
+
+
+async def main() -> None:
+    indexes = create_indexes_from_env()
+    await asyncio.to_thread(indexes.load)
+
+    search_executor = ThreadSearchExecutor(
+        indexes.get_finder(), max_workers=int(os.environ.get("WORDLY_SEARCH_WORKERS", "4"))
+    )
+    history_store = PackedGameHistoryStore(max_idle=float(os.environ.get("WORDLY_CHAT_IDLE", "86400")))
+    stats_db = os.environ.get("WORDLY_STATS_DB")
+    game_stats = SqliteGameStats(stats_db) if stats_db else None
+    if game_stats is not None:
+        await game_stats.start()
+
+    api_url = os.environ.get("TELEGRAM_API_URL")
+    session = AiohttpSession(api=TelegramAPIServer.from_base(api_url)) if api_url else None
+    bot = Bot(token=os.environ["BOT_TOKEN"], session=session)
+
+    try:
+        await create_dispatcher(indexes, search_executor, history_store, game_stats).start_polling(
+            bot, tasks_concurrency_limit=int(os.environ.get("WORDLY_MAX_UPDATES", "256"))
+        )
+    finally:
+        search_executor.close()
+        if game_stats is not None:
+            await game_stats.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
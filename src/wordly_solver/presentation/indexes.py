@@ -0,0 +1,82 @@
+import gc
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Set, Tuple
+
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.finder_factory import FinderEngine, create_wordly_finder
+from wordly_solver.data.adapters.first_words import get_first_word
+from wordly_solver.data.adapters.words_ingest import load_words
+
+type InitWords = Dict[
+    Tuple[Language, int],  # Language, wordly_len
+    Set[str]
+]
+
+
+class WordIndexes:
+    """
+        One finder over every (language, length) index and the opening word of each, built once.
+
+        load() in the master process before the server forks (gunicorn --preload): the built objects
+        are moved out of gc tracking with gc.freeze(), so collections in the workers never write
+        to their pages and copy-on-write keeps them shared instead of copied per worker
+    """
+
+    def __init__(
+            self,
+            words_loader: Callable[[], InitWords],
+            engine: FinderEngine = FinderEngine.TREE,
+    ) -> None:
+        self.words_loader = words_loader
+        self.engine = engine
+
+        self.finder: WordlyFinder | None = None
+        self.first_words: Dict[Tuple[Language, int], str] = {}
+        self.words_count: Dict[Tuple[Language, int], int] = {}
+
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.finder is not None
+
+    def get_finder(self) -> WordlyFinder:
+        if self.finder is None:
+            raise RuntimeError("Word indexes are not loaded, call load() first")
+        return self.finder
+
+    def load(self) -> None:
+        """
+            Idempotent, concurrent callers wait for the first one
+        """
+        with self._lock:
+            if self.finder is not None:
+                return
+
+            init_words = {key: words for key, words in self.words_loader().items() if words}
+            finder = create_wordly_finder(self.engine, init_words)
+            self.first_words = {key: get_first_word(words) for key, words in init_words.items()}
+            self.words_count = {key: len(words) for key, words in init_words.items()}
+            del init_words  # the finder keeps what it needs, the word sets are garbage now
+
+            gc.collect()
+            gc.freeze()
+            self.finder = finder  # published last, readers check ready first
+
+
+def create_indexes_from_env() -> WordIndexes:
+    """
+        WORDLY_WORDS - word lists separated by os.pathsep, plain or gzip
+        WORDLY_LENGTHS - comma separated word lengths to index, all when empty
+        WORDLY_ENGINE - tree, bitset or matrix
+    """
+    paths = [Path(path) for path in os.environ.get("WORDLY_WORDS", "").split(os.pathsep) if path]
+    lengths = [int(length) for length in os.environ.get("WORDLY_LENGTHS", "").split(",") if length]
+
+    return WordIndexes(
+        words_loader=lambda: load_words(paths, lengths=lengths or None),
+        engine=FinderEngine(os.environ.get("WORDLY_ENGINE", FinderEngine.TREE.value)),
+    )
@@ -0,0 +1,129 @@
+from collections import defaultdict
+from unittest.mock import Mock
+
+import pytest
+
+from tests.adapters.helpers import TEST_WORDS, check_iter_count_candidates
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.cached_finder import CachedWordlyFinder, CacheStats
+from wordly_solver.data.adapters.wordly_bitset import BitsetWordsIndex
+
+
+def _dto(**kwargs) -> WordlySearchDTO:
+    return WordlySearchDTO(
+        exclude_letters=kwargs.get("exclude_letters", set()),
+        positions_letter=kwargs.get("positions_letter", {}),
+        exclude_positions=kwargs.get("exclude_positions", {}),
+        max_count=kwargs.get("max_count", {}),
+        wordly_len=kwargs.get("wordly_len", 5),
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def finder() -> BitsetWordsIndex:
+    finder = BitsetWordsIndex(TEST_WORDS)
+    finder.get_candidates = Mock(wraps=finder.get_candidates)  # type: ignore
+    return finder
+
+
+def test_canonical_key():
+    first = _dto(
+        exclude_letters={"a", "b"},
+        positions_letter={2: "t", 0: "m"},
+        exclude_positions=defaultdict(set, {1: {"u", "e"}, 3: set()}),
+        max_count={"m": 1, "t": 1},
+    )
+    second = _dto(
+        exclude_letters={"b", "a"},
+        positions_letter={0: "m", 2: "t"},
+        exclude_positions={1: {"e", "u"}},
+        max_count={"t": 1, "m": 1},
+    )
+
+    assert first.canonical_key() == second.canonical_key()
+    assert first.canonical_key() != _dto(exclude_letters={"a"}).canonical_key()
+    assert first.canonical_key() != _dto(**{**second.__dict__, "wordly_len": 4}).canonical_key()
+
+
+def test_cached_finder_hits(finder: BitsetWordsIndex):
+    cached = CachedWordlyFinder(finder)
+    dto = _dto(exclude_letters={"a"})
+    candidates = finder.get_candidates(dto, Language.ENG)
+    finder.get_candidates.reset_mock()
+
+    results = {cached.wordly_search(dto, Language.ENG) for _ in range(100)}
+    assert cached.get_candidates(_dto(exclude_letters={"a"}), Language.ENG) == candidates
+
+    assert len(results) > 1
+    assert results <= set(candidates)
+    finder.get_candidates.assert_called_once()
+    assert cached.stats == CacheStats(hits=100, misses=1)
+
+    # same constraints in another language are another entry
+    assert cached.wordly_search(dto, Language.RU) in TEST_WORDS[(Language.RU, 5)]
+    assert cached.stats.misses == 2
+
+
+def test_cached_finder_lru_eviction(finder: BitsetWordsIndex):
+    cached = CachedWordlyFinder(finder, max_size=2)
+    first, second, third = _dto(), _dto(exclude_letters={"a"}), _dto(exclude_letters={"b"})
+
+    cached.get_candidates(first, Language.ENG)
+    cached.get_candidates(second, Language.ENG)
+    cached.get_candidates(first, Language.ENG)
+    cached.get_candidates(third, Language.ENG)  # evicts second
+
+    assert len(cached) == 2
+    assert cached.stats == CacheStats(hits=1, misses=3, evictions=1)
+
+    cached.get_candidates(first, Language.ENG)
+    cached.get_candidates(second, Language.ENG)
+    assert cached.stats == CacheStats(hits=2, misses=4, evictions=2)
+
+
+def test_cached_finder_ttl(finder: BitsetWordsIndex):
+    clock = FakeClock()
+    cached = CachedWordlyFinder(finder, ttl=10, clock=clock)
+    dto = _dto()
+
+    cached.get_candidates(dto, Language.ENG)
+    clock.now = 10
+    cached.get_candidates(dto, Language.ENG)
+    clock.now = 10.5
+    cached.get_candidates(dto, Language.ENG)
+
+    assert cached.stats == CacheStats(hits=1, misses=2, expirations=1)
+    assert finder.get_candidates.call_count == 2
+
+
+def test_cached_finder_empty_result(finder: BitsetWordsIndex):
+    cached = CachedWordlyFinder(finder)
+    dto = _dto(positions_letter={0: "z"})
+
+    assert cached.wordly_search(dto, Language.ENG) is None
+    assert cached.wordly_search(dto, Language.ENG) is None
+    assert cached.stats == CacheStats(hits=1, misses=1)
+
+
+def test_cached_finder_iter_count_candidates(finder: BitsetWordsIndex):
+    check_iter_count_candidates(CachedWordlyFinder(finder))
+
+
+def test_cached_finder_ranks_with_wrapped_finder(finder: BitsetWordsIndex):
+    cached = CachedWordlyFinder(finder)
+    finder.get_top_candidates = Mock(return_value=["cases"])  # type: ignore
+    finder.get_top_exclude_words = Mock(return_value=["light"])  # type: ignore
+
+    assert cached.get_top_candidates(_dto(), Language.ENG, k=1) == ["cases"]
+    assert cached.get_top_exclude_words({"a"}, Language.ENG, 5, k=1) == ["light"]
+    finder.get_top_candidates.assert_called_once_with(_dto(), Language.ENG, 1)
+    finder.get_top_exclude_words.assert_called_once_with({"a"}, Language.ENG, 5, 1)
@@ -0,0 +1,25 @@
+import pytest
+
+from wordly_solver.core.user.entities import User
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.first_words import FirstWordsGateway, get_first_word
+from wordly_solver.data.adapters.static_id_provider import StaticIdProvider
+
+
+def test_get_first_word():
+    # "a", "e" and "s" are in most words, "arose" has all of them
+    assert get_first_word(["arose", "sassy", "eases", "gamer", "zebra"]) == "arose"
+    assert get_first_word(["bb", "aa"]) == "aa"  # ties go to the first word in order
+
+
+@pytest.mark.asyncio
+async def test_first_words_gateway():
+    gateway = FirstWordsGateway({Language.ENG: "crane", Language.RU: "порок"})
+
+    assert await gateway.get_first_word(Language.RU) == "порок"
+    assert await gateway.get_first_word(Language.ENG) == "crane"
+
+
+def test_static_id_provider():
+    user = User(language=Language.RU, id=42)
+    assert StaticIdProvider(user).get_current_user() is user
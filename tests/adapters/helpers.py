@@ -0,0 +1,183 @@
+import random
+
+from wordly_solver.core.game.ports.wordly_finder import PATTERN_WILDCARD, PatternQueryDTO, WordlySearchDTO, WordlyFinder
+from wordly_solver.core.game.ranking import LetterFrequencies
+from wordly_solver.core.words.constants import Language
+
+TEST_ENG_WORDS = {
+    "abaca",
+    "aband",
+    "adeem",
+    "aleft",
+    "ascon",
+    "asess",
+    "babes",
+    "bases",
+    "begum",
+    "begus",
+    "birls",
+    "booms",
+    "yetts",
+    "valve",
+    "verst",
+    "vower",
+    "weals",
+    "wifes",
+    "muted",
+    "cutey",
+    "fumes",
+    "gauge",
+    "lutes",
+}
+
+TEST_RU_WORDS = {
+    "океан",
+    "будка",
+    "кошка",
+    "питон"
+}
+
+TEST_RU_WORDS4 = {
+    "пиво",
+    "вода",
+}
+
+TEST_WORDS = {
+    (Language.ENG, 5): TEST_ENG_WORDS,
+    (Language.RU, 5): TEST_RU_WORDS,
+    (Language.RU, 4): TEST_RU_WORDS4
+}
+
+
+def matches(word: str, dto: WordlySearchDTO) -> bool:
+    for idx, letter in enumerate(word):
+        if fixed := dto.positions_letter.get(idx):
+            if letter != fixed:
+                return False
+        elif letter in dto.exclude_letters or letter in dto.exclude_positions.get(idx, set()):
+            return False
+
+    return all(
+        letter in word for letters in dto.exclude_positions.values() for letter in letters
+    ) and all(
+        word.count(letter) <= dto.max_count.get(letter, dto.wordly_len) for letter in set(word)
+    ) and all(
+        word.count(letter) >= count for letter, count in dto.min_count.items()
+    )
+
+
+def random_dto(rnd: random.Random, words: list[str]) -> WordlySearchDTO:
+    answer = rnd.choice(words)
+    positions_letter = {
+        idx: letter for idx, letter in enumerate(answer) if rnd.random() < 0.3
+    }
+    exclude_positions = {
+        idx: {rnd.choice(answer)} for idx in range(len(answer)) if rnd.random() < 0.2
+    }
+    exclude_positions = {
+        idx: letters for idx, letters in exclude_positions.items() if idx not in positions_letter
+    }
+    alphabet = sorted({letter for word in words for letter in word} - set(answer))
+    return WordlySearchDTO(
+        exclude_letters=set(rnd.sample(alphabet, k=min(3, len(alphabet)))),
+        positions_letter=positions_letter,
+        exclude_positions=exclude_positions,
+        max_count={letter: answer.count(letter) for letter in set(answer) if rnd.random() < 0.3},
+        wordly_len=len(answer),
+        min_count={letter: answer.count(letter) for letter in set(answer) if rnd.random() < 0.3},
+    )
+
+
+def check_wordly_search_many(finder: WordlyFinder):
+    rnd = random.Random(11)
+    queries = []
+    for (language, _), words in TEST_WORDS.items():
+        for _ in range(20):
+            queries.append((random_dto(rnd, sorted(words)), language))
+    queries += queries[:10]  # repeated constraints
+
+    results = finder.wordly_search_many(queries)
+
+    assert len(results) == len(queries)
+    for (dto, language), result in zip(queries, results):
+        candidates = finder.get_candidates(dto, language)
+        assert result in candidates if candidates else result is None
+
+
+def check_iter_count_candidates(finder: WordlyFinder):
+    rnd = random.Random(13)
+    for (language, wordly_len), words in TEST_WORDS.items():
+        dtos = [random_dto(rnd, sorted(words)) for _ in range(20)]
+        # known positions only
+        dtos += [
+            WordlySearchDTO(
+                exclude_letters=set(),
+                positions_letter=positions_letter,
+                exclude_positions={},
+                max_count={},
+                wordly_len=wordly_len,
+            )
+            for positions_letter in ({}, {0: "a"}, {1: "о"}, {1: "e", 3: "s"}, {4: "z"})
+        ]
+
+        for dto in dtos:
+            candidates = finder.get_candidates(dto, language)
+            assert sorted(finder.iter_candidates(dto, language)) == candidates
+            assert finder.count_candidates(dto, language) == len(candidates)
+
+
+def check_find_by_pattern(finder: WordlyFinder):
+    rnd = random.Random(7)
+    for (language, wordly_len), words in TEST_WORDS.items():
+        sorted_words = sorted(words)
+        alphabet = sorted({letter for word in words for letter in word})
+        for _ in range(40):
+            answer = rnd.choice(sorted_words)
+            query = PatternQueryDTO(
+                mask="".join(letter if rnd.random() < 0.3 else PATTERN_WILDCARD for letter in answer),
+                must_contain=set(rnd.sample(answer, k=rnd.randint(0, 2))),
+                must_not_contain=set(rnd.sample(alphabet, k=2)) - set(answer),
+            )
+
+            assert finder.find_by_pattern(query, language) == [word for word in sorted_words if query.matches(word)]
+
+        query = PatternQueryDTO(mask=PATTERN_WILDCARD * wordly_len, must_contain={"ъ", "q"})
+        assert finder.find_by_pattern(query, language) == []
+
+
+def brute_force_top(
+        words: list[str], scored: list[str], wordly_len: int, k: int, ignore: set[str] = frozenset()
+) -> list[str]:
+    frequencies = LetterFrequencies.from_words(words, wordly_len)
+    return sorted(scored, key=lambda word: (-frequencies.get_split_score(word, ignore), word))[:k]
+
+
+def check_top_words(finder: WordlyFinder):
+    rnd = random.Random(7)
+    for (language, wordly_len), words in TEST_WORDS.items():
+        sorted_words = sorted(words)
+        for _ in range(20):
+            dto = random_dto(rnd, sorted_words)
+            candidates = [word for word in sorted_words if matches(word, dto)]
+            assert finder.get_top_candidates(dto, language, k=3) == brute_force_top(
+                candidates, candidates, wordly_len, k=3
+            )
+            shuffled = rnd.sample(candidates, len(candidates))  # sessions keep candidates in any order
+            assert finder.rank_words(shuffled, language, wordly_len, k=3) == brute_force_top(
+                candidates, candidates, wordly_len, k=3
+            )
+
+            forbidden = set(rnd.choice(sorted_words))
+            hits = [sum(letter in forbidden for letter in word) for word in sorted_words]
+            fewest = [word for word, word_hits in zip(sorted_words, hits) if word_hits == min(hits)]
+            assert finder.get_fewest_hits_words(forbidden, language, wordly_len) == fewest
+            assert finder.get_top_exclude_words(forbidden, language, wordly_len, k=3) == brute_force_top(
+                sorted_words, fewest, wordly_len, k=3, ignore=forbidden
+            )
+
+        everything = WordlySearchDTO(
+            exclude_letters=set(), positions_letter={}, exclude_positions={}, max_count={}, wordly_len=wordly_len
+        )
+        assert finder.get_top_candidates(everything, language, k=5) == brute_force_top(
+            sorted_words, sorted_words, wordly_len, k=5
+        )
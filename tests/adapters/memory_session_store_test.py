@@ -0,0 +1,22 @@
+import pytest
+
+from wordly_solver.core.game.session import GameSession
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.memory_session_store import MemoryGameSessionStore
+
+
+@pytest.mark.asyncio
+async def test_memory_session_store():
+    store = MemoryGameSessionStore(max_sessions=2)
+    first = GameSession(language=Language.ENG, word_len=5)
+    second = GameSession(language=Language.ENG, word_len=4)
+    third = GameSession(language=Language.RU, word_len=5)
+
+    await store.save(1, first)
+    await store.save(1, second)
+    assert await store.get(1, 5) is first  # now the most recently used
+    await store.save(2, third)
+
+    assert await store.get(1, 5) is first
+    assert await store.get(1, 4) is None
+    assert await store.get(2, 5) is third
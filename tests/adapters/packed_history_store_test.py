@@ -0,0 +1,86 @@
+from typing import List
+
+import pytest
+
+from wordly_solver.core.game.entities import WordlyLetter, WordlyWord
+from wordly_solver.core.game.feedback import get_feedback
+from wordly_solver.core.game.session import GameHistory
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.packed_history_store import PackedGameHistoryStore, pack_words, unpack_words
+
+
+def _words(guesses: List[str], answer: str) -> List[WordlyWord]:
+    return [
+        {
+            idx: WordlyLetter(value=letter, state=state)
+            for idx, (letter, state) in enumerate(zip(guess, get_feedback(guess, answer)))
+        }
+        for guess in guesses
+    ]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pack_words():
+    words = _words(["вода", "сода", "пиво"], "пиво")
+
+    letters, states = pack_words(words, 4)
+
+    assert letters == "водасодапиво"
+    assert states == bytes([1, 1, 0, 0, 0, 1, 0, 0, 2, 2, 2, 2])
+    assert unpack_words(letters, states, 4) == words
+    assert unpack_words(*pack_words([], 4), 4) == []
+
+
+@pytest.mark.asyncio
+async def test_packed_history_store():
+    store = PackedGameHistoryStore()
+    history = GameHistory(language=Language.ENG, word_len=5, words=_words(["crane", "slate"], "bases"))
+
+    await store.save(1, history)
+    history.words.append(_words(["light"], "bases")[0])  # stored copy is not changed afterwards
+
+    restored = await store.get(1)
+    assert restored == GameHistory(language=Language.ENG, word_len=5, words=_words(["crane", "slate"], "bases"))
+    assert await store.get(2) is None
+
+    await store.delete(1)
+    await store.delete(1)
+    assert await store.get(1) is None
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_packed_history_store_evicts_idle_chats():
+    clock = FakeClock()
+    store = PackedGameHistoryStore(max_idle=10, clock=clock)
+    for chat_id in range(3):
+        await store.save(chat_id, GameHistory(language=Language.RU, word_len=4))
+
+    clock.now = 8
+    assert await store.get(0) is not None  # touched, idle again from now
+
+    clock.now = 15
+    assert await store.get(1) is None
+    assert len(store) == 1
+
+    clock.now = 17
+    assert await store.get(0) == GameHistory(language=Language.RU, word_len=4)
+
+
+@pytest.mark.asyncio
+async def test_packed_history_store_max_chats():
+    store = PackedGameHistoryStore(max_chats=2)
+    for chat_id in range(3):
+        await store.save(chat_id, GameHistory(language=Language.ENG, word_len=5))
+        await store.get(0)
+
+    assert await store.get(1) is None
+    assert await store.get(0) is not None
+    assert await store.get(2) is not None
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tests.adapters.helpers import TEST_WORDS  # noqa: E402
+from wordly_solver.core.game.feedback import encode_feedback, get_feedback  # noqa: E402
+from wordly_solver.core.words.constants import Language  # noqa: E402
+from wordly_solver.data.adapters import pattern_matrix  # noqa: E402
+from wordly_solver.data.adapters.pattern_matrix import PatternMatrixFinder, get_entropies  # noqa: E402
+
+
+def _code(guess: str, answer: str) -> int:
+    return encode_feedback(get_feedback(guess, answer))
+
+
+@pytest.fixture(scope="module")
+def pattern_finder() -> PatternMatrixFinder:
+    return PatternMatrixFinder(TEST_WORDS)
+
+
+@pytest.mark.parametrize("key", list(TEST_WORDS))
+def test_patterns_same_as_feedback(pattern_finder: PatternMatrixFinder, key: tuple[Language, int]):
+    words = sorted(TEST_WORDS[key])
+    patterns = pattern_finder.get_patterns(*key)
+
+    assert patterns.dtype == np.uint8
+    assert patterns.tolist() == [[_code(guess, answer) for answer in words] for guess in words]
+
+
+def test_pattern_matrix_cache(tmp_path: Path):
+    finder = PatternMatrixFinder(TEST_WORDS, cache_dir=tmp_path)
+    built = np.array(finder.get_patterns(Language.ENG, 5))
+
+    cached = PatternMatrixFinder(TEST_WORDS, cache_dir=tmp_path).get_patterns(Language.ENG, 5)
+
+    assert isinstance(cached, np.memmap)
+    assert (cached == built).all()
+    assert len(list(tmp_path.glob("eng_5_*.patterns.npy"))) == 1
+
+
+@pytest.mark.parametrize("answer", sorted(TEST_WORDS[(Language.ENG, 5)]))
+def test_get_informative_word_solves(pattern_finder: PatternMatrixFinder, answer: str):
+    history = [("valve", _code("valve", answer))]
+    for _ in range(6):
+        guess = pattern_finder.get_informative_word(history, Language.ENG, 5)
+        if guess == answer:
+            return
+        history.append((guess, _code(guess, answer)))
+
+    pytest.fail(f"{answer} is not solved in 6 guesses")
+
+
+def test_get_informative_word_unknown_guess(pattern_finder: PatternMatrixFinder):
+    history = [("zzzzz", 0), ("bases", _code("bases", "babes"))]
+
+    assert pattern_finder.get_informative_word(history, Language.ENG, 5) == "babes"
+    assert pattern_finder.get_informative_word([("abaca", 241)], Language.ENG, 5) is None
+
+
+def test_entropies_same_in_small_blocks(pattern_finder: PatternMatrixFinder, monkeypatch: pytest.MonkeyPatch):
+    patterns = pattern_finder.get_patterns(Language.ENG, 5)
+    candidates = np.arange(0, patterns.shape[1], 2)
+    expected = []
+    for row in patterns[:, candidates]:
+        probabilities = np.unique(row, return_counts=True)[1] / len(candidates)
+        expected.append(-(probabilities * np.log2(probabilities)).sum())
+
+    monkeypatch.setattr(pattern_matrix, "_ENTROPY_CELLS", 3 ** 5 * 2)  # two guesses per block
+    assert get_entropies(patterns, candidates, 3 ** 5) == pytest.approx(expected)
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from functools import partial
+from operator import methodcaller
+
+import pytest
+
+from tests.adapters.helpers import TEST_WORDS
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO, WordlyFinder
+from wordly_solver.core.game.usecases.exceptions import SearchBusyError
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.search_executor import (
+    InlineSearchExecutor,
+    ProcessSearchExecutor,
+    ThreadSearchExecutor,
+)
+from wordly_solver.data.adapters.wordly_bitset import BitsetWordsIndex
+
+SEARCH_PIVO = methodcaller(
+    "wordly_search",
+    dto=WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter={0: "п"},
+        exclude_positions={},
+        max_count={},
+        wordly_len=4,
+    ),
+    language=Language.RU,
+)
+
+
+@pytest.mark.asyncio
+async def test_inline_search_executor():
+    assert await InlineSearchExecutor(BitsetWordsIndex(TEST_WORDS)).run(SEARCH_PIVO) == "пиво"
+
+
+@pytest.mark.asyncio
+async def test_thread_search_executor():
+    executor = ThreadSearchExecutor(BitsetWordsIndex(TEST_WORDS), max_workers=2)
+
+    def search_thread(finder: WordlyFinder) -> tuple[str | None, str]:
+        return SEARCH_PIVO(finder), threading.current_thread().name
+
+    try:
+        results = await asyncio.gather(*(executor.run(search_thread) for _ in range(10)))
+    finally:
+        executor.close()
+
+    assert {word for word, _ in results} == {"пиво"}
+    assert all(name.startswith("wordly-search") for _, name in results)
+
+
+@pytest.mark.asyncio
+async def test_thread_search_executor_backpressure():
+    release = threading.Event()
+    executor = ThreadSearchExecutor(
+        BitsetWordsIndex(TEST_WORDS), max_workers=1, max_pending=2, queue_timeout=0.05
+    )
+
+    def slow_search(finder: WordlyFinder) -> str | None:
+        release.wait(timeout=5)
+        return SEARCH_PIVO(finder)
+
+    try:
+        running = [asyncio.ensure_future(executor.run(slow_search)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(SearchBusyError):
+            await executor.run(SEARCH_PIVO)
+
+        release.set()
+        assert await asyncio.gather(*running) == ["пиво", "пиво"]
+        # slots are free again
+        assert await executor.run(SEARCH_PIVO) == "пиво"
+    finally:
+        release.set()
+        executor.close()
+
+
+@pytest.mark.asyncio
+async def test_process_search_executor():
+    executor = ProcessSearchExecutor(partial(BitsetWordsIndex, TEST_WORDS), max_workers=2)
+
+    try:
+        results = await asyncio.gather(*(executor.run(SEARCH_PIVO) for _ in range(4)))
+    finally:
+        executor.close()
+
+    assert results == ["пиво"] * 4
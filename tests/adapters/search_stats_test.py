@@ -0,0 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wordly_solver.core.game.ports.search_listener import SearchStats
+from wordly_solver.core.game.ports.wordly_finder import PatternQueryDTO, WordlySearchDTO
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.finder_factory import FinderEngine, create_wordly_finder
+from wordly_solver.data.adapters.search_stats import SearchStatsCollector
+from wordly_solver.data.adapters.wordly_tree import AllWordsTree
+
+TEST_WORDS = {(Language.ENG, 5): {"bases", "cases", "casts"}}
+
+
+def _dto(**kwargs) -> WordlySearchDTO:
+    return WordlySearchDTO(
+        exclude_letters=kwargs.get("exclude_letters", set()),
+        positions_letter=kwargs.get("positions_letter", {}),
+        exclude_positions=kwargs.get("exclude_positions", {}),
+        max_count=kwargs.get("max_count", {}),
+        wordly_len=5,
+    )
+
+
+@pytest.fixture
+def collector() -> SearchStatsCollector:
+    return SearchStatsCollector()
+
+
+@pytest.fixture
+def tree(collector: SearchStatsCollector) -> AllWordsTree:
+    return AllWordsTree(TEST_WORDS, minimize=False, listener=collector)
+
+
+def _get_stats(collector: SearchStatsCollector, method: str) -> SearchStats:
+    calls, stats = collector.snapshot()[method]
+    assert calls == 1
+    assert stats.elapsed > 0
+    stats.elapsed = 0
+    return stats
+
+
+@pytest.mark.parametrize(
+    "dto, expected",
+    [
+        (
+                _dto(exclude_letters={"t"}, exclude_positions={0: {"c"}}),
+                # "c" subtree is cut at the root, "bases" is cut before its last letter: no room left for "c"
+                SearchStats(nodes_entered=5, pruned_by_exclude_positions=1, pruned_by_min_count=1),
+        ),
+        (
+                _dto(exclude_letters={"b"}, max_count={"s": 1}),
+                # the second "s" of "cases" and "casts" is cut one level above the leaves
+                SearchStats(nodes_entered=6, pruned_by_exclude_letters=1, pruned_by_max_count=2),
+        ),
+        (
+                _dto(positions_letter={4: "s"}, exclude_letters={"e"}),
+                SearchStats(candidates=1, nodes_entered=9, pruned_by_exclude_letters=2, leaves_checked=1),
+        ),
+    ],
+)
+def test_tree_search_stats(
+        dto: WordlySearchDTO, expected: SearchStats, tree: AllWordsTree, collector: SearchStatsCollector
+):
+    tree.get_candidates(dto, Language.ENG)
+
+    assert _get_stats(collector, "get_candidates") == expected
+
+
+def test_tree_reports_every_call(tree: AllWordsTree, collector: SearchStatsCollector):
+    tree.wordly_search(_dto(), Language.ENG)
+    assert _get_stats(collector, "wordly_search").leaves_checked == 1
+
+    collector.reset()
+    candidates = tree.iter_candidates(_dto(), Language.ENG)
+    next(candidates)
+    assert collector.snapshot() == {}  # still running
+    candidates.close()  # type: ignore
+    assert _get_stats(collector, "iter_candidates").leaves_checked == 1
+
+    collector.reset()
+    assert tree.count_candidates(_dto(positions_letter={0: "c"}), Language.ENG) == 2
+    stats = _get_stats(collector, "count_candidates")
+    assert stats.nodes_entered == 2  # root and "c" subtree count
+    assert stats.candidates == 2
+
+
+def test_tree_without_listener_counts_nothing():
+    tree = AllWordsTree(TEST_WORDS)
+
+    assert tree.listener is None
+    assert tree.get_candidates(_dto(exclude_letters={"b"}), Language.ENG) == ["cases", "casts"]
+
+
+def test_collector_sums_threads(tree: AllWordsTree, collector: SearchStatsCollector):
+    dto = _dto(exclude_letters={"t"})
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: tree.get_candidates(dto, Language.ENG), range(100)))
+
+    calls, stats = collector.snapshot()["get_candidates"]
+    assert calls == 100
+    assert stats.leaves_checked == 200
+    assert stats.pruned_by_exclude_letters == 100
+
+
+def test_tree_find_by_pattern_stats(tree: AllWordsTree, collector: SearchStatsCollector):
+    query = PatternQueryDTO(mask="?a???", must_contain={"t"}, must_not_contain={"e"})
+
+    assert tree.find_by_pattern(query, Language.ENG) == ["casts"]
+    # "b" subtree has no "t" below it and is never entered, "case" is cut by must_not_contain
+    assert _get_stats(collector, "find_by_pattern") == SearchStats(
+        candidates=1, nodes_entered=6, pruned_by_exclude_letters=1, pruned_by_min_count=1
+    )
+
+
+@pytest.mark.parametrize("engine", [FinderEngine.BITSET, FinderEngine.MATRIX])
+def test_index_finders_report_calls(engine: FinderEngine, collector: SearchStatsCollector):
+    if engine == FinderEngine.MATRIX:
+        pytest.importorskip("numpy")
+    finder = create_wordly_finder(engine, TEST_WORDS, listener=collector)
+    dto = _dto(exclude_letters={"b"})
+
+    assert finder.get_candidates(dto, Language.ENG) == ["cases", "casts"]
+    assert finder.wordly_search(_dto(exclude_letters={"c"}), Language.ENG) == "bases"
+    assert finder.count_candidates(dto, Language.ENG) == 2
+
+    candidates = finder.iter_candidates(dto, Language.ENG)
+    next(candidates)
+    assert "iter_candidates" not in collector.snapshot()  # still running
+    candidates.close()  # type: ignore
+
+    # no nodes to count, only the words and the time
+    for method, found in (("get_candidates", 2), ("wordly_search", 1), ("count_candidates", 2), ("iter_candidates", 1)):
+        assert _get_stats(collector, method) == SearchStats(candidates=found)
@@ -0,0 +1,178 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from wordly_solver.core.game.ports.game_stats import GameEvent, GameEventKind, GameRollup
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.sqlite_game_stats import GameStatsClosedError, SqliteGameStats
+
+
+def _event(kind: GameEventKind, guesses: int = 1, won: bool | None = None, **kwargs) -> GameEvent:
+    return GameEvent(
+        kind=kind,
+        user_id=kwargs.get("user_id", 1),
+        language=kwargs.get("language", Language.ENG),
+        word_len=kwargs.get("word_len", 5),
+        guesses=guesses,
+        word=kwargs.get("word"),
+        won=won,
+        at=1.0,
+        game=kwargs.get("game"),
+    )
+
+
+def _count_events(path: Path) -> int:
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM game_events").fetchone()[0]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_rollups(tmp_path: Path):
+    path = tmp_path / "stats.db"
+    stats = SqliteGameStats(path, batch_size=2, flush_interval=60)
+    await stats.start()
+
+    for guesses in (1, 2, 3):
+        stats.record(_event(GameEventKind.suggestion, guesses=guesses, word="crane"))
+    stats.record(_event(GameEventKind.outcome, guesses=4, won=True))
+    stats.record(_event(GameEventKind.outcome, guesses=4, won=True))
+    stats.record(_event(GameEventKind.outcome, guesses=6, won=False))
+    stats.record(_event(GameEventKind.outcome, guesses=3, won=True, language=Language.RU, word_len=4))
+    stats.record(_event(GameEventKind.guess, word="пиво", language=Language.RU, word_len=4))
+
+    assert await stats.get_rollups() == [
+        GameRollup(language=Language.ENG, word_len=5, games=3, wins=2, suggestions=3, won_in={4: 2}),
+        GameRollup(language=Language.RU, word_len=4, games=1, wins=1, suggestions=0, won_in={3: 1}),
+    ]
+    assert _count_events(path) == 8
+    await stats.close()
+
+    # rollups keep growing after a restart
+    stats = SqliteGameStats(path)
+    await stats.start()
+    stats.record(_event(GameEventKind.outcome, guesses=2, won=True))
+    eng = (await stats.get_rollups())[0]
+    await stats.close()
+
+    assert (eng.games, eng.wins, eng.won_in) == (4, 3, {2: 1, 4: 2})
+    assert eng.win_rate == 0.75
+    assert eng.average_guesses == pytest.approx(10 / 3)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_flushes_in_background(tmp_path: Path):
+    stats = SqliteGameStats(tmp_path / "stats.db", flush_interval=0.01)
+    await stats.start()
+    stats.record(_event(GameEventKind.suggestion))
+
+    for _ in range(500):
+        if _count_events(tmp_path / "stats.db"):
+            break
+        await asyncio.sleep(0.01)
+
+    assert _count_events(tmp_path / "stats.db") == 1
+    await stats.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_drops_oldest_when_full(tmp_path: Path):
+    stats = SqliteGameStats(tmp_path / "stats.db", capacity=3, flush_interval=60)
+    await stats.start()
+    for guesses in range(1, 6):
+        stats.record(_event(GameEventKind.outcome, guesses=guesses, won=True))
+
+    assert stats.dropped == 2
+    assert await stats.flush() == 3
+    assert (await stats.get_rollups())[0].won_in == {3: 1, 4: 1, 5: 1}
+    await stats.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_records_outcome_once_per_game(tmp_path: Path):
+    stats = SqliteGameStats(tmp_path / "stats.db", flush_interval=60, recent_games=2)
+    await stats.start()
+    for game in ("a", "a", "b", "c", "a"):
+        stats.record(_event(GameEventKind.outcome, guesses=3, won=True, game=game))
+    stats.record(_event(GameEventKind.outcome, guesses=3, won=True))
+    stats.record(_event(GameEventKind.outcome, guesses=3, won=True))
+
+    rollups = await stats.get_rollups()
+    assert (rollups[0].games, rollups[0].won_in) == (6, {3: 6})  # "a" is forgotten after two newer games
+    await stats.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_close_writes_buffer(tmp_path: Path):
+    stats = SqliteGameStats(tmp_path / "stats.db", flush_interval=60)
+    await stats.start()
+    stats.record(_event(GameEventKind.suggestion))
+    stats.record(_event(GameEventKind.guess, word="crane"))
+    await stats.close()
+    await stats.close()
+
+    assert _count_events(tmp_path / "stats.db") == 2
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_closed(tmp_path: Path):
+    stats = SqliteGameStats(tmp_path / "stats.db")
+    with pytest.raises(GameStatsClosedError):
+        await stats.flush()
+
+    await stats.start()
+    await stats.close()
+    with pytest.raises(GameStatsClosedError):
+        await stats.get_rollups()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_counts_failed_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    stats = SqliteGameStats(tmp_path / "stats.db", batch_size=2, flush_interval=60)
+    await stats.start()
+    for guesses in (1, 2, 3):
+        stats.record(_event(GameEventKind.suggestion, guesses=guesses))
+
+    def broken_write(batch: list) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(stats, "_write", broken_write)
+        with pytest.raises(sqlite3.OperationalError):
+            await stats.flush()
+
+    assert stats.dropped == 2
+    assert await stats.flush() == 1  # the rest of the buffer is still written
+    await stats.close()
+    assert _count_events(tmp_path / "stats.db") == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_game_stats_background_flush_survives_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    stats = SqliteGameStats(tmp_path / "stats.db", flush_interval=0.01)
+    write = stats._write
+    failures = [sqlite3.OperationalError("database is locked")]
+
+    def flaky_write(batch: list) -> None:
+        if failures:
+            raise failures.pop()
+        write(batch)
+
+    monkeypatch.setattr(stats, "_write", flaky_write)
+    await stats.start()
+    stats.record(_event(GameEventKind.suggestion))
+    for _ in range(500):
+        if stats.dropped:
+            break
+        await asyncio.sleep(0.01)
+    stats.record(_event(GameEventKind.guess, word="crane"))
+
+    for _ in range(500):
+        if _count_events(tmp_path / "stats.db"):
+            break
+        await asyncio.sleep(0.01)
+
+    assert _count_events(tmp_path / "stats.db") == 1
+    assert stats.dropped == 1
+    await stats.close()
@@ -0,0 +1,186 @@
+import itertools
+import random
+import string
+from collections import Counter
+
+import pytest
+
+from tests.adapters.helpers import (
+    TEST_WORDS,
+    check_find_by_pattern,
+    check_iter_count_candidates,
+    check_top_words,
+    check_wordly_search_many,
+    matches,
+    random_dto,
+)
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO, WordlyFinder
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.wordly_bitset import BitsetIndex, BitsetWordsIndex
+from wordly_solver.data.adapters.wordly_tree import AllWordsTree
+
+
+@pytest.fixture(scope="module")
+def bitset_index() -> BitsetWordsIndex:
+    return BitsetWordsIndex(TEST_WORDS)
+
+
+def test_get_candidates_same_as_tree(bitset_index: BitsetWordsIndex):
+    tree = AllWordsTree(TEST_WORDS)
+    rnd = random.Random(42)
+    for (language, _), words in TEST_WORDS.items():
+        for _ in range(30):
+            dto = random_dto(rnd, sorted(words))
+            candidates = bitset_index.get_candidates(dto, language)
+            assert candidates == sorted(word for word in words if matches(word, dto))
+            assert candidates == sorted(word for word in words if dto.matches(word))
+            assert candidates == tree.get_candidates(dto, language)
+
+            tree_result = tree.wordly_search(dto, language=language)
+            assert (tree_result is None) == (not candidates)
+            assert tree_result is None or tree_result in candidates
+
+
+@pytest.mark.parametrize(
+    "language, dto, expected",
+    [
+        (
+                Language.ENG,
+                WordlySearchDTO(
+                    exclude_letters={"a", "b", "r", "o", "l", "s"},
+                    positions_letter={2: "t", 4: "d"},
+                    exclude_positions={},
+                    max_count={},
+                    wordly_len=5,
+                ),
+                ["muted"],
+        ),
+        (
+                Language.ENG,
+                WordlySearchDTO(
+                    exclude_letters=set(string.ascii_lowercase),
+                    positions_letter={},
+                    exclude_positions={},
+                    max_count={},
+                    wordly_len=5,
+                ),
+                [],
+        ),
+        (
+                Language.ENG,
+                WordlySearchDTO(
+                    exclude_letters=set(),
+                    positions_letter={0: "a"},
+                    exclude_positions={},
+                    max_count={"a": 2, "e": 1, "s": 2},
+                    wordly_len=5,
+                ),
+                ["aband", "aleft", "ascon"],
+        ),
+        (
+                Language.RU,
+                WordlySearchDTO(
+                    exclude_letters=set(),
+                    positions_letter={1: "о"},
+                    exclude_positions={},
+                    max_count={},
+                    wordly_len=4,
+                ),
+                ["вода"],
+        ),
+    ],
+)
+def test_get_candidates(
+        language: Language, dto: WordlySearchDTO, expected: list[str], bitset_index: BitsetWordsIndex
+):
+    assert bitset_index.get_candidates(dto, language) == expected
+
+
+def test_wordly_search_randomness(bitset_index: BitsetWordsIndex):
+    dto = WordlySearchDTO(
+        exclude_letters={"a"},
+        positions_letter={},
+        exclude_positions={},
+        max_count={},
+        wordly_len=5,
+    )
+    candidates = set(bitset_index.get_candidates(dto, Language.ENG))
+    results = {bitset_index.wordly_search(dto, language=Language.ENG) for _ in range(100)}
+    assert len(results) > 1
+    assert results <= candidates
+
+
+def test_get_random_word_uniform():
+    index = BitsetIndex.build({f"{idx:03}" for idx in range(100)}, 3)
+    mask = 0b111 | 1 << 99  # a run of words and a word after a long gap
+
+    picks = Counter(index.get_random_word(mask) for _ in range(4000))
+
+    assert set(picks) == {"000", "001", "002", "099"}
+    assert all(800 < count < 1200 for count in picks.values())
+
+
+@pytest.mark.parametrize(
+    "language, forbidden_letters, wordly_len, expected",
+    [
+        (Language.RU, {"о", "к"}, 5, {"будка", "питон"}),
+        (Language.RU, {"о", "к", "а", "т"}, 5, {"будка", "питон"}),
+        (Language.RU, {"п", "и", "в", "о"}, 4, {"вода"}),
+        (Language.RU, set(), 4, {"вода", "пиво"}),
+    ],
+)
+def test_get_exclude_word(
+        language: Language,
+        forbidden_letters: set[str],
+        wordly_len: int,
+        expected: set[str],
+        bitset_index: BitsetWordsIndex
+):
+    for _ in range(20):
+        assert bitset_index.get_exclude_word(forbidden_letters, language, wordly_len) in expected
+
+
+@pytest.mark.parametrize("finder_type", [AllWordsTree, BitsetWordsIndex])
+def test_wordly_search_many(finder_type: type[WordlyFinder]):
+    check_wordly_search_many(finder_type(TEST_WORDS))
+
+
+def test_wordly_search_many_repeats_are_random(bitset_index: BitsetWordsIndex):
+    dto = WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter={},
+        exclude_positions={},
+        max_count={},
+        wordly_len=5,
+    )
+    results = bitset_index.wordly_search_many([(dto, Language.ENG)] * 100)
+
+    assert len(set(results)) > 1
+    assert bitset_index.wordly_search_many([]) == []
+
+
+@pytest.mark.parametrize("finder_type", [AllWordsTree, BitsetWordsIndex])
+def test_iter_count_candidates(finder_type: type[WordlyFinder]):
+    check_iter_count_candidates(finder_type(TEST_WORDS))
+
+
+def test_iter_candidates_page(bitset_index: BitsetWordsIndex):
+    dto = WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter={},
+        exclude_positions={},
+        max_count={},
+        wordly_len=5,
+    )
+
+    assert list(itertools.islice(bitset_index.iter_candidates(dto, Language.ENG), 2, 4)) == ["adeem", "aleft"]
+
+
+@pytest.mark.parametrize("finder_type", [AllWordsTree, BitsetWordsIndex])
+def test_find_by_pattern_same_as_brute_force(finder_type: type[WordlyFinder]):
+    check_find_by_pattern(finder_type(TEST_WORDS))
+
+
+@pytest.mark.parametrize("finder_type", [AllWordsTree, BitsetWordsIndex])
+def test_top_words_same_as_brute_force(finder_type: type[WordlyFinder]):
+    check_top_words(finder_type(TEST_WORDS))
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from tests.adapters.helpers import (  # noqa: E402
+    TEST_WORDS,
+    check_find_by_pattern,
+    check_iter_count_candidates,
+    check_top_words,
+    check_wordly_search_many,
+    random_dto,
+)
+from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO  # noqa: E402
+from wordly_solver.core.words.constants import Language  # noqa: E402
+from wordly_solver.data.adapters.finder_factory import FinderEngine, create_wordly_finder  # noqa: E402
+from wordly_solver.data.adapters.wordly_bitset import BitsetWordsIndex  # noqa: E402
+from wordly_solver.data.adapters.wordly_matrix import MatrixWordsIndex  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def matrix_index() -> MatrixWordsIndex:
+    return MatrixWordsIndex(TEST_WORDS)
+
+
+def test_get_candidates_same_as_bitset(matrix_index: MatrixWordsIndex):
+    bitset_index = BitsetWordsIndex(TEST_WORDS)
+    rnd = random.Random(7)
+    for (language, _), words in TEST_WORDS.items():
+        for _ in range(50):
+            dto = random_dto(rnd, sorted(words))
+            assert matrix_index.get_candidates(dto, language) == bitset_index.get_candidates(dto, language)
+
+
+def test_unknown_letters(matrix_index: MatrixWordsIndex):
+    dto = WordlySearchDTO(
+        exclude_letters={"z"},
+        positions_letter={},
+        exclude_positions={0: {"я"}},
+        max_count={},
+        wordly_len=4,
+    )
+    assert matrix_index.get_candidates(dto, Language.RU) == []
+
+    dto.exclude_positions = {}
+    assert matrix_index.get_candidates(dto, Language.RU) == ["вода", "пиво"]
+
+
+@pytest.mark.parametrize(
+    "language, forbidden_letters, wordly_len, expected",
+    [
+        (Language.RU, {"о", "к"}, 5, {"будка", "питон"}),
+        (Language.RU, {"п", "и", "в", "о"}, 4, {"вода"}),
+    ],
+)
+def test_get_exclude_word(
+        language: Language,
+        forbidden_letters: set[str],
+        wordly_len: int,
+        expected: set[str],
+        matrix_index: MatrixWordsIndex
+):
+    for _ in range(20):
+        assert matrix_index.get_exclude_word(forbidden_letters, language, wordly_len) in expected
+
+
+@pytest.mark.parametrize("engine", list(FinderEngine))
+def test_create_wordly_finder(engine: FinderEngine):
+    finder = create_wordly_finder(engine, TEST_WORDS)
+    dto = WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter={0: "п"},
+        exclude_positions={},
+        max_count={},
+        wordly_len=4,
+    )
+    assert finder.wordly_search(dto, Language.RU) == "пиво"
+
+
+def test_wordly_search_many(matrix_index: MatrixWordsIndex):
+    check_wordly_search_many(matrix_index)
+
+
+def test_iter_count_candidates(matrix_index: MatrixWordsIndex):
+    check_iter_count_candidates(matrix_index)
+
+
+def test_find_by_pattern(matrix_index: MatrixWordsIndex):
+    check_find_by_pattern(matrix_index)
+
+
+def test_top_words(matrix_index: MatrixWordsIndex):
+    check_top_words(matrix_index)
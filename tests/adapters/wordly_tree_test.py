@@ -1,50 +1,18 @@
 import copy
+import random
 import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import Set, Dict, Tuple
 
 import pytest
 
-from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO
+from tests.adapters.helpers import TEST_ENG_WORDS, TEST_RU_WORDS, TEST_RU_WORDS4
+from wordly_solver.core.game.ports.wordly_finder import PatternQueryDTO, WordlySearchDTO
 from wordly_solver.core.words.constants import Language
-from wordly_solver.data.adapters.wordly_tree import AllWordsTree
-
-TEST_ENG_WORDS = {
-    "abaca",
-    "aband",
-    "adeem",
-    "aleft",
-    "ascon",
-    "asess",
-    "babes",
-    "bases",
-    "begum",
-    "begus",
-    "birls",
-    "booms",
-    "yetts",
-    "valve",
-    "verst",
-    "vower",
-    "weals",
-    "wifes",
-    "muted",
-    "cutey",
-    "fumes",
-    "gauge",
-    "lutes",
-}
-
-TEST_RU_WORDS = {
-    "океан",
-    "будка",
-    "кошка",
-    "питон"
-}
-
-TEST_RU_WORDS4 = {
-    "пиво",
-    "вода",
-}
+from wordly_solver.data.adapters.finder_factory import FinderEngine, create_wordly_finder
+from wordly_solver.data.adapters.wordly_tree import AllWordsTree, LetterNode
 
 
 def _get_test_tree(test_words: Dict[Tuple[Language, int], Set[str]]) -> AllWordsTree:
@@ -281,3 +249,214 @@ def test_wordly_search_multiply_results(
             test_words[(language, 5)] = current_words
 
     assert actual_get == set(expected)
+
+
+def test_wordly_search_shared_between_threads(word_tree: AllWordsTree):
+    dto = WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter={0: "a"},
+        exclude_positions={},
+        max_count={"a": 2, "e": 1, "s": 2},
+        wordly_len=5,
+    )
+    none_dto = WordlySearchDTO(
+        exclude_letters=set(string.ascii_letters.lower()),
+        positions_letter={},
+        exclude_positions={},
+        max_count={},
+        wordly_len=5,
+    )
+
+    def search(idx: int) -> str | None:
+        return word_tree.wordly_search(dto if idx % 2 else none_dto, language=Language.ENG)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(search, range(400)))
+
+    assert set(results[1::2]) <= {"aband", "aleft", "ascon"}
+    assert set(results[::2]) == {None}
+
+
+def _get_node(tree: AllWordsTree, prefix: str) -> LetterNode:
+    node = tree._get_root_by_lang(Language.ENG, 5)
+    for letter in prefix:
+        node = node.children[letter]
+
+    return node
+
+
+@pytest.mark.parametrize("minimize", [True, False])
+def test_minimize_shares_suffixes(minimize: bool):
+    words = {"bases", "cases", "casts"}
+    tree = AllWordsTree({(Language.ENG, 5): words}, minimize=minimize)
+
+    assert (_get_node(tree, "base") is _get_node(tree, "case")) == minimize
+    assert (_get_node(tree, "ba") is _get_node(tree, "ca")) is False
+
+    dto = WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter={},
+        exclude_positions={},
+        max_count={},
+        wordly_len=5,
+    )
+    assert {tree.wordly_search(dto, language=Language.ENG) for _ in range(100)} == words
+
+
+@pytest.mark.parametrize(
+    "language, forbidden_letters, wordly_len, expected",
+    [
+        (Language.RU, {"о", "к"}, 5, {"будка", "питон"}),
+        (Language.RU, {"о", "к", "а", "т"}, 5, {"будка", "питон"}),
+        (Language.RU, {"о", "к", "а", "т", "у", "н"}, 5, {"будка", "питон"}),
+        (Language.RU, {"п", "и", "в", "о"}, 4, {"вода"}),
+        (Language.RU, set(), 4, {"вода", "пиво"}),
+        (Language.ENG, set(string.ascii_lowercase), 5, TEST_ENG_WORDS),
+        (Language.ENG, {"a", "e", "s"}, 5, {"begum", "birls", "booms", "cutey", "muted", "vower"}),
+    ],
+)
+def test_get_exclude_word(
+        language: Language,
+        forbidden_letters: set[str],
+        wordly_len: int,
+        expected: set[str],
+        word_tree: AllWordsTree
+):
+    for _ in range(50):
+        assert word_tree.get_exclude_word(forbidden_letters, language, wordly_len) in expected
+
+
+def test_get_exclude_word_same_as_brute_force(word_tree: AllWordsTree):
+    words = sorted(TEST_ENG_WORDS)
+    rnd = random.Random(3)
+    for _ in range(50):
+        forbidden_letters = set(rnd.sample(string.ascii_lowercase, k=rnd.randint(0, 15)))
+
+        def hits(word: str) -> int:
+            return sum(letter in forbidden_letters for letter in word)
+
+        best = min(hits(word) for word in words)
+        result = word_tree.get_exclude_word(forbidden_letters, Language.ENG, 5)
+        assert result in TEST_ENG_WORDS
+        assert hits(result) == best
+
+
+@pytest.mark.parametrize("minimize", [True, False])
+def test_words_count(minimize: bool):
+    tree = AllWordsTree({(Language.ENG, 5): TEST_ENG_WORDS}, minimize=minimize)
+    root = tree._get_root_by_lang(Language.ENG, 5)
+
+    assert root.words_count == len(TEST_ENG_WORDS)
+    assert root.children["a"].words_count == 6
+    assert root.children["b"].children["e"].words_count == 2
+
+
+@pytest.mark.parametrize("minimize", [True, False])
+def test_letters_mask(minimize: bool):
+    tree = AllWordsTree({(Language.ENG, 5): TEST_ENG_WORDS}, minimize=minimize)
+    root = tree._get_root_by_lang(Language.ENG, 5)
+
+    def get_letters(mask: int) -> Set[str]:
+        return {letter for letter, bit in tree.letter_bits.items() if mask & bit}
+
+    assert get_letters(root.letters_mask) == {letter for word in TEST_ENG_WORDS for letter in word}
+    assert get_letters(root.children["b"].children["e"].letters_mask) == {"g", "u", "m", "s"}  # begum, begus
+    assert root.children["b"].children["e"].children["g"].children["u"].children["m"].letters_mask == 0
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (PatternQueryDTO(mask="b?s??"), ["bases"]),
+        (PatternQueryDTO(mask="b???s"), ["babes", "bases", "begus", "birls", "booms"]),
+        (PatternQueryDTO(mask="??t??", must_contain={"e"}), ["cutey", "lutes", "muted", "yetts"]),
+        (PatternQueryDTO(mask="??t??", must_contain={"e"}, must_not_contain={"s"}), ["cutey", "muted"]),
+        (PatternQueryDTO(mask="?e???", must_not_contain={"e", "s"}), ["begum"]),  # fixed letters are allowed
+        (PatternQueryDTO(mask="b????", must_contain={"x"}), []),
+        (PatternQueryDTO(mask="?????", must_contain={"v", "w"}), ["vower"]),
+    ],
+)
+def test_find_by_pattern(query: PatternQueryDTO, expected: list[str], word_tree: AllWordsTree):
+    assert word_tree.find_by_pattern(query, Language.ENG) == expected
+
+
+@pytest.mark.parametrize(
+    "positions_letter, max_count, min_count",
+    [
+        ({}, {"s": 1, "e": 1, "a": 1}, {}),
+        ({}, {"s": 2}, {"s": 2}),
+        ({0: "a"}, {"a": 1}, {}),  # a known letter counts against max_count too
+        ({0: "a"}, {"a": 2}, {"a": 2}),
+        ({4: "s"}, {"s": 1, "e": 2}, {"e": 1}),
+        ({}, {"a": 0}, {}),
+    ],
+)
+def test_wordly_search_duplicate_letters(
+        positions_letter: Dict[int, str], max_count: Dict[str, int], min_count: Dict[str, int], word_tree: AllWordsTree
+):
+    dto = WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter=positions_letter,
+        exclude_positions={},
+        max_count=max_count,
+        wordly_len=5,
+        min_count=min_count,
+    )
+
+    assert word_tree.get_candidates(dto, Language.ENG) == sorted(
+        word for word in TEST_ENG_WORDS if dto.matches(word)
+    )
+
+
+@pytest.mark.parametrize("wordly_len", [4, 8, 12, 15])
+def test_variant_lengths_same_as_brute_force(wordly_len: int):
+    rnd = random.Random(wordly_len)
+    words = sorted({"".join(rnd.choices("abcdef", k=wordly_len)) for _ in range(300)})
+    tree = AllWordsTree({(Language.ENG, wordly_len): set(words)})
+
+    for _ in range(30):
+        answer = rnd.choice(words)
+        dto = WordlySearchDTO(
+            exclude_letters={rnd.choice("abcdef")} - set(answer),
+            positions_letter={idx: answer[idx] for idx in rnd.sample(range(wordly_len), k=2)},
+            exclude_positions={},
+            max_count={answer[0]: answer.count(answer[0])},
+            wordly_len=wordly_len,
+            min_count={answer[-1]: answer.count(answer[-1])},
+        )
+        candidates = tree.get_candidates(dto, Language.ENG)
+
+        assert candidates == [word for word in words if dto.matches(word)]
+        assert tree.count_candidates(dto, Language.ENG) == len(candidates)
+        assert tree.wordly_search(dto, Language.ENG) in candidates
+
+
+def test_words_longer_than_recursion_limit():
+    wordly_len = sys.getrecursionlimit() + 100
+    words = {"a" * wordly_len, "a" * (wordly_len - 1) + "b", "b" + "a" * (wordly_len - 1)}
+    tree = AllWordsTree({(Language.ENG, wordly_len): words})
+    dto = WordlySearchDTO(
+        exclude_letters=set(),
+        positions_letter={wordly_len - 1: "b"},
+        exclude_positions={},
+        max_count={},
+        wordly_len=wordly_len,
+    )
+
+    assert tree._get_root_by_lang(Language.ENG, wordly_len).words_count == 3
+    assert tree.get_candidates(dto, Language.ENG) == ["a" * (wordly_len - 1) + "b"]
+    assert tree.count_candidates(dto, Language.ENG) == 1
+    assert tree.get_exclude_word({"b"}, Language.ENG, wordly_len) == "a" * wordly_len
+
+
+@pytest.mark.parametrize("engine", list(FinderEngine))
+def test_empty_index_same_in_every_engine(engine: FinderEngine):
+    if engine == FinderEngine.MATRIX:
+        pytest.importorskip("numpy")
+    finder = create_wordly_finder(engine, {(Language.ENG, 5): set()})
+    everything = WordlySearchDTO(exclude_letters=set(), positions_letter={}, exclude_positions={}, max_count={})
+
+    assert finder.get_candidates(everything, Language.ENG) == []
+    assert finder.count_candidates(everything, Language.ENG) == 0
+    assert finder.count_candidates(replace(everything, exclude_letters={"a"}), Language.ENG) == 0
+    assert finder.wordly_search(everything, Language.ENG) is None
@@ -0,0 +1,69 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.words_ingest import IngestStats, WordsIngestor, load_words, normalize_word
+
+TEST_LINES = [
+    "Crane\n",
+    '"slate"\n',
+    "crane\n",  # duplicate after lowercasing
+    "don't\n",
+    "\n",
+    "Вода\n",
+    "«пиво»,noun\n",
+    "ёжик\n",
+    "car1s\n",
+    "mixяd\n",
+    "abracadabra\n",
+]
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("  Crane \n", "crane"),
+        ('"SLATE"', "slate"),
+        ("«Пиво»,noun,1", "пиво"),
+        ("е\u0308жик", "ёжик"),  # decomposed ё
+        ("", ""),
+    ],
+)
+def test_normalize_word(line: str, expected: str):
+    assert normalize_word(line) == expected
+
+
+def test_feed_routes_by_language_and_length():
+    ingestor = WordsIngestor()
+    ingestor.feed(TEST_LINES)
+
+    assert ingestor.words == {
+        (Language.ENG, 5): {"crane", "slate"},
+        (Language.ENG, 11): {"abracadabra"},
+        (Language.RU, 4): {"вода", "пиво", "ёжик"},
+    }
+    assert ingestor.stats == IngestStats(lines=11, accepted=6, duplicates=1, rejected=4)
+
+
+def test_feed_filters_languages_and_lengths():
+    ingestor = WordsIngestor(languages=[Language.ENG], lengths=[5])
+    ingestor.feed(TEST_LINES)
+
+    assert ingestor.words == {(Language.ENG, 5): {"crane", "slate"}}
+    assert ingestor.stats.rejected == 8
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_load_words(tmp_path: Path, compress: bool):
+    first = tmp_path / "first.txt.gz"  # suffix does not decide, content does
+    second = tmp_path / "second.csv"
+    data = "".join(TEST_LINES).encode()
+    first.write_bytes(gzip.compress(data) if compress else data)
+    second.write_text("slate\nvalve\nпитон\n", encoding="utf-8")
+
+    assert load_words([first, second], lengths=[5]) == {
+        (Language.ENG, 5): {"crane", "slate", "valve"},
+        (Language.RU, 5): {"питон"},
+    }
@@ -0,0 +1,78 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from tests.adapters.helpers import TEST_WORDS, random_dto
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.words_snapshot import (
+    SnapshotError,
+    build_snapshots,
+    get_source_hash,
+    load_snapshot,
+)
+
+
+@pytest.fixture
+def snapshot_paths(tmp_path: Path) -> dict[tuple[Language, int], Path]:
+    return build_snapshots(TEST_WORDS, tmp_path)
+
+
+def test_load_snapshot(snapshot_paths: dict[tuple[Language, int], Path]):
+    snapshot = load_snapshot(snapshot_paths[(Language.RU, 4)], source_words=TEST_WORDS[(Language.RU, 4)])
+
+    assert snapshot.language == Language.RU
+    assert snapshot.wordly_len == 4
+    assert snapshot.words_count == 2
+    assert snapshot.alphabet == "авдиоп"
+    assert snapshot.source_hash == get_source_hash(TEST_WORDS[(Language.RU, 4)])
+    assert bytes(snapshot.letters) == bytes([1, 4, 2, 0, 5, 3, 1, 4])
+    assert list(snapshot.counts[:6]) == [1, 1, 1, 0, 1, 0]
+
+
+def test_load_snapshot_stale(snapshot_paths: dict[tuple[Language, int], Path]):
+    with pytest.raises(SnapshotError, match="stale"):
+        load_snapshot(snapshot_paths[(Language.RU, 4)], source_words={"пиво", "вода", "дыра"})
+
+
+def test_load_snapshot_corrupted(snapshot_paths: dict[tuple[Language, int], Path]):
+    path = snapshot_paths[(Language.ENG, 5)]
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(data)
+
+    with pytest.raises(SnapshotError, match="checksum"):
+        load_snapshot(path)
+
+    load_snapshot(path, verify_checksum=False)
+
+
+def test_load_snapshot_not_snapshot(tmp_path: Path):
+    path = tmp_path / "words.csv"
+    path.write_text("a" * 100)
+
+    with pytest.raises(SnapshotError, match="not a words snapshot"):
+        load_snapshot(path)
+
+
+@pytest.mark.parametrize("size", [0, 10, -1])  # empty, cut inside the header, cut inside the payload
+def test_load_snapshot_truncated(snapshot_paths: dict[tuple[Language, int], Path], size: int):
+    path = snapshot_paths[(Language.ENG, 5)]
+    path.write_bytes(path.read_bytes()[:size])
+
+    with pytest.raises(SnapshotError, match="too short|payload size"):
+        load_snapshot(path)
+
+
+def test_matrix_from_snapshots(snapshot_paths: dict[tuple[Language, int], Path]):
+    pytest.importorskip("numpy")
+    from wordly_solver.data.adapters.wordly_matrix import MatrixWordsIndex
+
+    built = MatrixWordsIndex(TEST_WORDS)
+    loaded = MatrixWordsIndex.from_snapshots(snapshot_paths.values())
+
+    rnd = random.Random(5)
+    for (language, _), words in TEST_WORDS.items():
+        for _ in range(20):
+            dto = random_dto(rnd, sorted(words))
+            assert loaded.get_candidates(dto, language) == built.get_candidates(dto, language)
@@ -0,0 +1,48 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.simulate_games import SimulationReport, main, simulate
+from benchmarks.synthetic import generate_words
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.finder_factory import FinderEngine
+from wordly_solver.data.adapters.first_words import get_first_word
+
+_TIMINGS = ("seconds", "play_seconds", "games_per_second")
+
+
+def _without_timings(report: SimulationReport) -> dict:
+    return {key: value for key, value in asdict(report).items() if key not in _TIMINGS}
+
+
+def test_same_report_whatever_the_workers():
+    words = generate_words(Language.ENG, 5, 300, seed=3)
+    answers = sorted(words)[:40]
+
+    reports = [
+        simulate(
+            strategy="suitable",
+            engine=FinderEngine.BITSET,
+            language=Language.ENG,
+            words=words,
+            answers=answers,
+            first_word=get_first_word(sorted(words)),
+            workers=workers,
+            seed=5,
+        )
+        for workers in (1, 2)
+    ]
+
+    assert reports[0].games == 40
+    assert _without_timings(reports[0]) == _without_timings(reports[1])
+
+
+def test_main_reads_words_file(tmp_path: Path):
+    words = tmp_path / "words.csv"
+    words.write_text('"crane",1\nslate\nCRANE\nabc\nbrine\n', encoding="utf-8")
+    output = tmp_path / "games.json"
+
+    assert main(["--words", str(words), "--workers", "1", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert (report["games"], report["failures"]) == (3, 0)
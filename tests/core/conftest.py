@@ -0,0 +1,25 @@
+from unittest.mock import create_autospec, Mock
+
+import pytest
+
+from tests.core.helpers import TEST_ENG_USER
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.user.ports.id_provider import IdProvider
+from wordly_solver.core.words.ports.words_gateway import WordsGateway
+
+
+@pytest.fixture
+def wordly_finder() -> WordlyFinder:
+    return create_autospec(WordlyFinder)
+
+
+@pytest.fixture
+def id_provider() -> IdProvider:
+    id_provider = create_autospec(IdProvider)
+    id_provider.get_current_user = Mock(return_value=TEST_ENG_USER)
+    return id_provider
+
+
+@pytest.fixture
+def words_gateway() -> WordsGateway:
+    return create_autospec(WordsGateway)
@@ -0,0 +1,9 @@
+from wordly_solver.core.game.entities import WordlyLetter, WordlyLetterState, WordlyWord
+from wordly_solver.core.user.entities import User
+from wordly_solver.core.words.constants import Language
+
+TEST_ENG_USER = User(language=Language.ENG, id=1)
+
+
+def create_wordly_word(word: str, states: list[WordlyLetterState]) -> WordlyWord:
+    return {i: WordlyLetter(value=char, state=state) for i, (char, state) in enumerate(zip(word, states))}
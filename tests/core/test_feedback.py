@@ -0,0 +1,40 @@
+import pytest
+
+from wordly_solver.core.game.entities import WordlyLetterState
+from wordly_solver.core.game.feedback import (
+    encode_feedback,
+    encode_wordly_word,
+    get_feedback,
+    get_wordly_word,
+)
+
+C = WordlyLetterState.correct
+W = WordlyLetterState.wrong_place
+X = WordlyLetterState.incorrect
+
+
+@pytest.mark.parametrize(
+    "guess, answer, expected",
+    [
+        ("abcde", "abcde", [C, C, C, C, C]),
+        ("abcde", "fghij", [X, X, X, X, X]),
+        ("abcde", "eabcd", [W, W, W, W, W]),
+        # only one unmatched "e" in the answer
+        ("geese", "those", [X, X, X, C, C]),
+        ("eerie", "there", [W, X, W, X, C]),
+        ("speed", "abide", [X, X, W, X, W]),
+        ("aabbb", "bbaaa", [W, W, W, W, X]),
+    ]
+)
+def test_get_feedback(guess, answer, expected):
+    assert get_feedback(guess, answer) == expected
+
+
+def test_encode_feedback():
+    assert encode_feedback([X, X, X]) == 0
+    assert encode_feedback([C, C, C]) == 26
+    assert encode_feedback([W, X, C]) == 1 + 2 * 9
+
+
+def test_encode_wordly_word():
+    assert encode_wordly_word(get_wordly_word("geese", "those")) == ("geese", 2 * 27 + 2 * 81)
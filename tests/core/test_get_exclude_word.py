@@ -0,0 +1,95 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from tests.core.helpers import create_wordly_word
+from wordly_solver.core.game.entities import WordlyLetterState
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.game.usecases.exceptions import IncorrectInputError
+from wordly_solver.core.game.usecases.get_exclude_word import GetExcludeWord, GetExcludeWordDTO
+from wordly_solver.core.user.ports.id_provider import IdProvider
+from wordly_solver.core.words.constants import Language
+from wordly_solver.core.words.ports.words_gateway import WordsGateway
+
+
+@pytest.fixture
+def get_exclude_word(
+        wordly_finder: WordlyFinder,
+        id_provider: IdProvider,
+        words_gateway: WordsGateway
+) -> GetExcludeWord:
+    return GetExcludeWord(
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        wordly_finder=wordly_finder
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_empty_current_words(get_exclude_word, words_gateway):
+    words_gateway.get_first_word = AsyncMock(return_value="CAT")
+
+    result = await get_exclude_word.execute(GetExcludeWordDTO(current_words=[], word_len=3))
+
+    words_gateway.get_first_word.assert_called_once_with(language=Language.ENG)
+    assert result == "CAT"
+
+
+@pytest.mark.asyncio
+async def test_execute_incorrect_word_length(get_exclude_word):
+    current_words = [
+        create_wordly_word("CAT", [WordlyLetterState.correct] * 3),
+        create_wordly_word("DOGS", [WordlyLetterState.correct] * 4)
+    ]
+
+    with pytest.raises(IncorrectInputError):
+        await get_exclude_word.execute(GetExcludeWordDTO(current_words=current_words, word_len=3))
+
+
+@pytest.mark.asyncio
+async def test_execute(get_exclude_word, wordly_finder):
+    current_words = [
+        create_wordly_word(
+            "CAT",
+            [WordlyLetterState.correct, WordlyLetterState.wrong_place, WordlyLetterState.incorrect]
+        ),
+        create_wordly_word(
+            "DOG",
+            [WordlyLetterState.incorrect, WordlyLetterState.incorrect, WordlyLetterState.incorrect]
+        )
+    ]
+    wordly_finder.get_exclude_word = Mock(return_value="BUN")
+
+    result = await get_exclude_word.execute(GetExcludeWordDTO(current_words=current_words, word_len=3))
+
+    wordly_finder.get_exclude_word.assert_called_once_with(
+        forbidden_letters={"C", "A", "T", "D", "O", "G"},
+        language=Language.ENG,
+        wordly_len=3
+    )
+    assert result == "BUN"
+
+
+@pytest.mark.asyncio
+async def test_execute_top(wordly_finder, id_provider, words_gateway):
+    get_exclude_word = GetExcludeWord(
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        wordly_finder=wordly_finder,
+        ranked=True
+    )
+    current_words = [create_wordly_word("CAT", [WordlyLetterState.incorrect] * 3)]
+    wordly_finder.get_top_exclude_words = Mock(return_value=["BUN", "DOG"])
+
+    result = await get_exclude_word.execute_top(GetExcludeWordDTO(current_words=current_words, word_len=3), k=2)
+
+    assert result == ["BUN", "DOG"]
+    wordly_finder.get_top_exclude_words.assert_called_once_with(
+        forbidden_letters={"C", "A", "T"},
+        language=Language.ENG,
+        wordly_len=3,
+        k=2
+    )
+    assert await get_exclude_word.execute(GetExcludeWordDTO(current_words=current_words, word_len=3)) == "BUN"
+    assert wordly_finder.get_top_exclude_words.call_args.kwargs["k"] == 1
+    wordly_finder.get_exclude_word.assert_not_called()
@@ -0,0 +1,101 @@
+from unittest.mock import create_autospec, AsyncMock, Mock
+
+import pytest
+
+from tests.core.helpers import create_wordly_word
+from wordly_solver.core.game.entities import WordlyLetterState
+from wordly_solver.core.game.ports.entropy_finder import EntropyFinder
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.game.usecases.exceptions import IncorrectInputError
+from wordly_solver.core.game.usecases.get_informative_word import GetInformativeWord, GetInformativeWordDTO
+from wordly_solver.core.user.ports.id_provider import IdProvider
+from wordly_solver.core.words.constants import Language
+from wordly_solver.core.words.ports.words_gateway import WordsGateway
+
+
+@pytest.fixture
+def entropy_finder() -> EntropyFinder:
+    return create_autospec(EntropyFinder)
+
+
+@pytest.fixture
+def get_informative_word(
+        entropy_finder: EntropyFinder,
+        id_provider: IdProvider,
+        words_gateway: WordsGateway
+) -> GetInformativeWord:
+    return GetInformativeWord(
+        entropy_finder=entropy_finder,
+        id_provider=id_provider,
+        words_gateway=words_gateway
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_empty_current_words(get_informative_word, words_gateway):
+    words_gateway.get_first_word = AsyncMock(return_value="CAT")
+
+    assert await get_informative_word.execute(GetInformativeWordDTO(current_words=[], word_len=3)) == "CAT"
+    words_gateway.get_first_word.assert_called_once_with(language=Language.ENG)
+
+
+@pytest.mark.asyncio
+async def test_execute_incorrect_word_length(get_informative_word):
+    current_words = [create_wordly_word("DOGS", [WordlyLetterState.correct] * 4)]
+
+    with pytest.raises(IncorrectInputError):
+        await get_informative_word.execute(GetInformativeWordDTO(current_words=current_words, word_len=3))
+
+
+@pytest.mark.asyncio
+async def test_execute(get_informative_word, entropy_finder):
+    current_words = [
+        create_wordly_word(
+            "CAT",
+            [WordlyLetterState.correct, WordlyLetterState.wrong_place, WordlyLetterState.incorrect]
+        ),
+    ]
+    entropy_finder.get_informative_word = Mock(return_value="CAR")
+
+    result = await get_informative_word.execute(GetInformativeWordDTO(current_words=current_words, word_len=3))
+
+    entropy_finder.get_informative_word.assert_called_once_with(
+        history=[("CAT", 2 + 3)],
+        language=Language.ENG,
+        wordly_len=3
+    )
+    assert result == "CAR"
+
+
+class RecordingSearchExecutor(SearchExecutor):
+    def __init__(self) -> None:
+        self.finder = create_autospec(WordlyFinder)
+        self.calls = 0
+
+    async def run(self, call):
+        self.calls += 1
+        return call(self.finder)
+
+
+@pytest.mark.asyncio
+async def test_execute_with_search_executor(entropy_finder, id_provider, words_gateway):
+    executor = RecordingSearchExecutor()
+    get_informative_word = GetInformativeWord(
+        entropy_finder=entropy_finder,
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        search_executor=executor
+    )
+    current_words = [create_wordly_word("CAT", [WordlyLetterState.incorrect] * 3)]
+    entropy_finder.get_informative_word = Mock(return_value="DOG")
+
+    result = await get_informative_word.execute(GetInformativeWordDTO(current_words=current_words, word_len=3))
+
+    assert result == "DOG"
+    assert executor.calls == 1
+    entropy_finder.get_informative_word.assert_called_once_with(
+        history=[("CAT", 0)],
+        language=Language.ENG,
+        wordly_len=3
+    )
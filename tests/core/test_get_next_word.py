@@ -3,18 +3,21 @@ from unittest.mock import create_autospec, AsyncMock, Mock
 
 import pytest
 
+from tests.core.helpers import TEST_ENG_USER, create_wordly_word
+from wordly_solver.core.game.ports.game_stats import GameEventKind, GameStats
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.ports.session_store import GameSessionStore
 from wordly_solver.core.game.ports.wordly_finder import WordlySearchDTO, WordlyFinder
-from wordly_solver.core.game.entities import WordlyLetter, WordlyLetterState, WordlyWord
+from wordly_solver.core.game.session import GameSession
+from wordly_solver.core.game.entities import WordlyLetterState
+from wordly_solver.core.game.feedback import get_wordly_word
 from wordly_solver.core.game.usecases.exceptions import IncorrectInputError
 from wordly_solver.core.game.usecases.get_suitable_word import GetSuitableWord, GetSuitableWordDTO
 from wordly_solver.core.user.ports.id_provider import IdProvider
 from wordly_solver.core.user.entities import User
 from wordly_solver.core.words.constants import Language
 from wordly_solver.core.words.ports.words_gateway import WordsGateway
-
-
-def create_wordly_word(word: str, states: list[WordlyLetterState]) -> WordlyWord:
-    return {i: WordlyLetter(value=char, state=state) for i, (char, state) in enumerate(zip(word, states))}
+from wordly_solver.data.adapters.memory_session_store import MemoryGameSessionStore
 
 
 @pytest.fixture
@@ -22,16 +25,6 @@ def wordly_solver() -> WordlyFinder:
     return create_autospec(WordlyFinder)
 
 
-@pytest.fixture
-def id_provider() -> IdProvider:
-    return create_autospec(IdProvider)
-
-
-@pytest.fixture
-def words_gateway() -> WordsGateway:
-    return create_autospec(WordsGateway)
-
-
 @pytest.fixture
 def get_suitable_word(
         wordly_solver: WordlyFinder,
@@ -191,7 +184,8 @@ def test_parse_exclude_letters_max_count(
                     positions_letter={0: 'C'},
                     exclude_positions={1: {'A'}},
                     max_count={},
-                    wordly_len=3
+                    wordly_len=3,
+                    min_count={'A': 1}
                 )
         ),
         # Test case 3: Multiple words with complex states
@@ -212,7 +206,8 @@ def test_parse_exclude_letters_max_count(
                     positions_letter={0: 'C', 1: 'O'},
                     exclude_positions={0: {'D'}, 1: {'A'}},
                     max_count={},
-                    wordly_len=3
+                    wordly_len=3,
+                    min_count={'A': 1, 'D': 1}
                 )
         ),
         # Test case 4: Word with repeated letters and mixed states
@@ -234,7 +229,8 @@ def test_parse_exclude_letters_max_count(
                     positions_letter={0: 'C', 2: 'N'},
                     exclude_positions={1: {'A'}},
                     max_count={'A': 1},
-                    wordly_len=4
+                    wordly_len=4,
+                    min_count={'A': 1}
                 )
         ),
         # Test case 5: All incorrect letters
@@ -299,7 +295,8 @@ def test_parse_exclude_letters_max_count(
                     positions_letter={0: 'C', 2: 'N'},
                     exclude_positions={1: {'A'}},
                     max_count={'A': 1},
-                    wordly_len=4
+                    wordly_len=4,
+                    min_count={'A': 1}
                 )
         )
     ]
@@ -309,7 +306,57 @@ def test_parse_to_wordly_search_dto(get_suitable_word, current_words, word_len,
     assert result == expected_dto
 
 
-TEST_ENG_USER = User(language=Language.ENG)
+@pytest.mark.parametrize(
+    "current_words, expected_min_count",
+    [
+        (
+                [
+                    create_wordly_word(
+                        "LEVEE",
+                        [
+                            WordlyLetterState.incorrect,
+                            WordlyLetterState.wrong_place,
+                            WordlyLetterState.incorrect,
+                            WordlyLetterState.correct,
+                            WordlyLetterState.incorrect
+                        ]
+                    )
+                ],
+                {'E': 2},
+        ),
+        (
+                [
+                    create_wordly_word("EERIE", [WordlyLetterState.wrong_place] * 2 + [WordlyLetterState.incorrect] * 3),
+                    create_wordly_word("THEME", [WordlyLetterState.incorrect] * 4 + [WordlyLetterState.correct]),
+                ],
+                # two E's seen, one of them is already known at position 4
+                {'E': 2},
+        ),
+        (
+                [create_wordly_word("SASSY", [WordlyLetterState.correct] + [WordlyLetterState.incorrect] * 4)],
+                {},
+        ),
+    ]
+)
+def test_parse_min_count(get_suitable_word, current_words, expected_min_count):
+    assert get_suitable_word._parse_to_wordly_search_dto(current_words, 5).min_count == expected_min_count
+
+
+TEST_REPEATS_WORDS = [
+    "eerie", "levee", "geese", "theme", "sassy", "asses", "tests", "steps", "spelt", "knees", "sense", "seven",
+]
+
+
+def test_parse_to_wordly_search_dto_keeps_consistent_words(get_suitable_word):
+    for answer in TEST_REPEATS_WORDS:
+        for first, second in zip(TEST_REPEATS_WORDS, TEST_REPEATS_WORDS[3:]):
+            current_words = [get_wordly_word(first, answer), get_wordly_word(second, answer)]
+            dto = get_suitable_word._parse_to_wordly_search_dto(current_words, 5)
+
+            for word in TEST_REPEATS_WORDS:
+                if all(get_wordly_word(guess, word) == wordly_word
+                       for guess, wordly_word in zip((first, second), current_words)):
+                    assert dto.matches(word), (answer, first, second, word)
 
 
 @pytest.mark.asyncio
@@ -356,7 +403,8 @@ async def test_execute_incorrect_word_length(get_suitable_word):
                     positions_letter={0: 'C'},
                     exclude_positions={1: {'A'}},
                     max_count={},
-                    wordly_len=3
+                    wordly_len=3,
+                    min_count={'A': 1}
                 )
         ),
         # Test case 2: Multiple words valid input
@@ -377,7 +425,8 @@ async def test_execute_incorrect_word_length(get_suitable_word):
                     positions_letter={0: 'C', 1: 'O'},
                     exclude_positions={0: {'D'}, 1: {'A'}},
                     max_count={},
-                    wordly_len=3
+                    wordly_len=3,
+                    min_count={'A': 1, 'D': 1}
                 )
         ),
         # Test case 3: No suitable word found
@@ -413,3 +462,282 @@ async def test_execute(get_suitable_word, wordly_solver, id_provider, current_wo
         language=Language.ENG
     )
     assert result == expected_result
+
+
+@pytest.fixture
+def session_store() -> GameSessionStore:
+    return MemoryGameSessionStore()
+
+
+@pytest.fixture
+def get_suitable_word_in_session(
+        wordly_solver: WordlyFinder,
+        id_provider: IdProvider,
+        words_gateway: WordsGateway,
+        session_store: GameSessionStore
+):
+    id_provider.get_current_user = Mock(return_value=TEST_ENG_USER)
+    return GetSuitableWord(
+        wordly_solver=wordly_solver,
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        session_store=session_store
+    )
+
+
+TEST_SESSION_HISTORY = [
+    create_wordly_word(
+        "CATS",
+        [
+            WordlyLetterState.correct,
+            WordlyLetterState.wrong_place,
+            WordlyLetterState.incorrect,
+            WordlyLetterState.incorrect
+        ]
+    ),
+    create_wordly_word(
+        "CANA",
+        [
+            WordlyLetterState.correct,
+            WordlyLetterState.wrong_place,
+            WordlyLetterState.correct,
+            WordlyLetterState.incorrect
+        ]
+    ),
+    create_wordly_word(
+        "CBNE",
+        [
+            WordlyLetterState.correct,
+            WordlyLetterState.incorrect,
+            WordlyLetterState.correct,
+            WordlyLetterState.incorrect
+        ]
+    ),
+]
+
+
+@pytest.mark.parametrize("turns", [1, 2, 3])
+def test_apply_to_session_same_as_parse(get_suitable_word, turns):
+    session = GameSession(language=Language.ENG, word_len=4)
+    for idx in range(turns):
+        search_dto = get_suitable_word._apply_to_session(session, TEST_SESSION_HISTORY[idx:idx + 1])
+
+    assert search_dto == get_suitable_word._parse_to_wordly_search_dto(TEST_SESSION_HISTORY[:turns], 4)
+    assert session.history == TEST_SESSION_HISTORY[:turns]
+
+
+@pytest.mark.asyncio
+async def test_execute_in_session(get_suitable_word_in_session, wordly_solver, session_store):
+    wordly_solver.get_candidates = Mock(return_value=["CDNA", "CONE", "CZAR"])
+
+    first = await get_suitable_word_in_session.execute(
+        GetSuitableWordDTO(current_words=TEST_SESSION_HISTORY[:1], word_len=4)
+    )
+    assert first in {"CDNA", "CONE", "CZAR"}
+    wordly_solver.get_candidates.assert_called_once_with(
+        dto=get_suitable_word_in_session._parse_to_wordly_search_dto(TEST_SESSION_HISTORY[:1], 4),
+        language=Language.ENG
+    )
+
+    # the finder is not asked again, survivors are filtered by the new guesses only
+    for _ in range(10):
+        result = await get_suitable_word_in_session.execute(
+            GetSuitableWordDTO(current_words=TEST_SESSION_HISTORY, word_len=4)
+        )
+        assert result == "CDNA"
+    wordly_solver.get_candidates.assert_called_once()
+
+    session = await session_store.get(TEST_ENG_USER.id, 4)
+    assert session.candidates == ["CDNA"]
+
+
+@pytest.mark.asyncio
+async def test_execute_in_session_new_game(get_suitable_word_in_session, wordly_solver):
+    wordly_solver.get_candidates = Mock(return_value=[])
+
+    await get_suitable_word_in_session.execute(
+        GetSuitableWordDTO(current_words=TEST_SESSION_HISTORY[:2], word_len=4)
+    )
+    result = await get_suitable_word_in_session.execute(
+        GetSuitableWordDTO(current_words=TEST_SESSION_HISTORY[2:], word_len=4)
+    )
+
+    assert result is None
+    assert wordly_solver.get_candidates.call_count == 2
+    wordly_solver.get_candidates.assert_called_with(
+        dto=get_suitable_word_in_session._parse_to_wordly_search_dto(TEST_SESSION_HISTORY[2:], 4),
+        language=Language.ENG
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_top(wordly_solver, id_provider, words_gateway):
+    get_suitable_word = GetSuitableWord(
+        wordly_solver=wordly_solver,
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        ranked=True
+    )
+    id_provider.get_current_user = Mock(return_value=TEST_ENG_USER)
+    wordly_solver.get_top_candidates = Mock(return_value=["CAR", "CAB"])
+    current_words = TEST_SESSION_HISTORY[:1]
+
+    result = await get_suitable_word.execute_top(GetSuitableWordDTO(current_words=current_words, word_len=4), k=2)
+
+    assert result == ["CAR", "CAB"]
+    wordly_solver.get_top_candidates.assert_called_once_with(
+        dto=get_suitable_word._parse_to_wordly_search_dto(current_words, 4),
+        language=Language.ENG,
+        k=2
+    )
+
+    # ranked execute answers the best word instead of a random one
+    assert await get_suitable_word.execute(GetSuitableWordDTO(current_words=current_words, word_len=4)) == "CAR"
+    assert wordly_solver.get_top_candidates.call_args.kwargs["k"] == 1
+    wordly_solver.wordly_search.assert_not_called()
+
+    wordly_solver.get_top_candidates = Mock(return_value=[])
+    assert await get_suitable_word.execute(GetSuitableWordDTO(current_words=current_words, word_len=4)) is None
+
+
+@pytest.mark.asyncio
+async def test_anonymous_user_has_no_session(get_suitable_word_in_session, id_provider, wordly_solver, session_store):
+    id_provider.get_current_user = Mock(return_value=User(language=Language.ENG))
+    wordly_solver.wordly_search = Mock(return_value="CDNA")
+
+    for _ in range(2):
+        result = await get_suitable_word_in_session.execute(
+            GetSuitableWordDTO(current_words=TEST_SESSION_HISTORY[:1], word_len=4)
+        )
+        assert result == "CDNA"
+
+    assert wordly_solver.wordly_search.call_count == 2
+    wordly_solver.get_candidates.assert_not_called()
+    assert await session_store.get(0, 4) is None
+
+
+@pytest.mark.asyncio
+async def test_execute_top_in_session(get_suitable_word_in_session, wordly_solver):
+    candidates = ["CDNA", "CONE", "CZAR"]
+    wordly_solver.get_candidates = Mock(return_value=list(candidates))
+    wordly_solver.rank_words = Mock(return_value=["CONE", "CDNA"])
+
+    first = await get_suitable_word_in_session.execute_top(
+        GetSuitableWordDTO(current_words=TEST_SESSION_HISTORY[:1], word_len=4), k=2
+    )
+    assert first == ["CONE", "CDNA"]
+    wordly_solver.rank_words.assert_called_with(words=candidates, language=Language.ENG, wordly_len=4, k=2)
+
+    await get_suitable_word_in_session.execute_top(
+        GetSuitableWordDTO(current_words=TEST_SESSION_HISTORY, word_len=4), k=2
+    )
+    # the finder ranks only what survived in the session
+    wordly_solver.rank_words.assert_called_with(words=["CDNA"], language=Language.ENG, wordly_len=4, k=2)
+    wordly_solver.get_candidates.assert_called_once()
+    wordly_solver.get_top_candidates.assert_not_called()
+
+
+class RecordingSearchExecutor(SearchExecutor):
+    def __init__(self, finder: WordlyFinder) -> None:
+        self.finder = finder
+        self.calls = 0
+
+    async def run(self, call):
+        self.calls += 1
+        return call(self.finder)
+
+
+@pytest.mark.asyncio
+async def test_execute_with_search_executor(wordly_solver, id_provider, words_gateway):
+    executor = RecordingSearchExecutor(wordly_solver)
+    get_suitable_word = GetSuitableWord(
+        wordly_solver=wordly_solver,
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        search_executor=executor
+    )
+    id_provider.get_current_user = Mock(return_value=TEST_ENG_USER)
+    wordly_solver.wordly_search = Mock(return_value="CAR")
+    current_words = [
+        create_wordly_word(
+            "CAT",
+            [WordlyLetterState.correct, WordlyLetterState.wrong_place, WordlyLetterState.incorrect]
+        )
+    ]
+
+    result = await get_suitable_word.execute(GetSuitableWordDTO(current_words=current_words, word_len=3))
+
+    assert result == "CAR"
+    assert executor.calls == 1
+    wordly_solver.wordly_search.assert_called_once_with(
+        dto=get_suitable_word._parse_to_wordly_search_dto(current_words, 3),
+        language=Language.ENG
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_records_game_stats(wordly_solver, id_provider, words_gateway):
+    game_stats = create_autospec(GameStats)
+    get_suitable_word = GetSuitableWord(
+        wordly_solver=wordly_solver,
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        game_stats=game_stats,
+        max_guesses=4
+    )
+    id_provider.get_current_user = Mock(return_value=TEST_ENG_USER)
+    words_gateway.get_first_word = AsyncMock(return_value="CAT")
+    wordly_solver.wordly_search = Mock(return_value="CAR")
+    states = [WordlyLetterState.correct, WordlyLetterState.correct, WordlyLetterState.incorrect]
+
+    await get_suitable_word.execute(GetSuitableWordDTO(current_words=[], word_len=3))
+    await get_suitable_word.execute(GetSuitableWordDTO(
+        current_words=[create_wordly_word("CAT", states)], word_len=3
+    ))
+    await get_suitable_word.execute(GetSuitableWordDTO(
+        current_words=[create_wordly_word("CAT", states), create_wordly_word("CAR", [WordlyLetterState.correct] * 3)],
+        word_len=3
+    ))
+    for guesses in (4, 5):
+        await get_suitable_word.execute(GetSuitableWordDTO(
+            current_words=[create_wordly_word("CAT", states)] * guesses, word_len=3
+        ))
+
+    events = [call.args[0] for call in game_stats.record.call_args_list]
+    assert [(event.kind, event.guesses, event.word, event.won) for event in events] == [
+        (GameEventKind.suggestion, 0, "CAT", None),
+        (GameEventKind.guess, 1, "CAT", None),
+        (GameEventKind.suggestion, 1, "CAR", None),
+        (GameEventKind.guess, 2, "CAR", None),
+        (GameEventKind.outcome, 2, None, True),
+        (GameEventKind.guess, 4, "CAT", None),
+        (GameEventKind.outcome, 4, None, False),
+        (GameEventKind.guess, 5, "CAT", None),
+    ]
+    assert {(event.user_id, event.language, event.word_len) for event in events} == {
+        (TEST_ENG_USER.id, Language.ENG, 3)
+    }
+
+
+@pytest.mark.asyncio
+async def test_execute_repeated_outcome_has_same_game(wordly_solver, id_provider, words_gateway):
+    game_stats = create_autospec(GameStats)
+    get_suitable_word = GetSuitableWord(
+        wordly_solver=wordly_solver,
+        id_provider=id_provider,
+        words_gateway=words_gateway,
+        game_stats=game_stats
+    )
+    id_provider.get_current_user = Mock(return_value=TEST_ENG_USER)
+    won = [create_wordly_word("CAR", [WordlyLetterState.correct] * 3)]
+    playing = [create_wordly_word("CAT", [WordlyLetterState.incorrect] * 3)]
+
+    for current_words in (won, won, playing):
+        await get_suitable_word.execute(GetSuitableWordDTO(current_words=current_words, word_len=3))
+
+    games = [
+        call.args[0].game for call in game_stats.record.call_args_list
+        if call.args[0].kind == GameEventKind.outcome
+    ]
+    assert games[0] == games[1]
+    assert len(games) == 2
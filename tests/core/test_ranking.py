@@ -0,0 +1,35 @@
+import pytest
+
+from wordly_solver.core.game.ranking import LetterFrequencies, rank_words
+
+WORDS = ["abc", "abd", "xbd", "xyz"]
+
+
+def test_letter_frequencies():
+    frequencies = LetterFrequencies.from_words(WORDS + ["aab"], 3)
+
+    assert frequencies.total == 5
+    assert frequencies.present == {"a": 3, "b": 4, "c": 1, "d": 2, "x": 2, "y": 1, "z": 1}
+    assert frequencies.positional == [{"a": 3, "x": 2}, {"b": 3, "y": 1, "a": 1}, {"c": 1, "d": 2, "z": 1, "b": 1}]
+
+
+@pytest.mark.parametrize(
+    "word, ignore, expected",
+    [
+        ("abd", frozenset(), 10),  # a 2 of 4, b 3 of 4, d 2 of 4, same at their positions
+        ("abc", frozenset(), 8),
+        ("abd", {"d"}, 6),
+        ("bbb", frozenset(), 1 + 1),  # b in 3 of 4 words, at position 1 only
+        ("qqq", frozenset(), 0),
+    ],
+)
+def test_get_split_score(word: str, ignore: frozenset, expected: int):
+    assert LetterFrequencies.from_words(WORDS, 3).get_split_score(word, ignore) == expected
+
+
+def test_rank_words():
+    frequencies = LetterFrequencies.from_words(WORDS, 3)
+
+    assert rank_words(WORDS, 3, frequencies) == ["abd", "xbd", "abc"]
+    assert rank_words(WORDS, 3, frequencies, ignore={"d"}) == ["abc", "xyz", "abd"]
+    assert rank_words([], 3, frequencies) == []
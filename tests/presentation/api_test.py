@@ -0,0 +1,216 @@
+import gc
+import threading
+from typing import Iterator, List
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from wordly_solver.core.game.feedback import get_feedback
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.sqlite_game_stats import GameStatsClosedError, SqliteGameStats
+from wordly_solver.presentation.api.app import create_app
+from wordly_solver.presentation.indexes import InitWords, WordIndexes
+
+TEST_WORDS = {
+    (Language.ENG, 5): {"crane", "slate", "cases", "bases", "light"},
+    (Language.RU, 4): {"пиво", "вода", "сода"},
+    (Language.ENG, 7): set(),  # empty lists are not indexed
+}
+
+
+def _load_test_words() -> InitWords:
+    return {key: set(words) for key, words in TEST_WORDS.items()}
+
+
+def _guess(guess: str, answer: str) -> List[dict]:
+    return [
+        {"value": letter, "state": state.name} for letter, state in zip(guess, get_feedback(guess, answer))
+    ]
+
+
+@pytest.fixture(autouse=True)
+def unfreeze() -> Iterator[None]:
+    yield
+    gc.unfreeze()
+
+
+@pytest.fixture
+def indexes() -> WordIndexes:
+    indexes = WordIndexes(_load_test_words)
+    indexes.load()
+    return indexes
+
+
+@pytest.fixture
+def client(indexes: WordIndexes) -> Iterator[TestClient]:
+    with TestClient(create_app(indexes, search_workers=1)) as client:
+        yield client
+
+
+def test_load_freezes_indexes():
+    indexes = WordIndexes(_load_test_words)
+    assert not indexes.ready
+
+    gc.unfreeze()
+    indexes.load()
+    frozen = gc.get_freeze_count()
+    indexes.load()  # already loaded, nothing is built again
+
+    assert indexes.ready
+    assert frozen > 0
+    assert gc.get_freeze_count() == frozen
+    assert indexes.words_count == {(Language.ENG, 5): 5, (Language.RU, 4): 3}
+    assert indexes.first_words[(Language.RU, 4)] == "вода"
+
+
+def test_ready(client: TestClient):
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "ready": True,
+        "indexes": [
+            {"language": "ENG", "word_len": 5, "words": 5},
+            {"language": "RU", "word_len": 4, "words": 3},
+        ],
+        "error": None,
+    }
+    assert client.get("/health").json() == {"status": "ok"}
+
+
+def test_language_schema(client: TestClient):
+    schemas = client.get("/openapi.json").json()["components"]["schemas"]
+
+    assert schemas["LanguageName"] == {"type": "string", "enum": ["RU", "ENG"]}
+    for name in ("WordRequest", "IndexSchema"):
+        assert schemas[name]["properties"]["language"] == {"$ref": "#/components/schemas/LanguageName"}
+
+    response = client.post("/words/suitable", json={"language": "ENG", "word_len": 6})
+    assert response.json() == {"detail": "No ENG words of length 6"}
+
+
+def test_suitable_word(client: TestClient, indexes: WordIndexes):
+    first = client.post("/words/suitable", json={"language": "ENG", "word_len": 5})
+    assert first.json() == {"word": indexes.first_words[(Language.ENG, 5)]}
+
+    response = client.post(
+        "/words/suitable",
+        json={"language": "ENG", "word_len": 5, "current_words": [_guess("crane", "bases"), _guess("cases", "bases")]},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"word": "bases"}
+
+    response = client.post(
+        "/words/suitable",
+        json={"language": "RU", "word_len": 4, "current_words": [_guess("вода", "пиво")]},
+    )
+    assert response.json() == {"word": "пиво"}
+
+
+@pytest.mark.asyncio
+async def test_game_stats_follow_app(indexes: WordIndexes, tmp_path):
+    stats = SqliteGameStats(tmp_path / "stats.db", flush_interval=60)
+
+    with TestClient(create_app(indexes, search_workers=1, game_stats=stats)) as client:
+        client.post("/words/suitable", json={"language": "ENG", "word_len": 5})
+        client.post(
+            "/words/suitable",
+            json={"language": "ENG", "word_len": 5, "current_words": [_guess("bases", "bases")]},
+        )
+
+    with pytest.raises(GameStatsClosedError):  # closed on shutdown
+        await stats.get_rollups()
+
+    await stats.start()
+    rollups = await stats.get_rollups()
+    await stats.close()
+    assert [(rollup.games, rollup.wins, rollup.suggestions) for rollup in rollups] == [(1, 1, 1)]
+
+
+def test_exclude_word(client: TestClient):
+    response = client.post(
+        "/words/exclude",
+        json={"language": "ENG", "word_len": 5, "current_words": [_guess("cases", "light")]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"word": "light"}
+
+
+def test_top_words(client: TestClient):
+    response = client.post("/words/suitable/top", params={"k": 3}, json={"language": "ENG", "word_len": 5})
+    assert response.status_code == 200
+    assert response.json() == {"words": ["cases", "slate", "bases"]}
+
+    response = client.post(
+        "/words/suitable/top",
+        json={"language": "ENG", "word_len": 5, "current_words": [_guess("crane", "bases")]},
+    )
+    assert response.json() == {"words": ["bases"]}
+
+    response = client.post(
+        "/words/exclude/top",
+        params={"k": 2},
+        json={"language": "ENG", "word_len": 5, "current_words": [_guess("light", "bases")]},
+    )
+    assert response.json() == {"words": ["cases", "bases"]}  # crane has no unused letter either, but splits worse
+
+    response = client.post("/words/exclude/top", params={"k": 0}, json={"language": "ENG", "word_len": 5})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "body, status_code",
+    [
+        ({"language": "ENG", "word_len": 6}, 404),
+        ({"language": "ENG", "word_len": 7}, 404),
+        ({"language": "DE", "word_len": 5}, 422),
+        ({"language": "ENG", "word_len": 5, "current_words": [_guess("cases", "bases")[:4]]}, 422),
+    ],
+)
+def test_bad_requests(client: TestClient, body: dict, status_code: int):
+    assert client.post("/words/suitable", json=body).status_code == status_code
+
+
+def test_not_ready_until_loaded():
+    release = threading.Event()
+
+    def slow_loader() -> InitWords:
+        release.wait(timeout=5)
+        return _load_test_words()
+
+    with TestClient(create_app(WordIndexes(slow_loader), search_workers=1)) as client:
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["ready"] is False
+
+        response = client.post("/words/suitable", json={"language": "ENG", "word_len": 5})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+        release.set()
+        for _ in range(500):
+            if client.get("/ready").status_code == 200:
+                break
+            threading.Event().wait(0.01)
+
+        assert client.post("/words/suitable", json={"language": "RU", "word_len": 4}).json() == {"word": "вода"}
+
+
+def test_load_error_is_reported():
+    def broken_loader() -> InitWords:
+        raise OSError("words.csv is missing")
+
+    with TestClient(create_app(WordIndexes(broken_loader), search_workers=1)) as client:
+        for _ in range(500):
+            response = client.get("/ready")
+            if response.json()["error"] is not None:
+                break
+            threading.Event().wait(0.01)
+
+        assert response.status_code == 503
+        assert response.json()["error"] == "OSError: words.csv is missing"
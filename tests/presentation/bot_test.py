@@ -0,0 +1,254 @@
+import asyncio
+import gc
+import itertools
+from typing import AsyncIterator, Callable, Iterator, List, Tuple
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiogram")
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from wordly_solver.core.game.feedback import STATE_DIGITS, get_feedback
+from wordly_solver.core.game.entities import WordlyLetterState
+from wordly_solver.core.game.ports.history_store import GameHistoryStore
+from wordly_solver.core.game.ports.search_executor import SearchExecutor
+from wordly_solver.core.game.ports.wordly_finder import WordlyFinder
+from wordly_solver.core.game.session import GameHistory
+from wordly_solver.core.game.usecases.exceptions import SearchBusyError
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.packed_history_store import PackedGameHistoryStore
+from wordly_solver.data.adapters.search_executor import InlineSearchExecutor
+from wordly_solver.presentation.bot.app import (
+    BUSY_TEXT,
+    HELP_TEXT,
+    NO_GAME_TEXT,
+    NO_WORDS_TEXT,
+    GuessFormatError,
+    create_dispatcher,
+    parse_guess,
+)
+from wordly_solver.presentation.indexes import WordIndexes
+
+TOKEN = "42:TEST"
+TEST_WORDS = {
+    (Language.ENG, 5): {"crane", "slate", "cases", "bases", "light"},
+    (Language.RU, 4): {"пиво", "вода", "сода"},
+}
+
+
+def _marks(guess: str, answer: str) -> str:
+    return "".join(str(STATE_DIGITS[state]) for state in get_feedback(guess, answer))
+
+
+class FakeTelegram:
+    """
+        Bot API stand-in: serves queued updates to getUpdates and records sendMessage calls
+    """
+
+    def __init__(self) -> None:
+        self.updates: List[dict] = []
+        self.sent: List[Tuple[int, str]] = []
+        self._update_ids = itertools.count(1)
+        self._changed = asyncio.Condition()
+
+    def push(self, chat_id: int, text: str, language_code: str = "en") -> None:
+        update_id = next(self._update_ids)
+        self.updates.append({
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "private"},
+                "from": {"id": chat_id, "is_bot": False, "first_name": "player", "language_code": language_code},
+                "text": text,
+            },
+        })
+
+    async def wait_sent(self, count: int) -> List[Tuple[int, str]]:
+        async with self._changed:
+            await asyncio.wait_for(self._changed.wait_for(lambda: len(self.sent) >= count), timeout=5)
+        return self.sent
+
+    async def handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        data = await request.post()
+
+        if method == "getMe":
+            result = {"id": 42, "is_bot": True, "first_name": "wordly", "username": "wordly_bot"}
+        elif method == "getUpdates":
+            offset = int(data.get("offset", 0))
+            updates = [update for update in self.updates if update["update_id"] >= offset]
+            if not updates:
+                await asyncio.sleep(0.01)  # short long polling
+            result = updates
+        elif method == "sendMessage":
+            chat_id = int(data["chat_id"])
+            async with self._changed:
+                self.sent.append((chat_id, str(data["text"])))
+                self._changed.notify_all()
+            result = {
+                "message_id": len(self.sent),
+                "date": 0,
+                "chat": {"id": chat_id, "type": "private"},
+                "text": data["text"],
+            }
+        else:
+            result = True
+
+        return web.json_response({"ok": True, "result": result})
+
+
+class BarrierSearchExecutor(SearchExecutor):
+    """
+        Lets searches through only in groups of parties, so they pass only if updates are handled concurrently
+    """
+
+    def __init__(self, finder: WordlyFinder, parties: int) -> None:
+        self.finder = finder
+        self.barrier = asyncio.Barrier(parties)
+
+    async def run[T](self, call: Callable[[WordlyFinder], T]) -> T:
+        await asyncio.wait_for(self.barrier.wait(), timeout=5)
+        return call(self.finder)
+
+
+class BusySearchExecutor(SearchExecutor):
+    async def run[T](self, call: Callable[[WordlyFinder], T]) -> T:
+        raise SearchBusyError()
+
+
+@pytest.fixture(autouse=True)
+def unfreeze() -> Iterator[None]:
+    yield
+    gc.unfreeze()
+
+
+@pytest.fixture
+def indexes() -> WordIndexes:
+    indexes = WordIndexes(lambda: TEST_WORDS)
+    indexes.load()
+    return indexes
+
+
+@pytest_asyncio.fixture
+async def telegram() -> AsyncIterator[FakeTelegram]:
+    fake = FakeTelegram()
+    app = web.Application()
+    app.router.add_post("/bot{token}/{method}", fake.handle)
+
+    server = TestServer(app)
+    await server.start_server()
+    fake.url = str(server.make_url("")).rstrip("/")
+    try:
+        yield fake
+    finally:
+        await server.close()
+
+
+async def _run_bot(
+        telegram: FakeTelegram,
+        indexes: WordIndexes,
+        search_executor: SearchExecutor,
+        replies: int,
+        history_store: GameHistoryStore | None = None,
+) -> List[Tuple[int, str]]:
+    bot = Bot(token=TOKEN, session=AiohttpSession(api=TelegramAPIServer.from_base(telegram.url)))
+    dispatcher = create_dispatcher(indexes, search_executor, history_store or PackedGameHistoryStore())
+
+    polling = asyncio.create_task(dispatcher.start_polling(bot, handle_signals=False, polling_timeout=1))
+    try:
+        return await telegram.wait_sent(replies)
+    finally:
+        await dispatcher.stop_polling()
+        await polling
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("crane 02100", (Language.ENG, [WordlyLetterState.incorrect, WordlyLetterState.correct,
+                                        WordlyLetterState.wrong_place, WordlyLetterState.incorrect,
+                                        WordlyLetterState.incorrect])),
+        ("ВОДА ⬜️🟨 🟩⬛", (Language.RU, [WordlyLetterState.incorrect, WordlyLetterState.wrong_place,
+                                        WordlyLetterState.correct, WordlyLetterState.incorrect])),
+    ],
+)
+def test_parse_guess(text: str, expected: tuple):
+    language, guess = parse_guess(text)
+
+    assert (language, [letter.state for letter in guess.values()]) == expected
+    assert "".join(letter.value for letter in guess.values()) == text.split()[0].lower()
+
+
+@pytest.mark.parametrize("text", ["crane", "crane 0210", "crane 02103", "cr4ne 02100", "сrane 02100"])
+def test_parse_guess_errors(text: str):
+    with pytest.raises(GuessFormatError):
+        parse_guess(text)
+
+
+@pytest.mark.asyncio
+async def test_bot_plays_games(telegram: FakeTelegram, indexes: WordIndexes):
+    telegram.push(1, "/start")
+    telegram.push(1, "/exclude")
+    telegram.push(1, "/new 5 en")
+    telegram.push(1, f"crane {_marks('crane', 'bases')}")
+    telegram.push(1, "/exclude")
+    telegram.push(2, f"вода {_marks('вода', 'пиво')}", language_code="ru")
+    telegram.push(2, "/new 9")
+    telegram.push(2, "hello")
+
+    sent = await _run_bot(telegram, indexes, InlineSearchExecutor(indexes.finder), replies=8)
+
+    assert [text for chat_id, text in sent if chat_id == 1] == [
+        HELP_TEXT,
+        NO_GAME_TEXT,
+        indexes.first_words[(Language.ENG, 5)],
+        "bases",
+        "light",  # the only word without c, r, a, n, e
+    ]
+    assert [text for chat_id, text in sent if chat_id == 2][:2] == ["пиво", NO_WORDS_TEXT]
+    assert len(sent) == 8
+
+
+@pytest.mark.asyncio
+async def test_bot_handles_chats_concurrently(telegram: FakeTelegram, indexes: WordIndexes):
+    telegram.push(1, f"crane {_marks('crane', 'bases')}")
+    telegram.push(2, f"вода {_marks('вода', 'пиво')}")
+
+    # each search waits for the other one, sequential handling would time out
+    sent = await _run_bot(telegram, indexes, BarrierSearchExecutor(indexes.finder, parties=2), replies=2)
+
+    assert sorted(sent) == [(1, "bases"), (2, "пиво")]
+
+
+@pytest.mark.asyncio
+async def test_bot_reports_busy_search(telegram: FakeTelegram, indexes: WordIndexes):
+    telegram.push(1, f"crane {_marks('crane', 'bases')}")
+
+    sent = await _run_bot(telegram, indexes, BusySearchExecutor(), replies=1)
+
+    assert sent == [(1, BUSY_TEXT)]
+
+
+@pytest.mark.asyncio
+async def test_bot_keeps_history_when_search_fails(telegram: FakeTelegram, indexes: WordIndexes):
+    history_store = PackedGameHistoryStore()
+    first_guess = parse_guess(f"crane {_marks('crane', 'bases')}")[1]
+    await history_store.save(1, GameHistory(language=Language.ENG, word_len=5, words=[first_guess]))
+    telegram.push(1, f"cases {_marks('cases', 'bases')}")
+
+    await _run_bot(telegram, indexes, BusySearchExecutor(), replies=1, history_store=history_store)
+
+    history = await history_store.get(1)
+    assert history is not None and history.words == [first_guess]
+
+
+def test_dispatcher_needs_loaded_indexes():
+    with pytest.raises(RuntimeError):
+        create_dispatcher(WordIndexes(lambda: TEST_WORDS), BusySearchExecutor(), PackedGameHistoryStore())
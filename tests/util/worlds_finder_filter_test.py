@@ -0,0 +1,173 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("tqdm")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+# util scripts import their helpers as top-level modules, as when run from util/
+sys.path.insert(0, str(Path(__file__).parents[2] / "util"))
+
+from worlds_finder_filter import (  # noqa: E402
+    CORRECT,
+    INCORRECT,
+    FilterConfig,
+    main,
+    parse_cookies,
+    process_words,
+    read_checkpoint,
+)
+
+KNOWN_WORDS = {"apple", "berry", "cherry", "grape"}
+
+
+class StandIn:
+    """
+        Dictionary endpoint stand-in: answers like the real one, can fail first requests of a word,
+        answer a word with another body and holds every request for delay seconds
+    """
+
+    def __init__(self) -> None:
+        self.failures: Dict[str, List[int]] = {}  # word -> statuses to answer before the real answer
+        self.bodies: Dict[str, Any] = {}  # word -> json body to answer instead of the real one
+        self.requests: List[str] = []
+        self.started: List[float] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        word = request.query["word"]
+        self.requests.append(word)
+        self.started.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if statuses := self.failures.get(word):
+            return web.Response(status=statuses.pop(0), headers={"Retry-After": "0"})
+        if word in self.bodies:
+            return web.json_response(self.bodies[word])
+
+        words = [{"word": word}] if word in KNOWN_WORDS else []
+        return web.json_response({"data": {"total_words": len(words), "sections": [{"words": words}]}})
+
+
+@pytest_asyncio.fixture
+async def stand_in() -> AsyncIterator[StandIn]:
+    fake = StandIn()
+    app = web.Application()
+    app.router.add_get("/find", fake.handle)
+
+    server = TestServer(app)
+    await server.start_server()
+    fake.endpoint = str(server.make_url("/find")) + "?word={word}"
+    try:
+        yield fake
+    finally:
+        await server.close()
+
+
+def _config(stand_in: StandIn, **kwargs) -> FilterConfig:
+    return FilterConfig(**{"endpoint": stand_in.endpoint, "rate": 0, "backoff": 0.001, "timeout": 5} | kwargs)
+
+
+@pytest.mark.asyncio
+async def test_process_words(stand_in: StandIn, tmp_path: Path):
+    checkpoint = tmp_path / "checked5words.csv"
+
+    answers = await process_words(["apple", "mango", "apple"], checkpoint, _config(stand_in))
+
+    assert answers == {"apple": CORRECT, "mango": INCORRECT}
+    assert sorted(stand_in.requests) == ["apple", "mango"]
+    assert read_checkpoint(checkpoint) == answers
+
+
+@pytest.mark.asyncio
+async def test_retries_after_429_and_5xx(stand_in: StandIn, tmp_path: Path):
+    stand_in.failures = {"apple": [429, 503], "grape": [500, 500, 500]}
+
+    answers = await process_words(["apple", "grape"], tmp_path / "checked.csv", _config(stand_in, retries=2))
+
+    assert answers["apple"] == CORRECT
+    assert stand_in.requests.count("apple") == 3
+    assert answers["grape"] == "error: RetryableError: HTTP 500"  # the first try and 2 retries failed
+    assert stand_in.requests.count("grape") == 3
+
+
+@pytest.mark.asyncio
+async def test_malformed_answers_are_errors(stand_in: StandIn, tmp_path: Path):
+    stand_in.bodies = {
+        "apple": {"data": {"total_words": 1, "sections": "apple"}},
+        "berry": {"data": {"total_words": 1, "sections": [{"words": [{"text": "berry"}]}]}},
+        "grape": ["grape"],
+    }
+
+    answers = await process_words(
+        ["apple", "berry", "grape", "cherry"], tmp_path / "checked.csv", _config(stand_in, retries=2)
+    )
+
+    assert answers["cherry"] == CORRECT
+    assert all(answers[word].startswith("error: malformed answer: ") for word in stand_in.bodies)
+    assert sorted(stand_in.requests) == ["apple", "berry", "cherry", "grape"]  # not retried
+
+
+@pytest.mark.asyncio
+async def test_resumes_from_checkpoint(stand_in: StandIn, tmp_path: Path):
+    checkpoint = tmp_path / "checked.csv"
+    # a killed run: berry failed, cherry was being written
+    checkpoint.write_text("apple,correct\nmango,incorrect\nberry,error: HTTP 503\ncherry,cor", encoding="utf-8")
+
+    answers = await process_words(["apple", "mango", "berry", "cherry"], checkpoint, _config(stand_in))
+
+    assert sorted(stand_in.requests) == ["berry", "cherry"]
+    assert answers == {"apple": CORRECT, "mango": INCORRECT, "berry": CORRECT, "cherry": CORRECT}
+    assert read_checkpoint(checkpoint) == answers
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap(stand_in: StandIn, tmp_path: Path):
+    stand_in.delay = 0.02
+
+    await process_words([f"word{idx}" for idx in range(12)], tmp_path / "checked.csv", _config(stand_in, concurrency=3))
+
+    assert stand_in.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_cap(stand_in: StandIn, tmp_path: Path):
+    rate = 50
+
+    await process_words(
+        [f"word{idx}" for idx in range(6)], tmp_path / "checked.csv", _config(stand_in, concurrency=6, rate=rate)
+    )
+
+    gaps = [later - earlier for earlier, later in zip(stand_in.started, stand_in.started[1:])]
+    assert min(gaps) >= 0.8 / rate  # some slack for the server clock
+    assert stand_in.started[-1] - stand_in.started[0] >= 5 * 0.9 / rate
+
+
+def test_parse_cookies():
+    assert parse_cookies("XSRF-TOKEN=abc%3D; session=x=y ;; broken") == {"XSRF-TOKEN": "abc%3D", "session": "x=y"}
+    assert parse_cookies("") == {}
+
+
+def test_main_refuses_to_overwrite_input(tmp_path: Path):
+    words = tmp_path / "correct5words.csv"
+    words.write_text("apple\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        main(["--words", str(words), "--output-dir", str(tmp_path)])
+
+    assert words.read_text(encoding="utf-8") == "apple\n"
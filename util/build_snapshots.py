@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+from wordly_solver.data.adapters.words_snapshot import build_snapshots
+
+from util import get_all_english_words
+
+if __name__ == "__main__":
+    directory = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("snapshots")
+    word_sizes = [int(size) for size in sys.argv[2:]] or [5]
+
+    paths = build_snapshots(get_all_english_words(word_sizes), directory)
+    for path in paths.values():
+        print(f"{path}: {path.stat().st_size} bytes")
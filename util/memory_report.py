@@ -0,0 +1,100 @@
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.wordly_bitset import BitsetWordsIndex
+from wordly_solver.data.adapters.wordly_tree import AllWordsTree, LetterNode
+
+from util import get_all_english_words
+
+
+@dataclass
+class LegacyLetterNode:
+    """
+        Node layout before slots and suffix sharing, kept only as a baseline for the report
+    """
+    letter_high: int
+    letter: str
+    children: Dict[str, "LegacyLetterNode"] = field(default_factory=dict)
+    parent: Optional["LegacyLetterNode"] = None
+
+    visited: bool = False
+
+
+def build_legacy_tree(init_words: Dict[Tuple[Language, int], Set[str]]) -> Dict[Tuple[Language, int], LegacyLetterNode]:
+    roots = {}
+    for key, words in init_words.items():
+        root = roots[key] = LegacyLetterNode(letter_high=0, letter=None)  # type: ignore
+        for word in words:
+            current = root
+            for idx, letter in enumerate(word):
+                if letter not in current.children:
+                    current.children[letter] = LegacyLetterNode(
+                        letter=letter, parent=current, letter_high=idx + 1
+                    )
+                current = current.children[letter]
+
+    return roots
+
+
+def count_nodes(root: LetterNode | LegacyLetterNode) -> int:
+    seen = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.extend(node.children.values())
+
+    return len(seen)
+
+
+def measure_memory(factory: Callable[[], object]) -> Tuple[object, int]:
+    tracemalloc.start()
+    result = factory()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def memory_report(init_words: Dict[Tuple[Language, int], Set[str]]) -> None:
+    total_words = sum(len(words) for words in init_words.values())
+    print(f"Words: {total_words}")
+
+    layouts: Dict[str, Callable[[], object]] = {
+        "legacy trie": lambda: build_legacy_tree(init_words),
+        "slots trie": lambda: AllWordsTree(init_words, minimize=False),
+        "slots DAWG": lambda: AllWordsTree(init_words),
+        "bitset": lambda: BitsetWordsIndex(init_words),
+    }
+    try:
+        from wordly_solver.data.adapters.wordly_matrix import MatrixWordsIndex
+        layouts["numpy matrix"] = lambda: MatrixWordsIndex(init_words)
+    except ImportError:
+        pass
+
+    baseline = None
+    for name, factory in layouts.items():
+        index, size = measure_memory(factory)
+        baseline = baseline or size
+
+        nodes = ""
+        if isinstance(index, dict):
+            nodes = f", {sum(count_nodes(root) for root in index.values())} nodes"
+        elif isinstance(index, AllWordsTree):
+            nodes = f", {sum(count_nodes(index._get_root_by_lang(*key)) for key in init_words)} nodes"
+
+        print(
+            f"{name:>14}: {size / 1024 / 1024:8.2f} MiB, "
+            f"{size / total_words:7.1f} B/word, {size / baseline:6.1%} of legacy{nodes}"
+        )
+
+
+if __name__ == "__main__":
+    word_sizes = [int(size) for size in sys.argv[1:]] or [5]
+    memory_report(get_all_english_words(word_sizes))
@@ -1,29 +1,40 @@
 import time
 from functools import wraps
-from typing import List
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
 
+from wordly_solver.core.words.constants import Language
+from wordly_solver.data.adapters.words_ingest import load_words
 
-def is_letter_str(s: str) -> bool:
-    for c in s:
-        if not c.isalpha():
-            return False
-    return True
+
+def get_words_file(word_size: int) -> Path:
+    return Path("correct5words.csv" if word_size == 5 else "words.csv")
+
+
+def get_all_english_words(word_sizes: Iterable[int]) -> Dict[Tuple[Language, int], Set[str]]:
+    """
+        Every word file is read once, whatever the number of sizes it serves
+    """
+    sizes_by_file: Dict[Path, List[int]] = {}
+    for word_size in word_sizes:
+        sizes_by_file.setdefault(get_words_file(word_size), []).append(word_size)
+
+    init_words: Dict[Tuple[Language, int], Set[str]] = {}
+    for path, sizes in sizes_by_file.items():
+        init_words |= load_words([path], languages=[Language.ENG], lengths=sizes)
+
+    return {
+        (Language.ENG, word_size): init_words.get((Language.ENG, word_size), set())
+        for word_size in word_sizes
+    }
 
 
 def get_all_english_word(word_size: int) -> List[str]:
-    all_word = []
-    if word_size == 5:
-        filename = "correct5words.csv"
-    else:
-        filename = "words.csv"
-
-    with open(filename) as f:
-        for line in f:
-            line = line.rstrip().replace('"', '').lower()
-            if len(line) == word_size and is_letter_str(line):
-                all_word.append(line)
-
-    return all_word
+    """
+        Distinct words in alphabetical order, not in file order. The file is read by load_words,
+        words with letters outside the English alphabet are skipped
+    """
+    return sorted(get_all_english_words([word_size])[(Language.ENG, word_size)])
 
 
 def measure_time(func):
@@ -1,69 +1,281 @@
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+"""
+    Checks every word against an online dictionary and keeps only the words it knows.
+
+    Every answer is appended to a checkpoint file right away, a rerun skips the words already
+    answered there and retries only the failed ones. The endpoint is a url template with {word},
+    so the run can be pointed at a local stand-in server. Session cookies of the default endpoint
+    come from --cookies or WORDS_FILTER_COOKIES ("name=value; name2=value2").
+
+    python worlds_finder_filter.py --size 5 --concurrency 16 --rate 20 --output-dir filtered
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, TextIO, Tuple
+from urllib.parse import quote
+
+import aiohttp
 from tqdm import tqdm
 
-from util import get_all_english_word
+from util import get_all_english_word, get_words_file
+
+DEFAULT_ENDPOINT = "https://wordfind.org/ajax/find?params%5Bletters%5D={word}&params%5Bdictionary%5D="
+
+CORRECT = "correct"
+INCORRECT = "incorrect"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class FilterConfig:
+    endpoint: str = DEFAULT_ENDPOINT  # url template with {word}
+    concurrency: int = 16  # requests in flight, also the connection pool size
+    rate: float = 20  # requests started per second, 0 for no limit
+    retries: int = 5  # attempts after the first one
+    backoff: float = 0.5  # first retry delay in seconds, doubled every attempt
+    max_backoff: float = 30
+    timeout: float = 10
+    cookies: Dict[str, str] = field(default_factory=dict)
+
+
+class RateLimiter:
+    """
+        Spaces request starts at least 1 / rate seconds apart across all workers
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate if rate > 0 else 0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RetryableError(Exception):
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_answer(word: str, json_res: dict) -> str:
+    """
+        correct, incorrect or "error: ..." for an answer of an unexpected shape, asking again would not help
+    """
+    try:
+        data = json_res.get("data") or {}
+        if not data.get("total_words"):
+            return INCORRECT
+
+        found = any(w["word"] == word for s in data["sections"] for w in s["words"])
+    except (AttributeError, KeyError, TypeError) as e:
+        return f"error: malformed answer: {type(e).__name__}: {e}".replace("\n", " ")
+
+    return CORRECT if found else INCORRECT
+
+
+def _get_retry_after(response: aiohttp.ClientResponse) -> float | None:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def fetch_answer(session: aiohttp.ClientSession, config: FilterConfig, word: str) -> str:
+    url = config.endpoint.format(word=quote(word))
+    async with session.get(url) as response:
+        if response.status in RETRY_STATUSES:
+            raise RetryableError(f"HTTP {response.status}", _get_retry_after(response))
+        response.raise_for_status()
+        return parse_answer(word, await response.json(content_type=None))
+
 
+async def check_word(
+        session: aiohttp.ClientSession,
+        limiter: RateLimiter,
+        config: FilterConfig,
+        word: str,
+) -> str:
+    """
+        correct, incorrect or "error: ..." once every retry failed
+    """
+    for attempt in range(config.retries + 1):
+        await limiter.wait()
+        try:
+            return await fetch_answer(session, config, word)
+        except (RetryableError, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            error = e
 
-def check_word(word):
+        if attempt == config.retries:
+            break
+        delay = min(config.max_backoff, config.backoff * 2 ** attempt) * random.uniform(0.5, 1)  # jitter
+        if isinstance(error, RetryableError) and error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        await asyncio.sleep(delay)
+
+    return f"error: {type(error).__name__}: {error}".replace("\n", " ")
+
+
+def parse_cookies(header: str) -> Dict[str, str]:
+    """
+        "name=value; name2=value2" as a browser sends them
+    """
+    cookies: Dict[str, str] = {}
+    for pair in header.split(";"):
+        name, sep, value = pair.strip().partition("=")
+        if sep and name:
+            cookies[name] = value
+    return cookies
+
+
+def read_checkpoint(path: Path) -> Dict[str, str]:
+    """
+        word -> last answer, a half-written last line of a killed run is ignored
+    """
+    answers: Dict[str, str] = {}
+    if not path.exists():
+        return answers
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            word, sep, result = line.rstrip("\n").partition(",")
+            if sep:
+                answers[word] = result
+    return answers
+
+
+def open_checkpoint(path: Path) -> TextIO:
+    """
+        For appending, a half-written last line of a killed run is cut off first
+    """
+    with open(path, "a+b") as f:
+        f.seek(0)
+        f.truncate(f.read().rfind(b"\n") + 1)
+    return open(path, "a", encoding="utf-8")
+
+
+def _write_line(out: TextIO, line: str) -> None:
+    out.write(line)
+    out.flush()  # a killed run loses at most the requests in flight
+
+
+async def process_words(
+        words_list: Iterable[str],
+        checkpoint: Path,
+        config: FilterConfig,
+) -> Dict[str, str]:
+    answers = await asyncio.to_thread(read_checkpoint, checkpoint)
+    words = [word for word in dict.fromkeys(words_list) if answers.get(word) not in (CORRECT, INCORRECT)]
+
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for word in words:
+        queue.put_nowait(word)
+
+    limiter = RateLimiter(config.rate)
+    connector = aiohttp.TCPConnector(limit=config.concurrency)
+    timeout = aiohttp.ClientTimeout(total=config.timeout)
+
+    # file calls run in a thread one at a time, the event loop never blocks on the disk
+    write_lock = asyncio.Lock()
+    out = await asyncio.to_thread(open_checkpoint, checkpoint)
     try:
-        res = requests.get(
-            url=f"https://wordfind.org/ajax/find?params%5Bletters%5D={word}&params%5Bdictionary%5D=",
-            cookies={
-                "XSRF-TOKEN": "eyJpdiI6InFLdjg2M0ZnbFM0Rk9kc1FNYW5BakE9PSIsInZhbHVlIjoiM3Y5QktGQmxkWG1hRC9aY29tM2VPdFN1RU1ZeU9VWEM2dDhUb3RUTEIxOHM4UDQzMjdrcmxwbTk5dzY5VHB6NXJBcTVWa0l5VElQVmlQZ3hXODZhWnp5bVhXYnFNTXY3Y21VOXFrNG9CZkRtbXpxTlZCbEoxWCs4MkZjYUpHYWIiLCJtYWMiOiIyM2JmYzhjOWEyN2MxYTQzYTEzMWIzMjkxYWNkMjYzYTRiNzkwODAxMzMxOTBhYTFlMzBmM2E0ZDlmYzZkMWU5In0%3D",
-                "httpswordfindorg_session": "yJpdiI6Im9KVkgyMEhFbTRUOWdZSVpLeStKMEE9PSIsInZhbHVlIjoiMUlHb29vRncrOVY1a3ZxbG9rZ3M3ZWZQcFdlZVh0cFNPOU1nQS9QUmE3UkY0WkIvLzJaV213akFKWDNVa1FNUU1PVFpvU04wTGlOSzJRRC9WeXdJQ29EdUNLM2xGdjBzSzd1cGVzWmYwelJPRHVpaDQycjZpME9RcklpN1ZpOWciLCJtYWMiOiI3ODkwNTUxMTFiNWJhZmJhMjRmMzNiM2YxYWE0OTA3MTI4MjRjZGQ0N2Q2NzZlODRkYWJmMTc2MjQ0Njk3OWQ0In0%3D",
-                "hemOytEZ8gyrMsTVEfHX6LErv2KzD4AGyn9W3Mw2": "eyJpdiI6IllTdks1cDMvUWEzNHZaQmhsTG02MUE9PSIsInZhbHVlIjoicUIzYTg1RTRVVGY3dVdUOC9YeUN5MFJFVXVjSU1LTFNzS3N4RWVqRzJqb1dieHA3WDc3SFBQTnVCcUIwenZKcWUzeFpmQmZDbW1KRHBLSU9hdWNRckFiYnh1aXBZTVlTR1NETUxvNENlNlJFQUtSVHQzWUV1NHFtR3VsWUVEM2xGcm5BLzJUb0c4bVJNbzg4bDV6TjJuanJmM3ROMDJHRUUyV3dDUVZkUkxCSkVEUHNGRzkrQ25OVWhlM3Y4N0ZVS1l0UGVpTWtoRWZGbEVHSDdTa2V6OEtWT1dMOEtsa1ZHU2FvNUdpSTVsOVFVVlJqbTR3SHZCTi9qcWROaktmSmk2QTRYR1lNTlZ1K2VFcW9uK0t2SGJJd0puMnJjM2JiaEJycFZmazZqc2kvZm9YVTh2NkM0U0t1MlltVVp1YmlVMEJOY3pSdjhmS1Y2U1dqOFJucU9GNGtPTjlWODdKM0NuT2g1UU9Ncy9ON051QVJtcEtRNGltbmtjUG8xRTI5IiwibWFjIjoiNTdiZWI2ZWQyMTc5ZGNiMDUyMDgxM2E0ZmM4N2E0YTY3NzAwNDIwNWNiOTcyMDJhYzBlMGNiYmM0MDhiNzNhMiJ9",
-                "TOKEN": "eyJpdiI6ImtKaWFyZEl3OThpVkx1aWs0dmlBRXc9PSIsInZhbHVlIjoid0pXcW9YUEpEblhsZ0hsWmRVMHNFc2tHcUJUZ1dqWS94MzRsQ21mZ0Q1UE1pcVFncW52T3lYNHFuTWNFL0pROE0veXFJT3FRNjF0cExyWU5CellQaDY5Y1pkK1g5eGZlOTZ6N01RWXpCbjZsam11bU91em9kaEtNekgvMXIvSk4iLCJtYWMiOiI2YzNmOWU2Y2M3MGFlZmE5MGQyN2FhY2E4OGMyZmYzM2QwMGUxZGQ4NDliNTRiYTEyMTQ4Nzc1NzY5OTc1ZWE0In0%3D; httpswordfindorg_session=eyJpdiI6IkhrQndVVHQ1d3VLN2RLeXIwbkRXTWc9PSIsInZhbHVlIjoiTytxK05XWXhnejV3cGZuUDZ0OGJpcDJNMW9vMnN2SVl5dXpPR0lUaGFPUXBpY3Nnejd0dk9YMTNDWE4zNk5rN2Q3aHc0UWNvZExhNS84Q1NHTURmLzBBWHo4ZFV4ZmdiU2NoeEYrRmpiRzZ0Zm5GOUtlL2I3TmhhVzFSREhBUGEiLCJtYWMiOiJmOWZmN2UzZjhiNTYwMTFmNmVhYjMxMTMxMzZkNmI4ODBmYjBiMjRkMzlkYzQxYWQ4MGM0MDJjNjg4MmQwMzk2In0%3D",
-            },
-            timeout=10
-        )
-        json_res = res.json()
-
-        if not json_res.get('data', {}).get("total_words"):
-            return (word, "incorrect")
-
-        if any(w['word'] == word for s in json_res['data']['sections'] for w in s['words']):
-            return (word, "correct")
-        else:
-            return (word, "incorrect")
-
-    except Exception as e:
-        return (word, f"error: {str(e)}")
-
-
-def process_words(words_list, num_threads=4):
-    incorrect_words = []
-    correct_words = []
-    errors = []
-
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = [executor.submit(check_word, word)
-                   for word in words_list]
-
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Processing words"):
-            word, result = future.result()
-            if result == "correct":
-                correct_words.append(word)
-            elif result == "incorrect":
-                incorrect_words.append(word)
-            else:
-                errors.append((word, result))
-
-    print("\nDone!")
+        with tqdm(total=len(words), desc="Processing words") as progress:
+            async def worker(session: aiohttp.ClientSession) -> None:
+                while not queue.empty():
+                    word = queue.get_nowait()
+                    result = await check_word(session, limiter, config, word)
+                    answers[word] = result
+                    async with write_lock:
+                        await asyncio.to_thread(_write_line, out, f"{word},{result}\n")
+                    progress.update()
+
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, cookies=config.cookies) as session:
+                await asyncio.gather(*(worker(session) for _ in range(min(config.concurrency, len(words)) or 1)))
+    finally:
+        await asyncio.to_thread(out.close)
+
+    return answers
+
+
+def split_answers(answers: Dict[str, str]) -> Tuple[List[str], List[str], List[Tuple[str, str]]]:
+    correct_words = sorted(word for word, result in answers.items() if result == CORRECT)
+    incorrect_words = sorted(word for word, result in answers.items() if result == INCORRECT)
+    errors = sorted((word, result) for word, result in answers.items() if result not in (CORRECT, INCORRECT))
     return correct_words, incorrect_words, errors
 
 
-words_to_check = get_all_english_word(5)
-correct, incorrect, errors = process_words(words_to_check)
+def write_words(path: Path, words: Iterable[str]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for word in words:
+            f.write(word)
+            f.write("\n")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5)
+    parser.add_argument("--words", type=Path, help="words to check, one per line, default is the util word list")
+    parser.add_argument("--output-dir", type=Path, default=Path("filtered"))
+    parser.add_argument("--endpoint", default=os.environ.get("WORDS_FILTER_ENDPOINT", DEFAULT_ENDPOINT))
+    parser.add_argument(
+        "--cookies",
+        default=os.environ.get("WORDS_FILTER_COOKIES", ""),
+        help='session cookies of the endpoint, "name=value; name2=value2"',
+    )
+    parser.add_argument("--concurrency", type=int, default=FilterConfig.concurrency)
+    parser.add_argument("--rate", type=float, default=FilterConfig.rate)
+    parser.add_argument("--retries", type=int, default=FilterConfig.retries)
+    parser.add_argument("--backoff", type=float, default=FilterConfig.backoff)
+    parser.add_argument("--timeout", type=float, default=FilterConfig.timeout)
+    args = parser.parse_args(argv)
+
+    words_path = args.words or get_words_file(args.size)
+    correct_path = args.output_dir / f"correct{args.size}words.csv"
+    incorrect_path = args.output_dir / f"incorrect{args.size}words.csv"
+    if words_path.resolve() in (correct_path.resolve(), incorrect_path.resolve()):
+        parser.error(f"{words_path} would be overwritten by the results, choose another --output-dir")
+
+    if args.words:
+        with open(args.words, encoding="utf-8") as f:
+            words_to_check = [line.strip() for line in f if line.strip()]
+    else:
+        words_to_check = get_all_english_word(args.size)
+
+    config = FilterConfig(
+        endpoint=args.endpoint,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        retries=args.retries,
+        backoff=args.backoff,
+        timeout=args.timeout,
+        cookies=parse_cookies(args.cookies),
+    )
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    answers = asyncio.run(process_words(words_to_check, args.output_dir / f"checked{args.size}words.csv", config))
+
+    # answers of earlier runs for words no longer in the list are left out
+    correct, incorrect, errors = split_answers({word: answers[word] for word in words_to_check})
+    print(f"\nResults: Correct: {len(correct)}, Incorrect: {len(incorrect)}, Errors: {len(errors)}")
 
-print(f"\nResults: Correct: {len(correct)}, Incorrect: {len(incorrect)}, Errors: {len(errors)}")
+    write_words(correct_path, correct)
+    write_words(incorrect_path, incorrect)
+    return 0 if not errors else 1
 
-with open("correct5words.csv", 'w') as f:
-    for word in correct:
-        f.write(word)
-        f.write("\n")
 
-with open("incorrect5words.csv", 'w') as f:
-    for word in incorrect:
-        f.write(word)
-        f.write("\n")
+if __name__ == "__main__":
+    sys.exit(main())